@@ -0,0 +1,62 @@
+"""Keep sentiment of archived meetings
+
+Revision ID: 4e6b1a9c2d83
+Revises: d58b0e3f9a47
+Create Date: 2025-05-23 15:02:41.377120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e6b1a9c2d83'
+down_revision: Union[str, None] = 'd58b0e3f9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The foreign key was created without a name. PostgreSQL names it
+# <table>_<column>_fkey; on SQLite batch mode finds it through this
+# naming convention.
+POSTGRES_FK_NAME = 'meeting_sentiments_meeting_log_id_fkey'
+SQLITE_NAMING_CONVENTION = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+SQLITE_FK_NAME = 'fk_meeting_sentiments_meeting_log_id_meeting_logs'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Scores of archived meetings stay so the aggregates keep counting them
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table(
+            'meeting_sentiments', naming_convention=SQLITE_NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(SQLITE_FK_NAME, type_='foreignkey')
+    else:
+        op.drop_constraint(POSTGRES_FK_NAME, 'meeting_sentiments', type_='foreignkey')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        sa.text(
+            'DELETE FROM meeting_sentiments WHERE meeting_log_id NOT IN '
+            '(SELECT id FROM meeting_logs)'
+        )
+    )
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table(
+            'meeting_sentiments', naming_convention=SQLITE_NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.create_foreign_key(
+                SQLITE_FK_NAME, 'meeting_logs', ['meeting_log_id'], ['id'],
+                ondelete='CASCADE',
+            )
+    else:
+        op.create_foreign_key(
+            POSTGRES_FK_NAME, 'meeting_sentiments', 'meeting_logs',
+            ['meeting_log_id'], ['id'], ondelete='CASCADE',
+        )
@@ -0,0 +1,37 @@
+"""Add numeric key result values
+
+Revision ID: 8f2a6c1d9b3e
+Revises: 5731bcd6649b
+Create Date: 2025-05-12 10:24:37.512908
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2a6c1d9b3e'
+down_revision: Union[str, None] = '5731bcd6649b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('key_results', sa.Column('target_numeric', sa.Float(), nullable=True))
+    op.add_column('key_results', sa.Column('current_numeric', sa.Float(), nullable=True))
+    op.create_index('ix_key_results_objective_id_deadline', 'key_results', ['objective_id', 'deadline'], unique=False)
+    op.create_index('ix_key_results_status', 'key_results', ['status'], unique=False)
+    op.create_index(op.f('ix_objectives_team_member_id'), 'objectives', ['team_member_id'], unique=False)
+    # Existing rows are populated with: python -m app.cli backfill-kr-values
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_objectives_team_member_id'), table_name='objectives')
+    op.drop_index('ix_key_results_status', table_name='key_results')
+    op.drop_index('ix_key_results_objective_id_deadline', table_name='key_results')
+    op.drop_column('key_results', 'current_numeric')
+    op.drop_column('key_results', 'target_numeric')
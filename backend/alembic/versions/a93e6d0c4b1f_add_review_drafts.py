@@ -0,0 +1,63 @@
+"""Add review drafts
+
+Revision ID: a93e6d0c4b1f
+Revises: f1c28d4b6e07
+Create Date: 2025-05-22 10:12:41.551203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93e6d0c4b1f'
+down_revision: Union[str, None] = 'f1c28d4b6e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('review_drafts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('team_member_id', sa.Integer(), nullable=False),
+    sa.Column('requested_by_user_id', sa.Integer(), nullable=True),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('period_end', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('stage', sa.String(), nullable=True),
+    sa.Column('progress', sa.Float(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['requested_by_user_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['team_member_id'], ['team_members.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_review_drafts_id'), 'review_drafts', ['id'], unique=False)
+    op.create_index('ix_review_drafts_team_member_id_created_at', 'review_drafts', ['team_member_id', 'created_at'], unique=False)
+    op.create_table('review_digests',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('team_member_id', sa.Integer(), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('source_hash', sa.String(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('token_count', sa.Integer(), nullable=False),
+    sa.Column('summarized', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['team_member_id'], ['team_members.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_review_digests_team_member_id_period_start', 'review_digests', ['team_member_id', 'period_start'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_review_digests_team_member_id_period_start', table_name='review_digests')
+    op.drop_table('review_digests')
+    op.drop_index('ix_review_drafts_team_member_id_created_at', table_name='review_drafts')
+    op.drop_index(op.f('ix_review_drafts_id'), table_name='review_drafts')
+    op.drop_table('review_drafts')
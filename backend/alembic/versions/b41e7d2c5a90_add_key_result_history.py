@@ -0,0 +1,43 @@
+"""Add key result history
+
+Revision ID: b41e7d2c5a90
+Revises: 8f2a6c1d9b3e
+Create Date: 2025-05-13 09:02:11.274615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7d2c5a90'
+down_revision: Union[str, None] = '8f2a6c1d9b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('key_result_history',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key_result_id', sa.Integer(), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['key_result_id'], ['key_results.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_key_result_history_key_result_id_recorded_at', 'key_result_history', ['key_result_id', 'recorded_at'], unique=False)
+    # Seed the history with the current state of every KR
+    op.execute(
+        "INSERT INTO key_result_history (key_result_id, recorded_at, value, status) "
+        "SELECT id, COALESCE(updated_at, CURRENT_TIMESTAMP), current_numeric, status FROM key_results"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_key_result_history_key_result_id_recorded_at', table_name='key_result_history')
+    op.drop_table('key_result_history')
@@ -0,0 +1,55 @@
+"""Add meeting sentiment
+
+Revision ID: c2f7a81e5d36
+Revises: a93e6d0c4b1f
+Create Date: 2025-05-22 16:40:07.218934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f7a81e5d36'
+down_revision: Union[str, None] = 'a93e6d0c4b1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('meeting_sentiments',
+    sa.Column('meeting_log_id', sa.Integer(), nullable=False),
+    sa.Column('team_member_id', sa.Integer(), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=True),
+    sa.Column('positive', sa.Integer(), nullable=False),
+    sa.Column('negative', sa.Integer(), nullable=False),
+    sa.Column('provider', sa.String(), nullable=False),
+    sa.Column('scored_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['meeting_log_id'], ['meeting_logs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('meeting_log_id')
+    )
+    op.create_index('ix_meeting_sentiments_team_member_id_period_start', 'meeting_sentiments', ['team_member_id', 'period_start'], unique=False)
+    op.create_table('sentiment_aggregates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('team_member_id', sa.Integer(), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('meeting_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('positive', sa.Integer(), nullable=False),
+    sa.Column('negative', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['team_member_id'], ['team_members.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_sentiment_aggregates_team_member_id_period_start', 'sentiment_aggregates', ['team_member_id', 'period_start'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sentiment_aggregates_team_member_id_period_start', table_name='sentiment_aggregates')
+    op.drop_table('sentiment_aggregates')
+    op.drop_index('ix_meeting_sentiments_team_member_id_period_start', table_name='meeting_sentiments')
+    op.drop_table('meeting_sentiments')
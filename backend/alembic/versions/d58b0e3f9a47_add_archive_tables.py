@@ -0,0 +1,63 @@
+"""Add archive tables
+
+Revision ID: d58b0e3f9a47
+Revises: c2f7a81e5d36
+Create Date: 2025-05-23 09:27:53.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd58b0e3f9a47'
+down_revision: Union[str, None] = 'c2f7a81e5d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('meeting_logs_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('team_member_id', sa.Integer(), nullable=False),
+    sa.Column('manager_id', sa.Integer(), nullable=False),
+    sa.Column('meeting_date', sa.DateTime(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('notes_structured', sa.Text(), nullable=True),
+    sa.Column('ai_summary', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_meeting_logs_archive_team_member_id_meeting_date', 'meeting_logs_archive', ['team_member_id', 'meeting_date'], unique=False)
+    op.create_table('action_items_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('assigned_to_member_id', sa.Integer(), nullable=True),
+    sa.Column('assigned_by_manager_id', sa.Integer(), nullable=True),
+    sa.Column('meeting_log_id', sa.Integer(), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('priority', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_action_items_archive_assignee_status_due_date', 'action_items_archive', ['assigned_to_member_id', 'status', 'due_date'], unique=False)
+    op.create_index('ix_action_items_archive_assignee_updated_at', 'action_items_archive', ['assigned_to_member_id', 'updated_at'], unique=False)
+    op.create_index('ix_action_items_archive_meeting_log_id', 'action_items_archive', ['meeting_log_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_action_items_archive_meeting_log_id', table_name='action_items_archive')
+    op.drop_index('ix_action_items_archive_assignee_updated_at', table_name='action_items_archive')
+    op.drop_index('ix_action_items_archive_assignee_status_due_date', table_name='action_items_archive')
+    op.drop_table('action_items_archive')
+    op.drop_index('ix_meeting_logs_archive_team_member_id_meeting_date', table_name='meeting_logs_archive')
+    op.drop_table('meeting_logs_archive')
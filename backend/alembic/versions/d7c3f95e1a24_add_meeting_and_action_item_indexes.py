@@ -0,0 +1,32 @@
+"""Add meeting log and action item range indexes
+
+Revision ID: d7c3f95e1a24
+Revises: b41e7d2c5a90
+Create Date: 2025-05-14 16:40:52.118390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7c3f95e1a24'
+down_revision: Union[str, None] = 'b41e7d2c5a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_meeting_logs_team_member_id_meeting_date', 'meeting_logs', ['team_member_id', 'meeting_date'], unique=False)
+    op.create_index('ix_action_items_assignee_status_due_date', 'action_items', ['assigned_to_member_id', 'status', 'due_date'], unique=False)
+    op.create_index('ix_action_items_meeting_log_id', 'action_items', ['meeting_log_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_action_items_meeting_log_id', table_name='action_items')
+    op.drop_index('ix_action_items_assignee_status_due_date', table_name='action_items')
+    op.drop_index('ix_meeting_logs_team_member_id_meeting_date', table_name='meeting_logs')
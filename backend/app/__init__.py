@@ -1,3 +1,7 @@
 # app/__init__.py
 
-# This file is intentionally left empty to mark the app directory as a package.
+import time
+
+# Runs before any app module is imported, so the cold start logged by
+# app.main covers the import of the whole application
+IMPORT_STARTED = time.perf_counter()
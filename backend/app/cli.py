@@ -0,0 +1,189 @@
+"""
+Maintenance commands for the backend.
+
+Usage:
+    python -m app.cli <command> [options]
+"""
+import argparse
+import asyncio
+from pathlib import Path
+
+from sqlalchemy import inspect
+
+from app import crud
+from app.database import AsyncSessionLocal, engine
+from app.models import Base
+from app.services import archive
+from app.services import backup as backup_service
+from app.services import sentiment
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+async def _run_sync(fn, *args, **kwargs):
+    # The CRUD layer is written against the synchronous Session API, so run
+    # it on the async session's underlying connection.
+    async with AsyncSessionLocal() as session:
+        return await session.run_sync(fn, *args, **kwargs)
+
+
+async def _create_tables() -> bool:
+    async with engine.begin() as conn:
+        has_alembic_table = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table("alembic_version")
+        )
+        if has_alembic_table:
+            return False
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+    return True
+
+
+def init_db(args):
+    # The early migrations predate most tables, so a new database is created
+    # from the models and stamped with the head revision
+    from alembic import command
+    from alembic.config import Config
+
+    if not asyncio.run(_create_tables()):
+        print(
+            "Database is already managed by Alembic, "
+            "run `alembic upgrade head` instead"
+        )
+        return
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    command.stamp(config, "head")
+    print("Created tables and stamped the database with the head revision")
+
+
+def backfill_kr_values(args):
+    updated = asyncio.run(
+        _run_sync(crud.backfill_key_result_numeric, batch_size=args.batch_size)
+    )
+    print(f"Backfilled numeric values for {updated} key results")
+
+
+def compact_kr_history(args):
+    deleted = asyncio.run(_run_sync(crud.compact_key_result_history))
+    print(f"Removed {deleted} downsampled key result history rows")
+
+
+def rotate_encryption_keys(args):
+    rotated = asyncio.run(
+        _run_sync(crud.rotate_encrypted_columns, batch_size=args.batch_size)
+    )
+    print(f"Re-encrypted {rotated} rows with the current key")
+
+
+async def _score_all(batch_size: int) -> int:
+    total = 0
+    while True:
+        scored = await _run_sync(sentiment.score_pending, batch_size=batch_size)
+        total += scored
+        if scored < batch_size:
+            return total
+
+
+def score_sentiment(args):
+    scored = asyncio.run(_score_all(args.batch_size))
+    print(f"Scored {scored} meeting logs")
+
+
+def archive_rows(args):
+    moved = asyncio.run(
+        archive.archive_all(AsyncSessionLocal, batch_size=args.batch_size)
+    )
+    print(f"Archived {moved} meeting logs and action items")
+
+
+def backup_db(args):
+    result = backup_service.backup(args.dest, keep=args.keep)
+    print(
+        f"Backed up to {result.path} ({result.size_bytes / 1_048_576:.1f} MB "
+        f"in {result.seconds:.1f} s, {result.megabytes_per_second:.1f} MB/s)"
+    )
+
+
+def restore_db(args):
+    if not args.yes:
+        answer = input(
+            f"Overwrite {backup_service.database_path()} with {args.path}? [y/N] "
+        )
+        if answer.strip().lower() != "y":
+            print("Aborted")
+            return
+    result = backup_service.restore(args.path)
+    print(f"Restored from {result.path} in {result.seconds:.1f} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    init = subparsers.add_parser(
+        "init-db",
+        help="Create the tables of a new database and stamp it with the migration head",
+    )
+    init.set_defaults(func=init_db)
+
+    backfill = subparsers.add_parser(
+        "backfill-kr-values",
+        help="Parse raw key result values into the numeric columns",
+    )
+    backfill.add_argument("--batch-size", type=int, default=500)
+    backfill.set_defaults(func=backfill_kr_values)
+
+    compact = subparsers.add_parser(
+        "compact-kr-history",
+        help="Downsample old key result history according to the retention policy",
+    )
+    compact.set_defaults(func=compact_kr_history)
+
+    rotate = subparsers.add_parser(
+        "rotate-encryption-keys",
+        help="Re-encrypt encrypted columns with the current key",
+    )
+    rotate.add_argument("--batch-size", type=int, default=200)
+    rotate.set_defaults(func=rotate_encryption_keys)
+
+    score = subparsers.add_parser(
+        "score-sentiment",
+        help="Score all meeting notes not scored yet (experimental, FR7.5)",
+    )
+    score.add_argument("--batch-size", type=int, default=500)
+    score.set_defaults(func=score_sentiment)
+
+    archive_parser = subparsers.add_parser(
+        "archive",
+        help="Move closed action items and old meeting logs to the archive tables",
+    )
+    archive_parser.add_argument("--batch-size", type=int, default=500)
+    archive_parser.set_defaults(func=archive_rows)
+
+    backup = subparsers.add_parser(
+        "backup-db",
+        help="Take a verified online backup of the SQLite database",
+    )
+    backup.add_argument("--dest", help="Backup directory, defaults to BACKUP_DIR")
+    backup.add_argument(
+        "--keep", type=int, help="Backups to keep, defaults to BACKUP_KEEP"
+    )
+    backup.set_defaults(func=backup_db)
+
+    restore = subparsers.add_parser(
+        "restore-db",
+        help="Verify a backup and restore it over the SQLite database",
+    )
+    restore.add_argument("path", help="Backup file to restore")
+    restore.add_argument(
+        "--yes", action="store_true", help="Do not ask for confirmation"
+    )
+    restore.set_defaults(func=restore_db)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
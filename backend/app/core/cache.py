@@ -0,0 +1,243 @@
+"""
+In-process caches with cross-worker invalidation.
+
+A `CacheRegion` declares the tables its entries are derived from. Whenever a
+transaction writes to one of those tables:
+
+- the worker that wrote drops the affected regions right after commit, and
+- the write bumps a per-table counter in `cache_versions` inside the same
+  transaction. Every worker polls the counters (for SQLite only after the
+  cheap `PRAGMA data_version` reports a commit from another connection) and
+  drops the regions of tables whose counter moved.
+
+This keeps uvicorn workers sharing one database from serving stale data
+without an external message broker.
+
+Every clear bumps the region's generation. `get_or_set` only stores what its
+loader returned if the region was not cleared while the loader ran, so a load
+that read the database before a concurrent write cannot put the old value
+back after the write invalidated it.
+
+Entries are kept in process memory in plain text: regions must not cache
+decrypted private fields such as the manager notes.
+"""
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.database import JOINED_TRANSACTION_KEY
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_TABLES_KEY = "cache_written_tables"
+_SELECT_VERSIONS = "SELECT table_name, version FROM cache_versions"
+
+_regions: Dict[str, "CacheRegion"] = {}
+
+
+class CacheRegion:
+    def __init__(self, name: str, tables: Iterable[str], ttl: Optional[float] = 300,
+                 max_entries: int = 10_000):
+        self.name = name
+        self.tables = frozenset(tables)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+        _regions[name] = self
+
+    def get(self, key: Hashable, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value, generation: Optional[int] = None):
+        """Store value; with `generation`, only if not cleared since then."""
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[key] = (value, expires_at)
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], object]):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            generation = self.generation
+            value = loader()
+            self.set(key, value, generation)
+        return value
+
+    async def get_or_set_async(self, key: Hashable,
+                               loader: Callable[[], Awaitable[object]]):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            generation = self.generation
+            value = await loader()
+            self.set(key, value, generation)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+def watched_tables() -> Set[str]:
+    return {table for region in _regions.values() for table in region.tables}
+
+
+def invalidate_tables(tables: Iterable[str]):
+    tables = set(tables)
+    for region in _regions.values():
+        if region.tables & tables:
+            region.clear()
+
+
+# Tracking writes
+def _remember(session: Session, tables: Iterable[str]):
+    tables = set(tables) & watched_tables()
+    if not tables:
+        return
+    pending = session.info.setdefault(_TABLES_KEY, set())
+    new_tables = tables - pending
+    if new_tables:
+        pending |= new_tables
+        _bump(session, new_tables)
+
+
+def _bump(session: Session, tables: Set[str]):
+    # Bumped in the writing transaction so other workers only see the new
+    # version once the data itself is committed
+    connection = session.connection()
+    for table in sorted(tables):
+        connection.execute(
+            text(
+                "INSERT INTO cache_versions (table_name, version) VALUES (:table, 1) "
+                "ON CONFLICT (table_name) "
+                "DO UPDATE SET version = cache_versions.version + 1"
+            ),
+            {"table": table},
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    tables = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if hasattr(obj, "__table__")
+    }
+    _remember(session, tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state):
+    # Bulk UPDATE/DELETE statements bypass the flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _remember(orm_execute_state.session, {table.name})
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    if session.info.get(JOINED_TRANSACTION_KEY):
+        # Not final yet, the owner calls invalidate_committed
+        return
+    invalidate_committed(session)
+
+
+def invalidate_committed(session: Session):
+    """Drop the regions of the tables written by the committed transaction."""
+    tables = session.info.pop(_TABLES_KEY, None)
+    if tables:
+        invalidate_tables(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(_TABLES_KEY, None)
+
+
+class InvalidationPoller:
+    """
+    Drops regions whose tables were written by other workers.
+
+    On SQLite the version table is only read after `PRAGMA data_version`
+    reports a commit from another connection; on server databases the small
+    version table is read on every poll.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._versions: Optional[Dict[str, int]] = None
+        self._data_version: Optional[int] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _apply(self, versions: Dict[str, int]):
+        if self._versions is not None:
+            changed = {
+                table for table, version in versions.items()
+                if self._versions.get(table) != version
+            }
+            if changed:
+                invalidate_tables(changed)
+        self._versions = versions
+
+    def _sqlite_connection(self, path: str) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+        return self._conn
+
+    def poll_sqlite(self, path: str):
+        conn = self._sqlite_connection(path)
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+
+        try:
+            versions = dict(conn.execute(_SELECT_VERSIONS))
+        except sqlite3.OperationalError:
+            # Table not created yet
+            return
+        self._apply(versions)
+
+    async def poll_engine(self, engine):
+        async with engine.connect() as conn:
+            result = await conn.execute(text(_SELECT_VERSIONS))
+            self._apply(dict(result.all()))
+
+    async def run(self, engine):
+        sqlite_path = engine.url.database if engine.dialect.name == "sqlite" else None
+        while True:
+            try:
+                if sqlite_path:
+                    await asyncio.to_thread(self.poll_sqlite, sqlite_path)
+                else:
+                    await self.poll_engine(engine)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation poll failed")
+            await asyncio.sleep(self.interval)
+
+
+poller = InvalidationPoller(settings.CACHE_POLL_INTERVAL_SECONDS)
@@ -0,0 +1,132 @@
+"""
+Field-level encryption at rest.
+
+Sensitive text columns use the `EncryptedText` type, which stores values as
+AES-GCM ciphertext tagged with the id of the key that produced them:
+
+    enc:v1:<key_id>:<base64(nonce + ciphertext)>
+
+Keys are configured in FIELD_ENCRYPTION_KEYS as comma separated
+`<key_id>:<secret>` pairs, the first one being used for new writes. The
+256-bit AES keys are derived once per key id with HKDF and cached.
+Values without the prefix are legacy plaintext and are returned unchanged
+until `rotate-encryption-keys` re-encrypts them.
+"""
+import base64
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from sqlalchemy.types import Text, TypeDecorator
+
+from .config import settings
+
+PREFIX = "enc:v1:"
+NONCE_SIZE = 12
+_SALT = b"aiphb-field-encryption"
+
+
+class DecryptionError(ValueError):
+    pass
+
+
+@lru_cache()
+def _keyring() -> Tuple[str, Dict[str, str]]:
+    keys = {}
+    current = None
+    for entry in settings.FIELD_ENCRYPTION_KEYS.split(","):
+        key_id, sep, secret = entry.strip().partition(":")
+        if not sep or not key_id or not secret:
+            continue
+        keys[key_id] = secret
+        current = current or key_id
+    if current is None:
+        # Development fallback, production deployments set FIELD_ENCRYPTION_KEYS
+        current = "default"
+        keys[current] = settings.SECRET_KEY
+    return current, keys
+
+
+@lru_cache()
+def _cipher(key_id: str) -> AESGCM:
+    _, keys = _keyring()
+    if key_id not in keys:
+        raise DecryptionError(f"Unknown encryption key id: {key_id}")
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=_SALT,
+        info=key_id.encode(),
+    ).derive(keys[key_id].encode())
+    return AESGCM(key)
+
+
+def current_key_id() -> str:
+    return _keyring()[0]
+
+
+def is_encrypted(value: Optional[str]) -> bool:
+    return value is not None and value.startswith(PREFIX)
+
+
+def key_id_of(value: str) -> Optional[str]:
+    if not is_encrypted(value):
+        return None
+    return value[len(PREFIX):].split(":", 1)[0]
+
+
+def needs_rotation(value: Optional[str]) -> bool:
+    """True for legacy plaintext and values encrypted with a non-current key."""
+    if value is None:
+        return False
+    return key_id_of(value) != current_key_id()
+
+
+def encrypt(plaintext: str) -> str:
+    key_id = current_key_id()
+    nonce = os.urandom(NONCE_SIZE)
+    ciphertext = _cipher(key_id).encrypt(
+        nonce, plaintext.encode("utf-8"), key_id.encode()
+    )
+    return f"{PREFIX}{key_id}:{base64.b64encode(nonce + ciphertext).decode()}"
+
+
+def decrypt(value: str) -> str:
+    if not is_encrypted(value):
+        return value
+    key_id, _, payload = value[len(PREFIX):].partition(":")
+    try:
+        raw = base64.b64decode(payload)
+        plaintext = _cipher(key_id).decrypt(
+            raw[:NONCE_SIZE], raw[NONCE_SIZE:], key_id.encode()
+        )
+    except (InvalidTag, ValueError) as exc:
+        raise DecryptionError(
+            f"Could not decrypt value encrypted with key {key_id}"
+        ) from exc
+    return plaintext.decode("utf-8")
+
+
+class EncryptedText(TypeDecorator):
+    """
+    Text column encrypted with AES-GCM.
+
+    Decryption runs when the value is loaded; map the column with
+    `deferred()` so queries that do not need it never load or decrypt it.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return encrypt(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decrypt(value)
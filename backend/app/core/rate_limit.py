@@ -0,0 +1,260 @@
+"""
+Token bucket rate limiting.
+
+Limits are written as "<count>/<period>", e.g. "10/minute": a bucket holds
+up to `count` tokens and refills at `count` per period, so short bursts are
+allowed while the sustained rate is capped.
+
+Buckets live in a bounded in-memory LRU by default and are dropped once
+they have refilled. With several uvicorn workers set RATE_LIMIT_STORAGE=sqlite
+so all workers share one bucket table in a small SQLite file next to the
+database.
+"""
+import json
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+
+from .config import settings
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def parse_limit(limit: str) -> Tuple[int, int]:
+    """Parse "10/minute" into (10, 60)."""
+    count, _, period = limit.partition("/")
+    return int(count), PERIODS[period.strip().rstrip("s")]
+
+
+def _refill(tokens: float, updated_at: float, now: float, capacity: int, period: int):
+    return min(capacity, tokens + (now - updated_at) * capacity / period)
+
+
+def _take(tokens: float, capacity: int, period: int):
+    """Return (allowed, tokens left, seconds until a token is available)."""
+    if tokens >= 1:
+        return True, tokens - 1, 0.0
+    return False, tokens, (1 - tokens) * period / capacity
+
+
+class MemoryStore:
+    """
+    Buckets in an LRU dict; O(1) amortized per hit and at most `max_keys`
+    entries. Buckets that have refilled are dropped, starting from the least
+    recently used ones, so idle clients do not hold memory until eviction.
+    """
+    blocking = False
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at, full_at)
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, capacity: int, period: int) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.pop(key, (capacity, now, now))
+            tokens = _refill(tokens, updated_at, now, capacity, period)
+            allowed, tokens, retry_after = _take(tokens, capacity, period)
+            full_at = now + (capacity - tokens) * period / capacity
+            self._buckets[key] = (tokens, now, full_at)
+            self._expire(now)
+            # Evicting the least recently used key only forgets a bucket,
+            # which can at worst grant that client a fresh burst
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, retry_after
+
+    def _expire(self, now: float):
+        # A full bucket is the same as no bucket. Only the oldest entries are
+        # checked; a refilled one behind a live one waits for a later hit
+        while self._buckets:
+            _, (_, _, full_at) = next(iter(self._buckets.items()))
+            if full_at > now:
+                break
+            self._buckets.popitem(last=False)
+
+
+class SQLiteStore:
+    """Buckets shared by all workers through a SQLite table."""
+    blocking = True
+
+    # Rows untouched for this long are full buckets again and can be dropped
+    EXPIRE_SECONDS = 86400
+    PURGE_EVERY = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._hits = 0
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key: str, capacity: int, period: int) -> Tuple[bool, float]:
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                tokens = capacity
+            else:
+                tokens = _refill(row[0], row[1], now, capacity, period)
+            allowed, tokens, retry_after = _take(tokens, capacity, period)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated_at) "
+                "VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            self._hits += 1
+            if self._hits % self.PURGE_EVERY == 0:
+                conn.execute(
+                    "DELETE FROM rate_limit_buckets WHERE updated_at < ?",
+                    (now - self.EXPIRE_SECONDS,),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, retry_after
+
+
+def _create_store():
+    if settings.RATE_LIMIT_STORAGE == "sqlite":
+        return SQLiteStore(settings.RATE_LIMIT_SQLITE_PATH)
+    return MemoryStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+_store = None
+
+
+def get_store():
+    global _store
+    if _store is None:
+        _store = _create_store()
+    return _store
+
+
+async def hit(key: str, limit: str) -> Tuple[bool, float]:
+    capacity, period = parse_limit(limit)
+    store = get_store()
+    if store.blocking:
+        return await run_in_threadpool(store.hit, key, capacity, period)
+    return store.hit(key, capacity, period)
+
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("X-Forwarded-For")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many_requests(retry_after: float):
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, try again later",
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+class RateLimit:
+    """
+    Route dependency limiting requests per client IP and, when
+    `account_field` is set, per account named in the form or JSON body.
+
+        @router.post("/login", dependencies=[Depends(RateLimit("login", ...))])
+    """
+
+    def __init__(self, scope: str, ip_limit: str, account_limit: Optional[str] = None,
+                 account_field: str = "email"):
+        self.scope = scope
+        self.ip_limit = ip_limit
+        self.account_limit = account_limit
+        self.account_field = account_field
+
+    async def _account(self, request: Request) -> Optional[str]:
+        if request.headers.get("content-type", "").startswith("application/json"):
+            try:
+                body = json.loads(await request.body() or b"{}")
+            except ValueError:
+                return None
+            value = body.get(self.account_field) if isinstance(body, dict) else None
+        else:
+            value = (await request.form()).get(self.account_field)
+        return str(value).strip().lower() if value else None
+
+    async def __call__(self, request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        allowed, retry_after = await hit(
+            f"{self.scope}:ip:{client_ip(request)}", self.ip_limit
+        )
+        if not allowed:
+            raise _too_many_requests(retry_after)
+
+        if self.account_limit:
+            account = await self._account(request)
+            if account:
+                allowed, retry_after = await hit(
+                    f"{self.scope}:account:{account}", self.account_limit
+                )
+                if not allowed:
+                    raise _too_many_requests(retry_after)
+
+
+class RateLimitMiddleware:
+    """Per-IP limit on all write requests (POST, PUT, PATCH, DELETE)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in WRITE_METHODS
+            or not settings.RATE_LIMIT_ENABLED
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        allowed, retry_after = await hit(
+            f"writes:ip:{client_ip(request)}", settings.RATE_LIMIT_WRITES
+        )
+        if not allowed:
+            response = JSONResponse(
+                {"detail": "Too many requests, try again later"},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
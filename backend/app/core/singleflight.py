@@ -0,0 +1,86 @@
+"""
+Coalescing of concurrent identical computations ("single flight").
+
+When several requests need the same expensive result at the same time, the
+first one computes it and the others wait for that computation and share its
+result (or its exception) instead of running the same queries again.
+
+A `SingleFlight` is declared per route or computation, and its keys must
+contain everything the result depends on: the normalized parameters and the
+authorization scope of the caller, so callers never receive a result they
+could not have computed themselves. Shared results are handed to several
+requests, so they must not be modified.
+
+Combined with a `CacheRegion`, only one caller per worker runs the loader
+when an entry is missing or has just been invalidated.
+
+Callers wait on the event loop: the computation is a coroutine function, and
+only the first caller awaits it. If that caller is cancelled, e.g. because
+its client disconnected, one of the waiting callers runs the computation
+instead; cancellation never reaches callers that were not cancelled.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable
+
+_groups: Dict[str, "SingleFlight"] = {}
+
+
+class _LeaderCancelled(Exception):
+    """The caller running a shared computation was cancelled."""
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        _groups[name] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[object]]):
+        """Return await fn(), sharing one execution with concurrent callers of `key`."""
+        while True:
+            call = self._calls.get(key)
+            if call is None:
+                return await self._lead(key, fn)
+            self.coalesced += 1
+            try:
+                # Shielded so a cancelled waiter does not cancel the shared result
+                return await asyncio.shield(call)
+            except _LeaderCancelled:
+                # The first waiter to get here runs fn itself, the others
+                # wait for it
+                continue
+
+    async def _lead(self, key: Hashable, fn: Callable[[], Awaitable[object]]):
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.executed += 1
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            # Only the leader was cancelled, not the callers waiting for it
+            call.set_exception(_LeaderCancelled())
+            call.exception()
+            raise
+        except BaseException as exc:
+            call.set_exception(exc)
+            # Retrieved so an unshared failure is not logged as never retrieved
+            call.exception()
+            raise
+        else:
+            call.set_result(value)
+            return value
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+
+def stats():
+    return [group.stats() for group in _groups.values()]
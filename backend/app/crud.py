@@ -1,43 +1,44 @@
-from sqlalchemy.future import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from datetime import datetime, timedelta
+from sqlalchemy.orm import (
+    Session, joinedload, load_only, selectinload, undefer, undefer_group
+)
+from sqlalchemy import (
+    func, case, and_, or_, tuple_, type_coerce, literal, true, Text, delete, exists,
+    insert, select as core_select,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from app.models import User
+from app.core import encryption
+from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
+from app.services.key_result_values import parse_value, parse_target
+from app.sql_functions import date_bucket, julian_day, text_search
+from app.services import audit, notes_parser
+from app.services.events import publish_change
 from . import models, schemas
 
 
-async def get_user_by_email(db: AsyncSession, email: str):
-    result = await db.execute(select(User).where(User.email == email))
-    return result.scalars().first()
-
-
-async def create_user(db: AsyncSession, email: str, password: str):
-    hashed_password = get_password_hash(password)
-    user = User(email=email, hashed_password=hashed_password)
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-    return user
-
-
-async def authenticate_user(db: AsyncSession, email: str, password: str):
-    user = await get_user_by_email(db, email)
-    if not user or not verify_password(password, user.hashed_password):
-        return None
-    return user
+def _superior_ids(db: Session, team_member_ids):
+    team_member_ids = {
+        member_id for member_id in team_member_ids if member_id is not None
+    }
+    if not team_member_ids:
+        return {}
+    rows = (
+        db.query(models.TeamMember.id, models.TeamMember.superior_id)
+        .filter(models.TeamMember.id.in_(team_member_ids))
+        .all()
+    )
+    return dict(rows)
 
 
-async def update_password(db: AsyncSession, email: str, new_password: str):
-    user = await get_user_by_email(db, email)
-    if user:
-        user.hashed_password = get_password_hash(new_password)
-        await db.commit()
-        return user
-    return None
+def _team_of(db: Session, *team_member_ids):
+    # Members an event is about plus their superiors
+    superiors = _superior_ids(db, team_member_ids)
+    members = [member_id for member_id in team_member_ids if member_id is not None]
+    return members + list(superiors.values())
 
 
 # User CRUD operations
@@ -85,6 +86,57 @@ def update_user(db: Session, user_id: int, user: schemas.UserUpdate):
     return db_user
 
 
+USER_ROLES = ("member", "manager", "admin")
+
+
+def get_users_by_ids(db: Session, user_ids: List[int]):
+    if not user_ids:
+        return []
+    return db.query(models.User).filter(models.User.id.in_(user_ids)).all()
+
+
+def bulk_update_users(db: Session, user_ids: List[int], patch: dict):
+    """
+    Apply the same patch to many users in a single UPDATE and commit.
+
+    Only users whose values actually change are written; their ids are
+    returned. The UPDATE bypasses the unit of work, so audit entries are
+    recorded explicitly.
+    """
+    if not user_ids or not patch:
+        return []
+    fields = sorted(patch)
+    rows = (
+        db.query(models.User.id, *(getattr(models.User, field) for field in fields))
+        .filter(models.User.id.in_(user_ids))
+        .all()
+    )
+    changes = {}
+    for row in rows:
+        diff = {
+            field: [getattr(row, field), patch[field]]
+            for field in fields
+            if getattr(row, field) != patch[field]
+        }
+        if diff:
+            changes[row.id] = diff
+    if not changes:
+        return []
+
+    values = {getattr(models.User, field): patch[field] for field in fields}
+    values[models.User.updated_at] = func.now()
+    (
+        db.query(models.User)
+        .filter(models.User.id.in_(list(changes)))
+        .update(values, synchronize_session=False)
+    )
+    db.commit()
+
+    for user_id, diff in changes.items():
+        audit.record("update", "user", [user_id], diff)
+    return list(changes)
+
+
 def delete_user(db: Session, user_id: int):
     db_user = db.query(models.User).filter(models.User.id == user_id).first()
     if db_user:
@@ -101,9 +153,56 @@ def authenticate_user(db: Session, email: str, password: str):
     return user
 
 
+def update_password(db: Session, email: str, new_password: str):
+    db_user = get_user_by_email(db, email)
+    if db_user is None:
+        return None
+    db_user.hashed_password = get_password_hash(new_password)
+    db.commit()
+    return db_user
+
+
 # TeamMember CRUD operations
-def get_team_member(db: Session, team_member_id: int):
-    return db.query(models.TeamMember).filter(models.TeamMember.id == team_member_id).first()
+
+# Relations that can be embedded in team member responses
+TEAM_MEMBER_INCLUDES = ("objectives", "open_action_items", "latest_meeting")
+# Always loaded with a sparse fieldset: permission checks and embedding read them
+TEAM_MEMBER_KEY_COLUMNS = ("id", "user_id", "superior_id")
+
+
+def _team_member_options(query, fields=None, include=(), with_notes: bool = True):
+    """
+    Narrow the column projection to `fields` (None loads every column) and
+    batch-load the embedded relations in `include` with one query each.
+    """
+    member = models.TeamMember
+    if fields is not None:
+        columns = set(fields) | set(TEAM_MEMBER_KEY_COLUMNS)
+        query = query.options(
+            load_only(*(getattr(member, name) for name in sorted(columns)))
+        )
+        with_notes = "manager_notes" in columns
+    if with_notes:
+        # Load the encrypted notes with the rows instead of one query per row
+        query = query.options(undefer_group("private_notes"))
+    if "objectives" in include:
+        query = query.options(
+            selectinload(member.objectives).selectinload(models.Objective.key_results)
+        )
+    if "open_action_items" in include:
+        query = query.options(selectinload(
+            member.assigned_action_items.and_(
+                models.ActionItem.status.in_(OPEN_ACTION_ITEM_STATUSES)
+            )
+        ))
+    return query
+
+
+def get_team_member(db: Session, team_member_id: int, fields=None, include=()):
+    query = db.query(models.TeamMember)
+    if fields is not None or include:
+        query = _team_member_options(query, fields, include)
+    return query.filter(models.TeamMember.id == team_member_id).first()
 
 
 def get_team_member_by_email(db: Session, email: str):
@@ -119,9 +218,14 @@ def get_team_members(
     skip: int = 0, 
     limit: int = 100,
     superior_id: Optional[int] = None,
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    with_notes: bool = True,
+    fields=None,
+    include=()
 ):
-    query = db.query(models.TeamMember)
+    query = _team_member_options(
+        db.query(models.TeamMember), fields, include, with_notes
+    )
     
     if superior_id is not None:
         query = query.filter(models.TeamMember.superior_id == superior_id)
@@ -135,9 +239,16 @@ def get_team_members(
 def get_team_members_with_hierarchy(
     db: Session, 
     superior_id: Optional[int] = None, 
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    with_notes: bool = True
 ):
     query = db.query(models.TeamMember)
+
+    if with_notes:
+        query = query.options(
+            undefer_group("private_notes"),
+            joinedload(models.TeamMember.direct_reports).undefer_group("private_notes"),
+        )
     
     if superior_id is not None:
         query = query.filter(models.TeamMember.superior_id == superior_id)
@@ -161,6 +272,11 @@ def create_team_member(db: Session, team_member: schemas.TeamMemberCreate):
     db.add(db_team_member)
     db.commit()
     db.refresh(db_team_member)
+    publish_change(
+        "team_member", "created", db_team_member.id,
+        [db_team_member.id, db_team_member.superior_id],
+        team_member.dict(),
+    )
     return db_team_member
 
 
@@ -177,18 +293,1333 @@ def update_team_member(db: Session, team_member_id: int, team_member: schemas.Te
         if existing and existing.id != team_member_id:
             return None
     
+    previous_superior_id = db_team_member.superior_id
     for field, value in update_data.items():
         setattr(db_team_member, field, value)
     
     db.commit()
     db.refresh(db_team_member)
+    publish_change(
+        "team_member", "updated", team_member_id,
+        {team_member_id, previous_superior_id, db_team_member.superior_id},
+        update_data,
+    )
     return db_team_member
 
 
 def delete_team_member(db: Session, team_member_id: int):
     db_team_member = db.query(models.TeamMember).filter(models.TeamMember.id == team_member_id).first()
     if db_team_member:
+        superior_id = db_team_member.superior_id
+        _delete_unlinked_rows(db, team_member_id)
         db.delete(db_team_member)
         db.commit()
+        publish_change(
+            "team_member", "deleted", team_member_id, [team_member_id, superior_id]
+        )
         return True
     return False
+
+
+def _delete_unlinked_rows(db: Session, team_member_id: int):
+    """
+    Clean up the rows of a member that no foreign key cascades to: archived
+    meetings and action items, and sentiment scores. Mirrors the ORM
+    cascades of the live tables; foreign keys are not enforced on SQLite,
+    so the sentiment aggregates are removed here as well.
+    """
+    meeting_ids = [
+        meeting_log_id for (meeting_log_id,) in db.query(models.MeetingLog.id)
+        .filter(models.MeetingLog.team_member_id == team_member_id)
+        .union_all(
+            db.query(models.MeetingLogArchive.id)
+            .filter(models.MeetingLogArchive.team_member_id == team_member_id)
+        )
+    ]
+    archived_item = models.ActionItemArchive
+    if meeting_ids:
+        db.query(archived_item).filter(
+            archived_item.meeting_log_id.in_(meeting_ids)
+        ).delete(synchronize_session=False)
+    for column in (
+        archived_item.assigned_to_member_id, archived_item.assigned_by_manager_id
+    ):
+        db.query(archived_item).filter(column == team_member_id).update(
+            {column: None}, synchronize_session=False
+        )
+    for model in (
+        models.MeetingLogArchive, models.MeetingSentiment, models.SentimentAggregate
+    ):
+        db.query(model).filter(model.team_member_id == team_member_id).delete(
+            synchronize_session=False
+        )
+
+
+def get_team_subtree(
+    db: Session, root_id: Optional[int] = None, include_inactive: bool = False
+):
+    """
+    (id, superior_id, depth) of all members below root_id, or of the whole
+    organization starting at the top-level members when root_id is None.
+
+    Uses a recursive CTE, supported by both SQLite and PostgreSQL.
+    """
+    tree = team_subtree_cte(db, root_id, include_inactive)
+    return (
+        db.query(tree.c.id, tree.c.superior_id, tree.c.depth)
+        .order_by(tree.c.depth, tree.c.id)
+        .all()
+    )
+
+
+def team_subtree_cte(
+    db: Session, root_id: Optional[int] = None, include_inactive: bool = False
+):
+    """The recursive CTE behind `get_team_subtree`, to join other queries to."""
+    member = models.TeamMember
+    anchor = db.query(member.id, member.superior_id, literal(0).label("depth"))
+    anchor = anchor.filter(
+        member.id == root_id if root_id is not None else member.superior_id.is_(None)
+    )
+    if not include_inactive:
+        anchor = anchor.filter(member.is_active == True)  # noqa: E712
+    tree = anchor.cte(name="team_tree", recursive=True)
+
+    children = db.query(
+        member.id, member.superior_id, (tree.c.depth + 1).label("depth")
+    ).join(tree, member.superior_id == tree.c.id)
+    if not include_inactive:
+        children = children.filter(member.is_active == True)  # noqa: E712
+    return tree.union_all(children)
+
+
+# Objective CRUD operations
+def get_objective(db: Session, objective_id: int):
+    return (
+        db.query(models.Objective).filter(models.Objective.id == objective_id).first()
+    )
+
+
+# KeyResult CRUD operations
+def _set_key_result_numeric(db_key_result: models.KeyResult):
+    db_key_result.target_numeric = parse_target(
+        db_key_result.measurement_type, db_key_result.target_value
+    )
+    db_key_result.current_numeric = parse_value(
+        db_key_result.measurement_type, db_key_result.current_value
+    )
+
+
+def _record_key_result_history(db: Session, db_key_result: models.KeyResult):
+    db.add(models.KeyResultHistory(
+        key_result=db_key_result,
+        value=db_key_result.current_numeric,
+        status=db_key_result.status,
+    ))
+
+
+def get_key_result(db: Session, key_result_id: int):
+    return (
+        db.query(models.KeyResult).filter(models.KeyResult.id == key_result_id).first()
+    )
+
+
+def get_key_results(db: Session, objective_id: int):
+    return (
+        db.query(models.KeyResult)
+        .filter(models.KeyResult.objective_id == objective_id)
+        .order_by(models.KeyResult.deadline)
+        .all()
+    )
+
+
+def create_key_result(db: Session, key_result: schemas.KeyResultCreate):
+    db_key_result = models.KeyResult(**key_result.dict())
+    _set_key_result_numeric(db_key_result)
+    db.add(db_key_result)
+    _record_key_result_history(db, db_key_result)
+    db.commit()
+    db.refresh(db_key_result)
+    return db_key_result
+
+
+def update_key_result(
+    db: Session, key_result_id: int, key_result: schemas.KeyResultUpdate
+):
+    db_key_result = get_key_result(db, key_result_id)
+    if db_key_result is None:
+        return None
+
+    previous = (db_key_result.current_numeric, db_key_result.status)
+
+    update_data = key_result.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_key_result, field, value)
+
+    if update_data.keys() & {"measurement_type", "target_value", "current_value"}:
+        _set_key_result_numeric(db_key_result)
+
+    if (db_key_result.current_numeric, db_key_result.status) != previous:
+        _record_key_result_history(db, db_key_result)
+
+    db.commit()
+    db.refresh(db_key_result)
+    return db_key_result
+
+
+def delete_key_result(db: Session, key_result_id: int):
+    db_key_result = get_key_result(db, key_result_id)
+    if db_key_result:
+        db.delete(db_key_result)
+        db.commit()
+        return True
+    return False
+
+
+def backfill_key_result_numeric(db: Session, batch_size: int = 500):
+    """
+    Populate the numeric KR columns from the raw text values.
+
+    Rows are processed in id order in batches so the command can run against
+    a live database without holding a long write transaction.
+    """
+    updated = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(
+                models.KeyResult.id,
+                models.KeyResult.measurement_type,
+                models.KeyResult.target_value,
+                models.KeyResult.current_value,
+            )
+            .filter(models.KeyResult.id > last_id)
+            .order_by(models.KeyResult.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        db.bulk_update_mappings(models.KeyResult, [
+            {
+                "id": row.id,
+                "target_numeric": parse_target(row.measurement_type, row.target_value),
+                "current_numeric": parse_value(row.measurement_type, row.current_value),
+            }
+            for row in rows
+        ])
+        db.commit()
+        updated += len(rows)
+        last_id = rows[-1].id
+    return updated
+
+
+def key_result_progress_columns():
+    """
+    SQL expressions for KR percent-complete and at-risk flag.
+
+    Progress is current/target clamped to 0..100. A KR is at risk when it is
+    explicitly marked so, or when it is still open and its progress lags the
+    share of the KR period that has already elapsed.
+    """
+    kr = models.KeyResult
+    ratio = kr.current_numeric * 100.0 / kr.target_numeric
+    percent_complete = case(
+        (or_(kr.target_numeric.is_(None), kr.target_numeric == 0), None),
+        (kr.current_numeric.is_(None), 0.0),
+        (ratio > 100, 100.0),
+        (ratio < 0, 0.0),
+        else_=ratio,
+    )
+
+    start = julian_day(func.coalesce(kr.start_date, func.date(kr.created_at)))
+    total_days = julian_day(kr.deadline) - start
+    elapsed_percent = case(
+        (total_days <= 0, 100.0),
+        else_=(julian_day(func.current_timestamp()) - start) * 100.0 / total_days,
+    )
+    at_risk = case(
+        (kr.status == "At Risk", True),
+        (kr.status.in_(("Achieved", "Missed")), False),
+        (
+            and_(
+                percent_complete.is_not(None),
+                percent_complete + settings.KR_AT_RISK_TOLERANCE < elapsed_percent,
+            ),
+            True,
+        ),
+        else_=False,
+    )
+    return percent_complete.label("percent_complete"), at_risk.label("at_risk")
+
+
+def get_key_results_progress(
+    db: Session,
+    objective_id: Optional[int] = None,
+    team_member_ids: Optional[List[int]] = None,
+    at_risk_only: bool = False,
+):
+    percent_complete, at_risk = key_result_progress_columns()
+    query = db.query(
+        models.KeyResult.id,
+        models.KeyResult.objective_id,
+        models.KeyResult.title,
+        models.KeyResult.status,
+        models.KeyResult.deadline,
+        percent_complete,
+        at_risk,
+    )
+
+    if objective_id is not None:
+        query = query.filter(models.KeyResult.objective_id == objective_id)
+
+    if team_member_ids is not None:
+        query = query.join(models.Objective).filter(
+            models.Objective.team_member_id.in_(team_member_ids)
+        )
+
+    if at_risk_only:
+        query = query.filter(at_risk.element == True)  # noqa: E712
+
+    return query.order_by(models.KeyResult.deadline).all()
+
+
+def get_key_results_rollup(
+    db: Session,
+    group_by: str = "team_member",
+    team_member_ids: Optional[List[int]] = None,
+):
+    """
+    Aggregate KR progress per team member or per manager in a single query.
+    """
+    percent_complete, at_risk = key_result_progress_columns()
+    at_risk_count = func.sum(case((at_risk.element == True, 1), else_=0))  # noqa: E712
+
+    if group_by == "manager":
+        group_column = models.TeamMember.superior_id
+    else:
+        group_column = models.Objective.team_member_id
+
+    query = (
+        db.query(
+            group_column.label("group_id"),
+            func.count(models.KeyResult.id).label("key_results"),
+            func.avg(percent_complete.element).label("avg_percent_complete"),
+            at_risk_count.label("at_risk"),
+        )
+        .select_from(models.KeyResult)
+        .join(models.Objective)
+        .join(
+            models.TeamMember, models.TeamMember.id == models.Objective.team_member_id
+        )
+    )
+
+    if team_member_ids is not None:
+        query = query.filter(models.Objective.team_member_id.in_(team_member_ids))
+
+    return query.group_by(group_column).all()
+
+
+def search_key_results(
+    db: Session,
+    query: str,
+    team_member_ids: Optional[List[int]] = None,
+    limit: int = 50,
+):
+    """
+    Search KR and objective titles and descriptions, using full-text search
+    on PostgreSQL and substring matching on SQLite.
+    """
+    q = (
+        db.query(models.KeyResult)
+        .join(models.Objective)
+        .filter(text_search(
+            query,
+            models.KeyResult.title,
+            models.KeyResult.description,
+            models.Objective.title,
+            models.Objective.description,
+        ))
+    )
+    if team_member_ids is not None:
+        q = q.filter(models.Objective.team_member_id.in_(team_member_ids))
+    return q.order_by(models.KeyResult.deadline).limit(limit).all()
+
+
+# KeyResult history
+def get_key_results_team_member_ids(db: Session, key_result_ids: List[int]):
+    rows = (
+        db.query(models.KeyResult.id, models.Objective.team_member_id)
+        .join(models.Objective)
+        .filter(models.KeyResult.id.in_(key_result_ids))
+        .all()
+    )
+    return dict(rows)
+
+
+def get_key_results_history(
+    db: Session,
+    key_result_ids: List[int],
+    bucket: str = "week",
+    since: Optional[datetime] = None,
+):
+    """
+    Bucketed value series for many KRs in a single grouped query.
+    """
+    history = models.KeyResultHistory
+    bucket_column = date_bucket(bucket, history.recorded_at).label("bucket")
+
+    query = db.query(
+        history.key_result_id,
+        bucket_column,
+        func.avg(history.value).label("avg_value"),
+        func.min(history.value).label("min_value"),
+        func.max(history.value).label("max_value"),
+        func.count(history.id).label("samples"),
+        func.max(history.recorded_at).label("last_recorded_at"),
+    ).filter(history.key_result_id.in_(key_result_ids))
+
+    if since is not None:
+        query = query.filter(history.recorded_at >= since)
+
+    return (
+        query.group_by(history.key_result_id, bucket_column)
+        .order_by(history.key_result_id, bucket_column)
+        .all()
+    )
+
+
+def _downsample_key_result_history(db: Session, older_than: datetime, bucket: str):
+    # Keep the latest sample per KR and bucket, drop the rest
+    history = models.KeyResultHistory
+    bucket_column = date_bucket(bucket, history.recorded_at)
+    keep_ids = (
+        db.query(func.max(history.id))
+        .filter(history.recorded_at < older_than)
+        .group_by(history.key_result_id, bucket_column)
+    )
+    return (
+        db.query(history)
+        .filter(history.recorded_at < older_than, history.id.not_in(keep_ids))
+        .delete(synchronize_session=False)
+    )
+
+
+def compact_key_result_history(db: Session, now: Optional[datetime] = None):
+    """
+    Apply the KR history retention policy.
+
+    Samples older than KR_HISTORY_RAW_DAYS are reduced to one per day and
+    samples older than KR_HISTORY_WEEKLY_AFTER_DAYS to one per week.
+    """
+    now = now or datetime.utcnow()
+    deleted = _downsample_key_result_history(
+        db, now - timedelta(days=settings.KR_HISTORY_WEEKLY_AFTER_DAYS), "week"
+    )
+    deleted += _downsample_key_result_history(
+        db, now - timedelta(days=settings.KR_HISTORY_RAW_DAYS), "day"
+    )
+    db.commit()
+    return deleted
+
+
+# MeetingLog CRUD operations
+def get_meeting_log(db: Session, meeting_log_id: int):
+    return (
+        db.query(models.MeetingLog)
+        .options(selectinload(models.MeetingLog.action_items))
+        .filter(models.MeetingLog.id == meeting_log_id)
+        .first()
+    )
+
+
+def get_latest_meeting_logs(db: Session, team_member_ids: List[int]):
+    """Most recent meeting log of each of the given members, keyed by member id."""
+    if not team_member_ids:
+        return {}
+    meeting_log = models.MeetingLog
+    latest = (
+        db.query(
+            meeting_log.team_member_id,
+            func.max(meeting_log.meeting_date).label("meeting_date"),
+        )
+        .filter(meeting_log.team_member_id.in_(team_member_ids))
+        .group_by(meeting_log.team_member_id)
+        .subquery()
+    )
+    meeting_logs = (
+        db.query(meeting_log)
+        .options(selectinload(meeting_log.action_items), undefer_group("private_notes"))
+        .join(latest, and_(
+            meeting_log.team_member_id == latest.c.team_member_id,
+            meeting_log.meeting_date == latest.c.meeting_date,
+        ))
+        .order_by(meeting_log.id)
+        .all()
+    )
+    # Meetings at the same time: the last one created wins
+    return {meeting_log.team_member_id: meeting_log for meeting_log in meeting_logs}
+
+
+def get_meeting_logs(
+    db: Session,
+    team_member_id: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    before: Optional[tuple] = None,
+    limit: int = 20,
+):
+    """
+    Meeting logs of a team member, newest first.
+
+    Uses a range scan on (team_member_id, meeting_date); `before` is the
+    (meeting_date, id) of the last row of the previous page.
+    """
+    def page(meeting_log):
+        query = (
+            db.query(meeting_log)
+            .options(
+                selectinload(meeting_log.action_items), undefer_group("private_notes")
+            )
+            .filter(meeting_log.team_member_id == team_member_id)
+        )
+
+        if date_from is not None:
+            query = query.filter(meeting_log.meeting_date >= date_from)
+        if date_to is not None:
+            query = query.filter(meeting_log.meeting_date <= date_to)
+
+        if before is not None:
+            before_date, before_id = before
+            query = query.filter(or_(
+                meeting_log.meeting_date < before_date,
+                and_(
+                    meeting_log.meeting_date == before_date, meeting_log.id < before_id
+                ),
+            ))
+
+        return (
+            query.order_by(meeting_log.meeting_date.desc(), meeting_log.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    meeting_logs = page(models.MeetingLog)
+
+    # The archive only holds meetings up to its newest archived date, so it
+    # is read only when the range and the live page reach back that far
+    newest_archived = get_archived_meeting_logs_watermark(db, team_member_id)
+    if newest_archived is None or (
+        date_from is not None and date_from > newest_archived
+    ):
+        return meeting_logs
+    if len(meeting_logs) == limit and meeting_logs[-1].meeting_date > newest_archived:
+        return meeting_logs
+
+    merged = meeting_logs + page(models.MeetingLogArchive)
+    merged.sort(key=lambda row: (row.meeting_date, row.id), reverse=True)
+    return merged[:limit]
+
+
+def get_archived_meeting_log(db: Session, meeting_log_id: int):
+    return (
+        db.query(models.MeetingLogArchive)
+        .options(selectinload(models.MeetingLogArchive.action_items))
+        .filter(models.MeetingLogArchive.id == meeting_log_id)
+        .first()
+    )
+
+
+def get_archived_meeting_logs_watermark(db: Session, team_member_id: int):
+    """Date of the member's newest archived meeting, None without any."""
+    return (
+        db.query(func.max(models.MeetingLogArchive.meeting_date))
+        .filter(models.MeetingLogArchive.team_member_id == team_member_id)
+        .scalar()
+    )
+
+
+def create_meeting_log(
+    db: Session, meeting_log: schemas.MeetingLogCreate, manager_id: int
+):
+    db_meeting_log = models.MeetingLog(
+        **meeting_log.dict(exclude={"manager_id"}),
+        manager_id=manager_id,
+    )
+    db_meeting_log.notes_structured = notes_parser.parse_notes(db_meeting_log.notes)
+    db.add(db_meeting_log)
+    db.commit()
+    db.refresh(db_meeting_log)
+    publish_change(
+        "meeting_log", "created", db_meeting_log.id,
+        _team_of(db, db_meeting_log.team_member_id, manager_id),
+        {
+            "team_member_id": db_meeting_log.team_member_id,
+            "meeting_date": db_meeting_log.meeting_date,
+        },
+    )
+    return db_meeting_log
+
+
+def update_meeting_log(
+    db: Session, meeting_log_id: int, meeting_log: schemas.MeetingLogUpdate
+):
+    db_meeting_log = get_meeting_log(db, meeting_log_id)
+    if db_meeting_log is None:
+        return None
+
+    update_data = meeting_log.dict(exclude_unset=True)
+    if "notes" in update_data and update_data["notes"] != db_meeting_log.notes:
+        # Only the sections that changed since the last write are re-parsed
+        db_meeting_log.notes_structured = notes_parser.parse_notes(
+            update_data["notes"], previous=db_meeting_log.notes_structured
+        )
+
+    if update_data.keys() & {"notes", "meeting_date", "team_member_id"}:
+        # Queues the meeting for the sentiment scorer again
+        _drop_meeting_sentiment(db, meeting_log_id)
+
+    for field, value in update_data.items():
+        setattr(db_meeting_log, field, value)
+
+    db.commit()
+    db.refresh(db_meeting_log)
+    publish_change(
+        "meeting_log", "updated", meeting_log_id,
+        _team_of(db, db_meeting_log.team_member_id, db_meeting_log.manager_id),
+        update_data,
+    )
+    return db_meeting_log
+
+
+def delete_meeting_log(db: Session, meeting_log_id: int):
+    db_meeting_log = get_meeting_log(db, meeting_log_id)
+    if db_meeting_log:
+        team = _team_of(db, db_meeting_log.team_member_id, db_meeting_log.manager_id)
+        _drop_meeting_sentiment(db, meeting_log_id)
+        db.delete(db_meeting_log)
+        db.commit()
+        publish_change("meeting_log", "deleted", meeting_log_id, team)
+        return True
+    return False
+
+
+# Meeting sentiment (FR7.5)
+def _dialect_insert(db: Session, model):
+    """INSERT supporting ON CONFLICT clauses on both SQLite and PostgreSQL."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql_insert(model)
+    return sqlite_insert(model)
+
+
+def get_unscored_meeting_logs(db: Session, limit: int = 200):
+    """Meeting logs without a sentiment row, with their notes loaded."""
+    return (
+        db.query(models.MeetingLog)
+        .options(undefer(models.MeetingLog.notes))
+        .outerjoin(
+            models.MeetingSentiment,
+            models.MeetingSentiment.meeting_log_id == models.MeetingLog.id,
+        )
+        .filter(models.MeetingSentiment.meeting_log_id.is_(None))
+        .order_by(models.MeetingLog.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def save_meeting_sentiments(db: Session, sentiments: List[dict]):
+    """Store per-meeting scores and refresh the monthly aggregates they fall into."""
+    if not sentiments:
+        return
+    # Workers polling for unscored meetings pick the same ones, the first
+    # score stored wins and the others are skipped
+    db.execute(
+        _dialect_insert(db, models.MeetingSentiment).on_conflict_do_nothing(
+            index_elements=["meeting_log_id"]
+        ),
+        sentiments,
+    )
+    _refresh_sentiment_aggregates(
+        db,
+        {
+            (sentiment["team_member_id"], sentiment["period_start"])
+            for sentiment in sentiments
+        },
+    )
+    db.commit()
+
+
+def _drop_meeting_sentiment(db: Session, meeting_log_id: int):
+    sentiment = models.MeetingSentiment
+    row = (
+        db.query(sentiment.team_member_id, sentiment.period_start)
+        .filter(sentiment.meeting_log_id == meeting_log_id)
+        .first()
+    )
+    if row is None:
+        return
+    db.query(sentiment).filter(sentiment.meeting_log_id == meeting_log_id).delete(
+        synchronize_session=False
+    )
+    _refresh_sentiment_aggregates(db, {(row.team_member_id, row.period_start)})
+
+
+def _refresh_sentiment_aggregates(db: Session, periods):
+    """
+    Recompute the aggregates of the given (team_member_id, period_start)
+    months from their meeting scores.
+
+    Only the touched months are read, and recomputing instead of applying
+    deltas keeps the totals right when two workers score the same month.
+    """
+    keys = list(periods)
+    if not keys:
+        return
+    sentiment = models.MeetingSentiment
+    aggregate = models.SentimentAggregate
+    rows = (
+        db.query(
+            sentiment.team_member_id,
+            sentiment.period_start,
+            func.count(sentiment.score).label("meeting_count"),
+            func.coalesce(func.sum(sentiment.score), 0.0).label("score_sum"),
+            func.coalesce(func.sum(sentiment.positive), 0).label("positive"),
+            func.coalesce(func.sum(sentiment.negative), 0).label("negative"),
+        )
+        .filter(tuple_(sentiment.team_member_id, sentiment.period_start).in_(keys))
+        .group_by(sentiment.team_member_id, sentiment.period_start)
+        .all()
+    )
+    db.query(aggregate).filter(
+        tuple_(aggregate.team_member_id, aggregate.period_start).in_(keys)
+    ).delete(synchronize_session=False)
+    counted = [row._asdict() for row in rows if row.meeting_count]
+    if not counted:
+        return
+    # A worker refreshing the same month concurrently may have inserted it
+    # after the delete above; the newer totals replace it
+    insert_aggregates = _dialect_insert(db, aggregate)
+    db.execute(
+        insert_aggregates.on_conflict_do_update(
+            index_elements=["team_member_id", "period_start"],
+            set_={
+                name: insert_aggregates.excluded[name]
+                for name in ("meeting_count", "score_sum", "positive", "negative")
+            },
+        ),
+        counted,
+    )
+
+
+def get_sentiment_aggregates(db: Session, team_member_id: int, since: date):
+    return (
+        db.query(models.SentimentAggregate)
+        .filter(
+            models.SentimentAggregate.team_member_id == team_member_id,
+            models.SentimentAggregate.period_start >= since,
+        )
+        .order_by(models.SentimentAggregate.period_start)
+        .all()
+    )
+
+
+# ActionItem CRUD operations
+ACTION_ITEM_STATUSES = ("To Do", "In Progress", "Done", "Blocked")
+OPEN_ACTION_ITEM_STATUSES = ("To Do", "In Progress", "Blocked")
+
+
+def get_action_item(db: Session, action_item_id: int):
+    return (
+        db.query(models.ActionItem)
+        .filter(models.ActionItem.id == action_item_id)
+        .first()
+    )
+
+
+def get_action_items_by_ids(db: Session, action_item_ids: List[int]):
+    return (
+        db.query(models.ActionItem)
+        .filter(models.ActionItem.id.in_(action_item_ids))
+        .all()
+    )
+
+
+def get_archived_action_item(db: Session, action_item_id: int):
+    return (
+        db.query(models.ActionItemArchive)
+        .filter(models.ActionItemArchive.id == action_item_id)
+        .first()
+    )
+
+
+def get_action_items(
+    db: Session,
+    assigned_to_member_ids: Optional[List[int]] = None,
+    status: Optional[str] = None,
+    due_before: Optional[date] = None,
+    skip: int = 0,
+    limit: int = 100,
+    include_archived: bool = False,
+):
+    """
+    Action items ordered by due date.
+
+    Only completed items are archived, so the archive is read when asking
+    for "Done" items or when `include_archived` is set.
+    """
+    def items(action_item, offset, count):
+        query = db.query(action_item)
+
+        if assigned_to_member_ids is not None:
+            query = query.filter(
+                action_item.assigned_to_member_id.in_(assigned_to_member_ids)
+            )
+        if status is not None:
+            query = query.filter(action_item.status == status)
+        if due_before is not None:
+            query = query.filter(action_item.due_date < due_before)
+
+        return (
+            query.order_by(action_item.due_date.nulls_first(), action_item.id)
+            .offset(offset)
+            .limit(count)
+            .all()
+        )
+
+    if not (include_archived or status == "Done"):
+        return items(models.ActionItem, skip, limit)
+
+    merged = items(models.ActionItem, 0, skip + limit)
+    merged += items(models.ActionItemArchive, 0, skip + limit)
+    # NULL due dates first, as ordered by the queries
+    merged.sort(
+        key=lambda row: (row.due_date is not None, row.due_date or date.min, row.id)
+    )
+    return merged[skip:skip + limit]
+
+
+def get_overdue_action_items(
+    db: Session,
+    assigned_to_member_ids: Optional[List[int]] = None,
+    today: Optional[date] = None,
+):
+    """
+    Open action items past their due date.
+
+    Matches the (assigned_to_member_id, status, due_date) index: equality on
+    the assignee and status, range on the due date.
+    """
+    today = today or date.today()
+    query = db.query(models.ActionItem).filter(
+        models.ActionItem.status.in_(OPEN_ACTION_ITEM_STATUSES),
+        models.ActionItem.due_date < today,
+    )
+    if assigned_to_member_ids is not None:
+        query = query.filter(
+            models.ActionItem.assigned_to_member_id.in_(assigned_to_member_ids)
+        )
+    return query.order_by(models.ActionItem.due_date, models.ActionItem.id).all()
+
+
+def create_action_item(db: Session, action_item: schemas.ActionItemCreate):
+    db_action_item = models.ActionItem(**action_item.dict())
+    db.add(db_action_item)
+    db.commit()
+    db.refresh(db_action_item)
+    publish_change(
+        "action_item", "created", db_action_item.id,
+        _team_of(
+            db,
+            db_action_item.assigned_to_member_id,
+            db_action_item.assigned_by_manager_id,
+        ),
+        action_item.dict(),
+    )
+    return db_action_item
+
+
+def update_action_item(
+    db: Session, action_item_id: int, action_item: schemas.ActionItemUpdate
+):
+    db_action_item = get_action_item(db, action_item_id)
+    if db_action_item is None:
+        return None
+
+    previous_assignee_id = db_action_item.assigned_to_member_id
+    update_data = action_item.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_action_item, field, value)
+
+    db.commit()
+    db.refresh(db_action_item)
+    publish_change(
+        "action_item", "updated", action_item_id,
+        _team_of(
+            db, db_action_item.assigned_to_member_id, previous_assignee_id,
+            db_action_item.assigned_by_manager_id,
+        ),
+        update_data,
+    )
+    return db_action_item
+
+
+def update_action_items_status(db: Session, action_item_ids: List[int], status: str):
+    """
+    Set the status of many action items in a single UPDATE and commit.
+    """
+    if not action_item_ids:
+        return 0
+    owners = (
+        db.query(
+            models.ActionItem.id,
+            models.ActionItem.assigned_to_member_id,
+            models.ActionItem.assigned_by_manager_id,
+        )
+        .filter(models.ActionItem.id.in_(action_item_ids))
+        .all()
+    )
+    updated = (
+        db.query(models.ActionItem)
+        .filter(models.ActionItem.id.in_(action_item_ids))
+        .update(
+            {
+                models.ActionItem.status: status,
+                models.ActionItem.updated_at: func.now(),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+
+    superiors = _superior_ids(db, [owner.assigned_to_member_id for owner in owners])
+    for owner in owners:
+        publish_change(
+            "action_item", "updated", owner.id,
+            [
+                owner.assigned_to_member_id,
+                owner.assigned_by_manager_id,
+                superiors.get(owner.assigned_to_member_id),
+            ],
+            {"status": status},
+        )
+    return updated
+
+
+def delete_action_item(db: Session, action_item_id: int):
+    db_action_item = get_action_item(db, action_item_id)
+    if db_action_item:
+        team = _team_of(
+            db,
+            db_action_item.assigned_to_member_id,
+            db_action_item.assigned_by_manager_id,
+        )
+        db.delete(db_action_item)
+        db.commit()
+        publish_change("action_item", "deleted", action_item_id, team)
+        return True
+    return False
+
+
+# Review drafts
+def get_review_material(
+    db: Session, team_member_id: int, date_from: date, date_to: date
+):
+    """
+    Everything a review draft of a member for a period is based on.
+
+    Loaded in a fixed number of queries regardless of the amount of material:
+    objectives, their key results, meeting logs with parsed notes, and action
+    items completed in the period. Archived meetings are read only when the
+    period reaches back to them.
+    """
+    period_start = datetime.combine(date_from, datetime.min.time())
+    period_end = datetime.combine(date_to + timedelta(days=1), datetime.min.time())
+
+    objectives = (
+        db.query(models.Objective)
+        .options(selectinload(models.Objective.key_results))
+        .filter(models.Objective.team_member_id == team_member_id)
+        .order_by(models.Objective.id)
+        .all()
+    )
+    meeting_logs = (
+        db.query(models.MeetingLog)
+        .options(undefer(models.MeetingLog.notes_structured))
+        .filter(
+            models.MeetingLog.team_member_id == team_member_id,
+            models.MeetingLog.meeting_date >= period_start,
+            models.MeetingLog.meeting_date < period_end,
+        )
+        .order_by(models.MeetingLog.meeting_date)
+        .all()
+    )
+    if period_start <= (
+        get_archived_meeting_logs_watermark(db, team_member_id) or datetime.min
+    ):
+        meeting_logs += (
+            db.query(models.MeetingLogArchive)
+            .options(undefer(models.MeetingLogArchive.notes_structured))
+            .filter(
+                models.MeetingLogArchive.team_member_id == team_member_id,
+                models.MeetingLogArchive.meeting_date >= period_start,
+                models.MeetingLogArchive.meeting_date < period_end,
+            )
+            .all()
+        )
+        meeting_logs.sort(key=lambda row: row.meeting_date)
+
+    completed_action_items = []
+    for action_item in (models.ActionItem, models.ActionItemArchive):
+        completed_action_items += (
+            db.query(action_item)
+            .filter(
+                action_item.assigned_to_member_id == team_member_id,
+                action_item.status == "Done",
+                action_item.updated_at >= period_start,
+                action_item.updated_at < period_end,
+            )
+            .all()
+        )
+    completed_action_items.sort(key=lambda row: row.updated_at)
+    return {
+        "objectives": objectives,
+        "meeting_logs": meeting_logs,
+        "completed_action_items": completed_action_items,
+    }
+
+
+def get_review_digests(db: Session, team_member_id: int, months: List[date]):
+    """Cached digests of the given months, keyed by month start."""
+    if not months:
+        return {}
+    digests = (
+        db.query(models.ReviewDigest)
+        .filter(
+            models.ReviewDigest.team_member_id == team_member_id,
+            models.ReviewDigest.period_start.in_(months),
+        )
+        .all()
+    )
+    return {digest.period_start: digest for digest in digests}
+
+
+def save_review_digest(db: Session, team_member_id: int, period_start: date, **fields):
+    digest = (
+        db.query(models.ReviewDigest)
+        .filter(
+            models.ReviewDigest.team_member_id == team_member_id,
+            models.ReviewDigest.period_start == period_start,
+        )
+        .first()
+    )
+    if digest is None:
+        digest = models.ReviewDigest(
+            team_member_id=team_member_id, period_start=period_start
+        )
+        db.add(digest)
+    for field, value in fields.items():
+        setattr(digest, field, value)
+    db.commit()
+    return digest
+
+
+def get_review_draft(db: Session, review_draft_id: int):
+    return (
+        db.query(models.ReviewDraft)
+        .filter(models.ReviewDraft.id == review_draft_id)
+        .first()
+    )
+
+
+def get_review_drafts(db: Session, team_member_id: int, skip: int = 0, limit: int = 20):
+    return (
+        db.query(models.ReviewDraft)
+        .filter(models.ReviewDraft.team_member_id == team_member_id)
+        .order_by(models.ReviewDraft.created_at.desc(), models.ReviewDraft.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def create_review_draft(
+    db: Session, review_draft: schemas.ReviewDraftCreate, requested_by_user_id: int
+):
+    db_review_draft = models.ReviewDraft(
+        **review_draft.dict(),
+        requested_by_user_id=requested_by_user_id,
+        status="queued",
+        progress=0.0,
+    )
+    db.add(db_review_draft)
+    db.commit()
+    db.refresh(db_review_draft)
+    return db_review_draft
+
+
+def update_review_draft(db: Session, review_draft_id: int, **fields):
+    """Record the progress or result of a draft job and notify the team."""
+    db_review_draft = get_review_draft(db, review_draft_id)
+    if db_review_draft is None:
+        return None
+    for field, value in fields.items():
+        setattr(db_review_draft, field, value)
+    db.commit()
+    publish_change(
+        "review_draft", "updated", review_draft_id,
+        _team_of(db, db_review_draft.team_member_id),
+        {key: fields[key] for key in ("status", "stage", "progress") if key in fields},
+    )
+    return db_review_draft
+
+
+def claim_stale_review_drafts(db: Session, stale_before: datetime) -> List[int]:
+    """
+    Reset queued or running drafts last updated before `stale_before` to
+    queued and return their ids.
+
+    Each row is claimed with a conditional UPDATE that also refreshes
+    updated_at, so when several workers start together every draft is
+    claimed by exactly one of them.
+    """
+    pending = ("queued", "running")
+    candidate_ids = [
+        review_draft_id for (review_draft_id,) in db.query(models.ReviewDraft.id)
+        .filter(
+            models.ReviewDraft.status.in_(pending),
+            models.ReviewDraft.updated_at < stale_before,
+        )
+        .order_by(models.ReviewDraft.id)
+    ]
+    claimed = []
+    for review_draft_id in candidate_ids:
+        updated = (
+            db.query(models.ReviewDraft)
+            .filter(
+                models.ReviewDraft.id == review_draft_id,
+                models.ReviewDraft.status.in_(pending),
+                models.ReviewDraft.updated_at < stale_before,
+            )
+            .update(
+                {"status": "queued", "stage": None, "progress": 0.0,
+                 "updated_at": func.now()},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if updated:
+            claimed.append(review_draft_id)
+    return claimed
+
+
+def delete_review_draft(db: Session, review_draft_id: int):
+    db_review_draft = get_review_draft(db, review_draft_id)
+    if db_review_draft:
+        db.delete(db_review_draft)
+        db.commit()
+        return True
+    return False
+
+
+# Org analytics: plain column tuples for app.services.analytics, no ORM objects.
+# With a root_id only the rows of members below it are read.
+def _in_subtree(db: Session, team_member_id, root_id: Optional[int]):
+    if root_id is None:
+        return true()
+    tree = team_subtree_cte(db, root_id)
+    return team_member_id.in_(core_select(tree.c.id))
+
+
+def get_key_result_analytics_rows(db: Session, root_id: Optional[int] = None):
+    """(owner team_member_id, percent_complete, at_risk) of every KR."""
+    percent_complete, at_risk = key_result_progress_columns()
+    return (
+        db.query(models.Objective.team_member_id, percent_complete, at_risk)
+        .select_from(models.KeyResult)
+        .join(models.Objective, models.Objective.id == models.KeyResult.objective_id)
+        .filter(_in_subtree(db, models.Objective.team_member_id, root_id))
+        .all()
+    )
+
+
+def get_open_action_item_analytics_rows(
+    db: Session, today: date, root_id: Optional[int] = None
+):
+    """(assigned_to_member_id, overdue) of every open, assigned action item."""
+    action_item = models.ActionItem
+    overdue = case((action_item.due_date < today, 1), else_=0)
+    return (
+        db.query(action_item.assigned_to_member_id, overdue)
+        .filter(
+            action_item.status.in_(OPEN_ACTION_ITEM_STATUSES),
+            action_item.assigned_to_member_id.is_not(None),
+            _in_subtree(db, action_item.assigned_to_member_id, root_id),
+        )
+        .all()
+    )
+
+
+def get_objective_analytics_rows(
+    db: Session, since: date, root_id: Optional[int] = None
+):
+    """
+    (team_member_id, month 'YYYY-MM-01', status) of objectives created
+    since `since`.
+    """
+    objective = models.Objective
+    return (
+        db.query(
+            objective.team_member_id,
+            date_bucket("month", objective.created_at),
+            objective.status,
+        )
+        .filter(
+            objective.created_at >= since,
+            _in_subtree(db, objective.team_member_id, root_id),
+        )
+        .all()
+    )
+
+
+# Archival
+def _move_rows(db: Session, source, target, ids: List[int]):
+    # Copied at the SQL level so encrypted columns move as stored ciphertext
+    columns = [column.name for column in source.__table__.columns]
+    db.execute(
+        insert(target.__table__).from_select(
+            columns,
+            core_select(*(source.__table__.c[name] for name in columns))
+            .where(source.__table__.c.id.in_(ids)),
+        )
+    )
+    db.execute(delete(source.__table__).where(source.__table__.c.id.in_(ids)))
+
+
+def archive_action_items(
+    db: Session, completed_before: datetime, batch_size: int = 500
+):
+    """Move one batch of items done before `completed_before` to the archive."""
+    ids = [
+        row.id for row in (
+            db.query(models.ActionItem.id)
+            .filter(
+                models.ActionItem.status == "Done",
+                models.ActionItem.updated_at < completed_before,
+            )
+            .order_by(models.ActionItem.id)
+            .limit(batch_size)
+        )
+    ]
+    if ids:
+        _move_rows(db, models.ActionItem, models.ActionItemArchive, ids)
+        db.commit()
+    return len(ids)
+
+
+def archive_meeting_logs(db: Session, held_before: datetime, batch_size: int = 500):
+    """
+    Move one batch of meeting logs held before `held_before` to the archive.
+
+    Meetings with action items still in the live table stay until those
+    items are done and archived themselves.
+    """
+    ids = [
+        row.id for row in (
+            db.query(models.MeetingLog.id)
+            .filter(
+                models.MeetingLog.meeting_date < held_before,
+                ~exists().where(
+                    models.ActionItem.meeting_log_id == models.MeetingLog.id
+                ),
+            )
+            .order_by(models.MeetingLog.id)
+            .limit(batch_size)
+        )
+    ]
+    if ids:
+        # Sentiment scores stay, the monthly aggregates are recomputed from
+        # them and keep counting archived meetings
+        _move_rows(db, models.MeetingLog, models.MeetingLogArchive, ids)
+        db.commit()
+    return len(ids)
+
+
+# Encryption key rotation
+ENCRYPTED_COLUMNS = (
+    (models.TeamMember, ("manager_notes",)),
+    (models.MeetingLog, ("notes", "notes_structured")),
+    (models.MeetingLogArchive, ("notes", "notes_structured")),
+    (models.ReviewDraft, ("content",)),
+    (models.ReviewDigest, ("content",)),
+)
+
+
+def rotate_encrypted_columns(db: Session, batch_size: int = 200):
+    """
+    Re-encrypt all encrypted columns with the current key.
+
+    Rows are streamed in id order in chunks and committed per chunk; values
+    already encrypted with the current key are skipped, legacy plaintext is
+    encrypted.
+    """
+    rotated = 0
+    for model, fields in ENCRYPTED_COLUMNS:
+        # Read the stored ciphertext without decrypting every value
+        raw_columns = [
+            type_coerce(getattr(model, field), Text).label(field) for field in fields
+        ]
+        last_id = 0
+        while True:
+            rows = (
+                db.query(model.id, *raw_columns)
+                .filter(model.id > last_id)
+                .order_by(model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            mappings = []
+            for row in rows:
+                changed = {
+                    field: encryption.decrypt(getattr(row, field))
+                    for field in fields
+                    if encryption.needs_rotation(getattr(row, field))
+                }
+                if changed:
+                    # Plaintext is re-encrypted with the current key on bind
+                    mappings.append({"id": row.id, **changed})
+            if mappings:
+                db.bulk_update_mappings(model, mappings)
+                db.commit()
+                rotated += len(mappings)
+            last_id = rows[-1].id
+    return rotated
+
+
+# Audit log
+def get_audit_logs(
+    db: Session,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    actor_user_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    limit: int = 50,
+):
+    """
+    Audit entries newest first, paginated by id so every page is an index
+    range scan instead of an OFFSET.
+    """
+    query = db.query(models.AuditLog)
+
+    if entity_type is not None:
+        query = query.filter(models.AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        query = query.filter(models.AuditLog.entity_id == entity_id)
+    if actor_user_id is not None:
+        query = query.filter(models.AuditLog.actor_user_id == actor_user_id)
+    if before_id is not None:
+        query = query.filter(models.AuditLog.id < before_id)
+
+    return query.order_by(models.AuditLog.id.desc()).limit(limit).all()
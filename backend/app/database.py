@@ -1,13 +1,102 @@
+import re
+from pathlib import Path
+from typing import Set
+
+from sqlalchemy import text
+from starlette.requests import HTTPConnection
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-DATABASE_URL = f"sqlite+aiosqlite:///{settings.SQLITE_DB_PATH}"
+DATABASE_URL = settings.database_url
+DIALECT = make_url(DATABASE_URL).get_backend_name()
+
+
+def _engine_options():
+    if DIALECT == "sqlite":
+        # aiosqlite runs one connection per thread, pooling settings do not apply
+        return {}
+
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": True,
+    }
+    if make_url(DATABASE_URL).get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+engine = create_async_engine(DATABASE_URL, echo=settings.DB_ECHO, **_engine_options())
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
-async def get_db():
+# Session.info flag of a session joined to a transaction owned by its
+# creator (see routers/batch.py): its commits are not final, so work done
+# after commit waits until the owner commits the outer transaction
+JOINED_TRANSACTION_KEY = "joined_transaction"
+
+
+async def get_db(connection: HTTPConnection):
+    # Writes of a /batch request share the batch's session and transaction
+    session = getattr(connection.state, "batch_session", None)
+    if session is not None:
+        yield session
+        return
     async with AsyncSessionLocal() as session:
         yield session
+
+
+# Schema revision check
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "alembic" / "versions"
+
+_REVISION_RE = re.compile(r"^revision\b[^=]*=\s*['\"](\w+)['\"]", re.M)
+_DOWN_REVISION_RE = re.compile(r"^down_revision\b[^=]*=\s*(.+)$", re.M)
+
+
+class SchemaRevisionError(RuntimeError):
+    pass
+
+
+def migration_heads() -> Set[str]:
+    """
+    Head revisions of the Alembic history.
+
+    Read from the revision identifiers in the migration files instead of
+    through alembic.script, which would add its import time to every worker
+    start.
+    """
+    revisions, parents = set(), set()
+    for path in MIGRATIONS_DIR.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        revision = _REVISION_RE.search(source)
+        if revision is None:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION_RE.search(source)
+        if down_revision:
+            parents.update(re.findall(r"['\"](\w+)['\"]", down_revision.group(1)))
+    return revisions - parents
+
+
+async def check_schema_revision():
+    """Fail fast unless the database is stamped with the migration head."""
+    heads = migration_heads()
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except Exception as exc:
+            raise SchemaRevisionError(
+                "Database has no alembic_version table. Initialise it with "
+                "`python -m app.cli init-db` or run `alembic upgrade head`."
+            ) from exc
+        current = set(result.scalars())
+    if current != heads:
+        raise SchemaRevisionError(
+            f"Database is at revision {', '.join(sorted(current)) or '<none>'}, "
+            f"code expects {', '.join(sorted(heads))}. Run `alembic upgrade head`."
+        )
@@ -1,37 +1,45 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from starlette.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.cache import CacheRegion
+from app.core.security import decode_access_token
 from app.database import get_db
 from app import crud, models
+from app.services.audit import current_actor
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+    connection: HTTPConnection,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
 ):
+    # Operations of a /batch request are authenticated once by the batch
+    batch_user = getattr(connection.state, "batch_user", None)
+    if batch_user is not None:
+        current_actor.set(batch_user.id)
+        return batch_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    payload = decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
+    email: str = payload.get("sub")
+    if email is None:
         raise credentials_exception
     
-    user = await crud.get_user_by_email(db, email)
+    user = await db.run_sync(crud.get_user_by_email, email)
     if user is None:
         raise credentials_exception
+    current_actor.set(user.id)
     return user
 
 
@@ -48,14 +56,11 @@ def get_sync_current_user(token: str = Depends(oauth2_scheme), db: Session = Dep
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    payload = decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
+    email: str = payload.get("sub")
+    if email is None:
         raise credentials_exception
     
     user = crud.get_user_by_email(db, email)
@@ -68,3 +73,70 @@ def get_sync_current_active_user(current_user: models.User = Depends(get_sync_cu
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+def get_user_from_token(db: Session, token: str):
+    """
+    Resolve an active user from a JWT, None if the token or user is invalid.
+
+    Used where the token cannot be sent as a header (WebSocket, EventSource).
+    """
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+    email = payload.get("sub")
+    if email is None:
+        return None
+    user = crud.get_user_by_email(db, email)
+    if user is None or not user.is_active:
+        return None
+    return user
+
+
+# Team scope of a user (own member id + direct report ids), shared by all
+# permission checks and invalidated on any write to users or team_members
+team_scope_cache = CacheRegion("team_scope", tables={"users", "team_members"})
+
+
+def _load_team_scope(db: Session, user_id: int):
+    current_member = crud.get_team_member_by_user_id(db, user_id)
+    if not current_member:
+        return None
+    report_ids = [
+        member_id for (member_id,) in db.query(models.TeamMember.id)
+        .filter(models.TeamMember.superior_id == current_member.id)
+        .all()
+    ]
+    return [current_member.id] + report_ids
+
+
+def check_team_member_access(
+    db: Session, current_user: models.User, team_member_id: int
+):
+    """
+    Raise 403 unless the user is an admin, the team member themself,
+    or the team member's direct superior.
+    """
+    member_ids = get_managed_member_ids(db, current_user)
+    if member_ids is not None and team_member_id not in member_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+
+
+def get_managed_member_ids(db: Session, current_user: models.User):
+    """
+    Team member ids visible to the user: None (no restriction) for admins,
+    otherwise the user's own profile and their direct reports.
+    """
+    if current_user.role == "admin":
+        return None
+
+    member_ids = team_scope_cache.get_or_set(
+        current_user.id, lambda: _load_team_scope(db, current_user.id)
+    )
+    if not member_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+    return member_ids
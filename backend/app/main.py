@@ -1,8 +1,37 @@
+import asyncio
+import logging
+import time
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import auth, users, team_members
-from app.models import Base
-from app.database import engine
+from app import IMPORT_STARTED
+from app.routers import (
+    auth,
+    users,
+    team_members,
+    key_results,
+    meeting_logs,
+    action_items,
+    events,
+    audit,
+    review_drafts,
+    media,
+    analytics,
+    batch,
+)
+from app.core.cache import poller as cache_poller
+from app.core.rate_limit import RateLimitMiddleware
+from app.services import archive as archive_service
+from app.services import audit as audit_service
+from app.services import backup as backup_service
+from app.services import media as media_service
+from app.services import review_drafts as review_drafts_service
+from app.services import sentiment as sentiment_service
+from app.services.events import broker
+from app.core.config import settings
+from app.database import engine, AsyncSessionLocal, check_schema_revision
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="AI Performance Hub API",
@@ -10,6 +39,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Added first so CORS stays the outermost middleware and 429 responses
+# carry the CORS headers the browser needs to read them
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
@@ -18,11 +50,62 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+background_tasks = []
+
+_import_seconds = time.perf_counter() - IMPORT_STARTED
+
+
 @app.on_event("startup")
 async def on_startup():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    started = time.perf_counter()
+    # Tables are created and changed by Alembic only, see `app.cli init-db`
+    if settings.DB_CHECK_MIGRATIONS:
+        await check_schema_revision()
+    broker.bind_loop(asyncio.get_running_loop())
+    audit_service.buffer.bind_loop(asyncio.get_running_loop())
+    background_tasks.append(
+        asyncio.create_task(audit_service.run_flusher(AsyncSessionLocal))
+    )
+    background_tasks.append(asyncio.create_task(cache_poller.run(engine)))
+    background_tasks.append(
+        asyncio.create_task(review_drafts_service.resume_stale_jobs(AsyncSessionLocal))
+    )
+    if settings.BACKUP_INTERVAL_HOURS > 0 and engine.dialect.name == "sqlite":
+        background_tasks.append(asyncio.create_task(backup_service.run_scheduler()))
+    if settings.ARCHIVE_INTERVAL_HOURS > 0:
+        background_tasks.append(
+            asyncio.create_task(archive_service.run_archiver(AsyncSessionLocal))
+        )
+    if settings.SENTIMENT_ANALYSIS_ENABLED:
+        background_tasks.append(
+            asyncio.create_task(sentiment_service.run_scorer(AsyncSessionLocal))
+        )
+    logger.info(
+        "Worker ready: imports %.0f ms, startup %.0f ms",
+        _import_seconds * 1000,
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    media_service.shutdown()
+    # Durable flush of audit entries still in memory
+    await audit_service.flush(AsyncSessionLocal)
+
 
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(team_members.router)
+app.include_router(key_results.router)
+app.include_router(meeting_logs.router)
+app.include_router(action_items.router)
+app.include_router(events.router)
+app.include_router(audit.router)
+app.include_router(review_drafts.router)
+app.include_router(media.router)
+app.include_router(analytics.router)
+app.include_router(batch.router)
@@ -1,6 +1,11 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Text, Date
+from sqlalchemy import (
+    Column, Integer, String, Boolean, DateTime, func, ForeignKey, Text, Date, Float,
+    Index,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+
+from app.core.encryption import EncryptedText
 
 Base = declarative_base()
 
@@ -31,7 +36,8 @@ class TeamMember(Base):
     start_date = Column(Date)
     profile_picture_url = Column(String)
     public_notes = Column(Text)
-    manager_notes = Column(Text)
+    # Encrypted at rest and only loaded (and decrypted) when accessed
+    manager_notes = deferred(Column(EncryptedText), group="private_notes")
     superior_id = Column(Integer, ForeignKey("team_members.id"), nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
@@ -53,7 +59,9 @@ class Objective(Base):
     __tablename__ = "objectives"
 
     id = Column(Integer, primary_key=True, index=True)
-    team_member_id = Column(Integer, ForeignKey("team_members.id"), nullable=False)
+    team_member_id = Column(
+        Integer, ForeignKey("team_members.id"), nullable=False, index=True
+    )
     title = Column(String, nullable=False)
     description = Column(Text)
     status = Column(String, default="Active")
@@ -75,8 +83,12 @@ class KeyResult(Base):
     title = Column(String, nullable=False)
     description = Column(Text)
     measurement_type = Column(String, nullable=False)
+    # Raw values as entered by the user
     target_value = Column(String)
     current_value = Column(String)
+    # Normalized values parsed from the raw text, used for SQL-side progress
+    target_numeric = Column(Float)
+    current_numeric = Column(Float)
     start_date = Column(Date)
     deadline = Column(Date, nullable=False)
     complexity = Column(String)
@@ -85,8 +97,40 @@ class KeyResult(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_key_results_objective_id_deadline", "objective_id", "deadline"),
+        Index("ix_key_results_status", "status"),
+    )
+
     # Relationships
     objective = relationship("Objective", back_populates="key_results")
+    history = relationship(
+        "KeyResultHistory", back_populates="key_result", cascade="all, delete-orphan"
+    )
+
+
+class KeyResultHistory(Base):
+    """Append-only log of KR values, one row per change of value or status."""
+    __tablename__ = "key_result_history"
+
+    id = Column(Integer, primary_key=True)
+    key_result_id = Column(
+        Integer, ForeignKey("key_results.id", ondelete="CASCADE"), nullable=False
+    )
+    recorded_at = Column(DateTime, nullable=False, default=func.now())
+    value = Column(Float)
+    status = Column(String)
+
+    # Relationships
+    key_result = relationship("KeyResult", back_populates="history")
+
+    __table_args__ = (
+        Index(
+            "ix_key_result_history_key_result_id_recorded_at",
+            "key_result_id",
+            "recorded_at",
+        ),
+    )
 
 
 class MeetingLog(Base):
@@ -96,8 +140,9 @@ class MeetingLog(Base):
     team_member_id = Column(Integer, ForeignKey("team_members.id"), nullable=False)
     manager_id = Column(Integer, ForeignKey("team_members.id"), nullable=False)
     meeting_date = Column(DateTime, nullable=False)
-    notes = Column(Text)
-    notes_structured = Column(Text)
+    # Encrypted at rest and only loaded (and decrypted) when accessed
+    notes = deferred(Column(EncryptedText), group="private_notes")
+    notes_structured = deferred(Column(EncryptedText), group="private_notes")
     ai_summary = Column(Text)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -107,6 +152,134 @@ class MeetingLog(Base):
     manager = relationship("TeamMember", foreign_keys=[manager_id], back_populates="managed_meetings")
     action_items = relationship("ActionItem", back_populates="meeting_log", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index(
+            "ix_meeting_logs_team_member_id_meeting_date",
+            "team_member_id",
+            "meeting_date",
+        ),
+    )
+
+
+# Archive tables: closed action items and old meeting logs are moved here by
+# app.services.archive so the live tables only hold recent rows. Columns
+# mirror the live tables, ids are kept.
+class MeetingLogArchive(Base):
+    __tablename__ = "meeting_logs_archive"
+    archived = True
+
+    id = Column(Integer, primary_key=True)
+    team_member_id = Column(Integer, nullable=False)
+    manager_id = Column(Integer, nullable=False)
+    meeting_date = Column(DateTime, nullable=False)
+    notes = deferred(Column(EncryptedText), group="private_notes")
+    notes_structured = deferred(Column(EncryptedText), group="private_notes")
+    ai_summary = Column(Text)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=func.now())
+
+    action_items = relationship(
+        "ActionItemArchive",
+        primaryjoin="MeetingLogArchive.id == foreign(ActionItemArchive.meeting_log_id)",
+        viewonly=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_meeting_logs_archive_team_member_id_meeting_date",
+            "team_member_id",
+            "meeting_date",
+        ),
+    )
+
+
+class ActionItemArchive(Base):
+    __tablename__ = "action_items_archive"
+    archived = True
+
+    id = Column(Integer, primary_key=True)
+    description = Column(Text, nullable=False)
+    assigned_to_member_id = Column(Integer)
+    assigned_by_manager_id = Column(Integer)
+    meeting_log_id = Column(Integer)
+    due_date = Column(Date)
+    status = Column(String)
+    priority = Column(String)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_action_items_archive_assignee_status_due_date",
+            "assigned_to_member_id",
+            "status",
+            "due_date",
+        ),
+        Index(
+            "ix_action_items_archive_assignee_updated_at",
+            "assigned_to_member_id",
+            "updated_at",
+        ),
+        Index("ix_action_items_archive_meeting_log_id", "meeting_log_id"),
+    )
+
+
+class MeetingSentiment(Base):
+    """
+    Language score of one meeting's notes (FR7.5, experimental and opt-in).
+
+    Rows are written by the background scorer and removed when the notes
+    change, which queues the meeting for scoring again. They stay when the
+    meeting is archived, so recomputed aggregates still count it; that is
+    why `meeting_log_id` has no foreign key to the live table.
+    """
+    __tablename__ = "meeting_sentiments"
+
+    meeting_log_id = Column(Integer, primary_key=True)
+    team_member_id = Column(Integer, nullable=False)
+    # First day of the meeting's month, the aggregate the score belongs to
+    period_start = Column(Date, nullable=False)
+    # -1 (negative) to 1 (positive); NULL when the meeting has no notes
+    score = Column(Float)
+    positive = Column(Integer, nullable=False, default=0)
+    negative = Column(Integer, nullable=False, default=0)
+    provider = Column(String, nullable=False)
+    scored_at = Column(DateTime, default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_meeting_sentiments_team_member_id_period_start",
+            "team_member_id",
+            "period_start",
+        ),
+    )
+
+
+class SentimentAggregate(Base):
+    """Monthly totals of meeting scores per member, read by the trend endpoint."""
+    __tablename__ = "sentiment_aggregates"
+
+    id = Column(Integer, primary_key=True)
+    team_member_id = Column(
+        Integer, ForeignKey("team_members.id", ondelete="CASCADE"), nullable=False
+    )
+    period_start = Column(Date, nullable=False)
+    meeting_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    positive = Column(Integer, nullable=False, default=0)
+    negative = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index(
+            "ix_sentiment_aggregates_team_member_id_period_start",
+            "team_member_id",
+            "period_start",
+            unique=True,
+        ),
+    )
+
 
 class ActionItem(Base):
     __tablename__ = "action_items"
@@ -126,3 +299,99 @@ class ActionItem(Base):
     assigned_to = relationship("TeamMember", foreign_keys=[assigned_to_member_id], back_populates="assigned_action_items")
     assigned_by = relationship("TeamMember", foreign_keys=[assigned_by_manager_id], back_populates="created_action_items")
     meeting_log = relationship("MeetingLog", back_populates="action_items")
+
+    __table_args__ = (
+        Index(
+            "ix_action_items_assignee_status_due_date",
+            "assigned_to_member_id",
+            "status",
+            "due_date",
+        ),
+        Index("ix_action_items_meeting_log_id", "meeting_log_id"),
+    )
+
+
+class ReviewDraft(Base):
+    """Performance review draft (FR7.4), generated by a background job."""
+    __tablename__ = "review_drafts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    team_member_id = Column(
+        Integer, ForeignKey("team_members.id", ondelete="CASCADE"), nullable=False
+    )
+    requested_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    period_start = Column(Date, nullable=False)
+    period_end = Column(Date, nullable=False)
+    # queued, running, done or failed; `stage` and `progress` (0-1) describe
+    # how far a running job got
+    status = Column(String, nullable=False, default="queued")
+    stage = Column(String)
+    progress = Column(Float, nullable=False, default=0.0)
+    content = Column(EncryptedText)
+    error = Column(Text)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_review_drafts_team_member_id_created_at", "team_member_id", "created_at"
+        ),
+    )
+
+
+class ReviewDigest(Base):
+    """
+    Condensed review material of one member for one month.
+
+    Reused by later drafts as long as `source_hash` matches the material the
+    month currently has.
+    """
+    __tablename__ = "review_digests"
+
+    id = Column(Integer, primary_key=True)
+    team_member_id = Column(
+        Integer, ForeignKey("team_members.id", ondelete="CASCADE"), nullable=False
+    )
+    period_start = Column(Date, nullable=False)
+    source_hash = Column(String, nullable=False)
+    content = Column(EncryptedText)
+    token_count = Column(Integer, nullable=False, default=0)
+    # True when the model summarized the material, False when it fit as is
+    summarized = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_review_digests_team_member_id_period_start",
+            "team_member_id",
+            "period_start",
+            unique=True,
+        ),
+    )
+
+
+class AuditLog(Base):
+    """Who changed what and when, written in batches by app.services.audit."""
+    __tablename__ = "audit_log"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    # Plain id rather than a foreign key so entries outlive deleted users
+    actor_user_id = Column(Integer)
+    action = Column(String, nullable=False)
+    entity_type = Column(String, nullable=False)
+    entity_id = Column(Integer)
+    changes = Column(Text)
+
+    __table_args__ = (
+        Index("ix_audit_log_entity", "entity_type", "entity_id", "id"),
+        Index("ix_audit_log_actor_user_id", "actor_user_id", "id"),
+    )
+
+
+class CacheVersion(Base):
+    """Per-table write counters used to invalidate caches across workers."""
+    __tablename__ = "cache_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,242 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud, models, schemas
+from ..dependencies import (
+    get_db,
+    get_current_active_user,
+    check_team_member_access,
+    get_managed_member_ids,
+)
+
+router = APIRouter(
+    prefix="/action-items",
+    tags=["action-items"],
+    responses={404: {"description": "Not found"}}
+)
+
+
+def _validate_status(action_item_status: Optional[str]):
+    if (
+        action_item_status is not None
+        and action_item_status not in crud.ACTION_ITEM_STATUSES
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"status must be one of: {', '.join(crud.ACTION_ITEM_STATUSES)}"
+        )
+
+
+def _can_access(action_item: models.ActionItem, member_ids: Optional[List[int]]):
+    if member_ids is None:
+        return True
+    return (
+        action_item.assigned_to_member_id in member_ids
+        or action_item.assigned_by_manager_id in member_ids
+    )
+
+
+def _get_action_item_or_404(db: Session, action_item_id: int, current_user: models.User,
+                            include_archived: bool = False):
+    action_item = crud.get_action_item(db, action_item_id)
+    if action_item is None and include_archived:
+        # Archived items are read-only, only reads fall back to the archive
+        action_item = crud.get_archived_action_item(db, action_item_id)
+    if action_item is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Action item not found"
+        )
+    if not _can_access(action_item, get_managed_member_ids(db, current_user)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+    return action_item
+
+
+def _check_meeting_log_access(
+    db: Session, current_user: models.User, meeting_log_id: int
+):
+    """An item can only be linked to meetings of accessible team members."""
+    meeting_log = crud.get_meeting_log(db, meeting_log_id)
+    if meeting_log is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Meeting log not found"
+        )
+    check_team_member_access(db, current_user, meeting_log.team_member_id)
+
+
+@router.post("/", response_model=schemas.ActionItem)
+async def create_action_item(
+    action_item: schemas.ActionItemCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Create an action item, optionally linked to a meeting log.
+
+    assigned_by_manager_id defaults to the current user's team member profile.
+    """
+    _validate_status(action_item.status)
+
+    def create(db: Session):
+        if action_item.assigned_to_member_id is not None:
+            check_team_member_access(
+                db, current_user, action_item.assigned_to_member_id
+            )
+
+        if action_item.meeting_log_id is not None:
+            _check_meeting_log_access(db, current_user, action_item.meeting_log_id)
+
+        if action_item.assigned_by_manager_id is None or current_user.role != "admin":
+            current_member = crud.get_team_member_by_user_id(db, current_user.id)
+            action_item.assigned_by_manager_id = (
+                current_member.id if current_member else None
+            )
+
+        return crud.create_action_item(db, action_item)
+
+    return await db.run_sync(create)
+
+
+@router.get("/", response_model=List[schemas.ActionItem])
+async def read_action_items(
+    assigned_to_member_id: Optional[int] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    include_archived: bool = False,
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get action items ordered by due date.
+
+    Managers only see items assigned to themselves or their direct reports.
+    Archived (long completed) items are included for status=Done or with
+    include_archived=true.
+    """
+    _validate_status(status_filter)
+
+    def load(db: Session):
+        if assigned_to_member_id is not None:
+            check_team_member_access(db, current_user, assigned_to_member_id)
+            member_ids = [assigned_to_member_id]
+        else:
+            member_ids = get_managed_member_ids(db, current_user)
+
+        return crud.get_action_items(
+            db,
+            assigned_to_member_ids=member_ids,
+            status=status_filter,
+            skip=skip,
+            limit=limit,
+            include_archived=include_archived,
+        )
+
+    return await db.run_sync(load)
+
+
+@router.get("/overdue", response_model=List[schemas.ActionItem])
+async def read_overdue_action_items(
+    today: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get open action items past their due date across the manager's team.
+
+    Admins get overdue items across the whole organization.
+    """
+    def load(db: Session):
+        member_ids = get_managed_member_ids(db, current_user)
+        return crud.get_overdue_action_items(
+            db, assigned_to_member_ids=member_ids, today=today
+        )
+
+    return await db.run_sync(load)
+
+
+@router.post("/batch-status", response_model=schemas.ActionItemStatusBatchResult)
+async def update_action_items_status(
+    batch: schemas.ActionItemStatusBatch,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Set the status of several action items in one transaction.
+
+    Items that do not exist or are not accessible are reported and skipped.
+    """
+    _validate_status(batch.status)
+    requested_ids = list(dict.fromkeys(batch.ids))
+
+    def update(db: Session):
+        member_ids = get_managed_member_ids(db, current_user)
+
+        found = {
+            item.id: item for item in crud.get_action_items_by_ids(db, requested_ids)
+        }
+        result = schemas.ActionItemStatusBatchResult()
+        for action_item_id in requested_ids:
+            action_item = found.get(action_item_id)
+            if action_item is None:
+                result.not_found.append(action_item_id)
+            elif not _can_access(action_item, member_ids):
+                result.forbidden.append(action_item_id)
+            else:
+                result.updated.append(action_item_id)
+
+        crud.update_action_items_status(db, result.updated, batch.status)
+        return result
+
+    return await db.run_sync(update)
+
+
+@router.get("/{action_item_id}", response_model=schemas.ActionItem)
+async def read_action_item(
+    action_item_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    return await db.run_sync(
+        _get_action_item_or_404, action_item_id, current_user, include_archived=True
+    )
+
+
+@router.put("/{action_item_id}", response_model=schemas.ActionItem)
+async def update_action_item(
+    action_item_id: int,
+    action_item: schemas.ActionItemUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    _validate_status(action_item.status)
+
+    def update(db: Session):
+        db_action_item = _get_action_item_or_404(db, action_item_id, current_user)
+        if action_item.assigned_to_member_id is not None:
+            check_team_member_access(
+                db, current_user, action_item.assigned_to_member_id
+            )
+        if action_item.meeting_log_id not in (None, db_action_item.meeting_log_id):
+            _check_meeting_log_access(db, current_user, action_item.meeting_log_id)
+        return crud.update_action_item(db, action_item_id, action_item)
+
+    return await db.run_sync(update)
+
+
+@router.delete("/{action_item_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_action_item(
+    action_item_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def delete(db: Session):
+        _get_action_item_or_404(db, action_item_id, current_user)
+        crud.delete_action_item(db, action_item_id)
+
+    await db.run_sync(delete)
+    return
@@ -0,0 +1,75 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud, models, schemas
+from ..core import singleflight
+from ..dependencies import get_db, get_current_active_user
+from ..services import analytics
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+    responses={404: {"description": "Not found"}}
+)
+
+
+def _analytics_root(db: Session, current_user: models.User, root_id: Optional[int]):
+    """The subtree root the user may analyze, None for the whole organization."""
+    if current_user.role != "admin":
+        current_member = crud.get_team_member_by_user_id(db, current_user.id)
+        if not current_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+            )
+        if root_id is not None and root_id != current_member.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions to view this hierarchy"
+            )
+        return current_member.id
+    if root_id is not None and crud.get_team_member(db, root_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found"
+        )
+    return root_id
+
+
+@router.get("/org", response_model=schemas.OrgAnalytics)
+async def read_org_analytics(
+    root_id: Optional[int] = None,
+    months: int = Query(12, ge=1, le=60),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    OKR and action item rollups across the reporting hierarchy.
+
+    Covers the whole organization, or the subtree below `root_id`: key
+    result progress percentiles by hierarchy depth, open and overdue action
+    items per manager and their team, and the monthly status mix of
+    objectives created in the last `months` months.
+
+    Admins can analyze any subtree; managers only their own.
+    Figures may be up to ANALYTICS_CACHE_SECONDS old.
+    """
+    root_id = await db.run_sync(_analytics_root, current_user, root_id)
+    return await analytics.org_analytics(db, root_id, months)
+
+
+@router.get("/request-coalescing", response_model=List[schemas.SingleFlightStats])
+def read_request_coalescing(
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Per computation: how often this worker ran it and how many concurrent
+    identical requests waited for a running computation instead.
+
+    Only admins can read the counters.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+    return singleflight.stats()
@@ -0,0 +1,46 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import crud, models, schemas
+from ..dependencies import get_db, get_current_active_user
+
+router = APIRouter(
+    prefix="/audit",
+    tags=["audit"],
+)
+
+
+@router.get("/", response_model=schemas.AuditLogPage)
+async def read_audit_logs(
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    actor_user_id: Optional[int] = None,
+    cursor: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get audit entries, newest first.
+
+    Only admins can read the audit trail. Pass the returned next_cursor to
+    fetch older entries. Entries are written in batches, so the most recent
+    changes may take a couple of seconds to appear.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    entries = await db.run_sync(
+        crud.get_audit_logs,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        actor_user_id=actor_user_id,
+        before_id=cursor,
+        limit=limit,
+    )
+    next_cursor = entries[-1].id if len(entries) == limit else None
+    return {"items": entries, "next_cursor": next_cursor}
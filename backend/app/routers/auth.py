@@ -1,28 +1,50 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
+from app import crud
 from app.schemas import UserCreate, Token
-from app.crud import create_user, authenticate_user, update_password
+from app.core.config import settings
+from app.core.rate_limit import RateLimit
 from app.core.security import create_access_token
 from app.database import get_db
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Every one of these requests runs bcrypt, limit them per IP and per account
+login_limit = RateLimit(
+    "login",
+    settings.RATE_LIMIT_LOGIN,
+    settings.RATE_LIMIT_LOGIN_ACCOUNT,
+    account_field="username",
+)
+register_limit = RateLimit(
+    "register", settings.RATE_LIMIT_REGISTER, settings.RATE_LIMIT_REGISTER_ACCOUNT
+)
+password_reset_limit = RateLimit(
+    "password_reset",
+    settings.RATE_LIMIT_PASSWORD_RESET,
+    settings.RATE_LIMIT_PASSWORD_RESET_ACCOUNT,
+)
 
-@router.post("/register")
+
+@router.post("/register", dependencies=[Depends(register_limit)])
 async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
-    db_user = await authenticate_user(db, user.email, user.password)
-    if db_user:
+    if await db.run_sync(crud.get_user_by_email, user.email):
         raise HTTPException(status_code=400, detail="Email already registered")
-    await create_user(db, user.email, user.password)
+    # Self-registered accounts always get the default role
+    await db.run_sync(
+        crud.create_user, UserCreate(email=user.email, password=user.password)
+    )
     return {"msg": "User registered successfully"}
 
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=[Depends(login_limit)])
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
 ):
-    user = await authenticate_user(db, form_data.username, form_data.password)
+    user = await db.run_sync(
+        crud.authenticate_user, form_data.username, form_data.password
+    )
     if not user:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     access_token = create_access_token(data={"sub": user.email})
@@ -34,9 +56,9 @@ async def logout():
     return {"msg": "Logged out"}
 
 
-@router.post("/reset-password")
+@router.post("/reset-password", dependencies=[Depends(password_reset_limit)])
 async def reset_password(user: UserCreate, db: AsyncSession = Depends(get_db)):
-    updated = await update_password(db, user.email, user.password)
+    updated = await db.run_sync(crud.update_password, user.email, user.password)
     if not updated:
         raise HTTPException(status_code=404, detail="User not found")
     return {"msg": "Password reset successful"}
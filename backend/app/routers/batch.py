@@ -0,0 +1,202 @@
+import asyncio
+import json
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models, schemas
+from ..core import cache
+from ..core.config import settings
+from ..database import JOINED_TRANSACTION_KEY, engine
+from ..dependencies import get_current_active_user
+from ..services import audit, events
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["batch"],
+    responses={404: {"description": "Not found"}}
+)
+
+READ_METHODS = {"GET"}
+WRITE_METHODS = {"PUT"}
+
+# Request headers passed on to the operations; the body is always JSON
+FORWARDED_HEADERS = {b"authorization", b"x-forwarded-for", b"accept-language"}
+
+NOT_EXECUTED = schemas.BatchOperationResult(
+    status=status.HTTP_424_FAILED_DEPENDENCY,
+    body={"detail": "Not executed, an earlier write of the batch failed"},
+)
+
+
+def _validate(operations: List[schemas.BatchOperation]):
+    if len(operations) > settings.BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_OPERATIONS} operations per batch"
+        )
+    for index, operation in enumerate(operations):
+        operation.method = operation.method.upper()
+        if operation.method not in READ_METHODS | WRITE_METHODS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Operation {index}: method must be one of GET, PUT"
+            )
+        path = operation.path.split("?")[0]
+        if not path.startswith("/") or path.rstrip("/") == router.prefix:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Operation {index}: invalid path"
+            )
+
+
+async def _dispatch(request: Request, operation: schemas.BatchOperation, state: dict):
+    """Run one operation through the application in-process."""
+    path, _, query = operation.path.partition("?")
+    body = json.dumps(operation.body).encode() if operation.body is not None else b""
+    headers = [
+        (name, value) for name, value in request.scope["headers"]
+        if name in FORWARDED_HEADERS
+    ]
+    if body:
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": operation.method,
+        "scheme": request.scope["scheme"],
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        "state": state,
+    }
+
+    finished = asyncio.Event()
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    content_type = b""
+    chunks = []
+
+    async def send(message):
+        nonlocal response_status, content_type
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+            content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        return schemas.BatchOperationResult(
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            body={"detail": "Internal Server Error"},
+        )
+    finally:
+        finished.set()
+
+    content = b"".join(chunks)
+    if content and content_type.startswith(b"application/json"):
+        body = json.loads(content)
+    else:
+        body = content.decode() or None
+    return schemas.BatchOperationResult(status=response_status, body=body)
+
+
+async def _run_writes(request: Request, operations, current_user: models.User):
+    """
+    Run the writes in order in one transaction, stopping at the first
+    failure, in which case every write of the batch is rolled back.
+    """
+    results = []
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        # Commits made by the routes stay inside the outer transaction
+        async with AsyncSession(
+            bind=connection,
+            join_transaction_mode="rollback_only",
+            expire_on_commit=False,
+            info={JOINED_TRANSACTION_KEY: True},
+        ) as session:
+            with events.deferred_publishing() as pending_events:
+                for operation in operations:
+                    if results and results[-1].status >= 400:
+                        results.append(NOT_EXECUTED)
+                        continue
+                    state = {"batch_user": current_user, "batch_session": session}
+                    results.append(await _dispatch(request, operation, state))
+
+            committed = all(result.status < 400 for result in results)
+            if committed and transaction.is_active:
+                await transaction.commit()
+                cache.invalidate_committed(session.sync_session)
+                audit.buffer_committed(session.sync_session)
+                events.publish_deferred(pending_events)
+            else:
+                committed = False
+                if transaction.is_active:
+                    await transaction.rollback()
+    return committed, results
+
+
+@router.post("", response_model=schemas.BatchResult)
+async def run_batch(
+    batch: schemas.BatchRequest,
+    request: Request,
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Run several GET and PUT operations in one round trip.
+
+    The batch is authenticated once and every operation runs with the same
+    user and permissions as a separate request. Writes run first, in order,
+    in one transaction: if one fails, the following writes are skipped (424)
+    and all writes are rolled back. Reads then run concurrently and see the
+    committed writes. Responses are returned in the order of the operations.
+    """
+    operations = batch.operations
+    _validate(operations)
+
+    writes = [
+        index for index, operation in enumerate(operations)
+        if operation.method in WRITE_METHODS
+    ]
+    reads = [
+        index for index, operation in enumerate(operations)
+        if operation.method in READ_METHODS
+    ]
+    responses = [None] * len(operations)
+
+    committed = True
+    if writes:
+        committed, results = await _run_writes(
+            request, [operations[index] for index in writes], current_user
+        )
+        for index, result in zip(writes, results):
+            responses[index] = result
+
+    results = await asyncio.gather(*(
+        _dispatch(request, operations[index], {"batch_user": current_user})
+        for index in reads
+    ))
+    for index, result in zip(reads, results):
+        responses[index] = result
+
+    return schemas.BatchResult(committed=committed, responses=responses)
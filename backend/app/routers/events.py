@@ -0,0 +1,144 @@
+import asyncio
+import json
+from typing import Optional
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud
+from ..database import get_db
+from ..dependencies import get_user_from_token
+from ..services.events import ADMIN_CHANNEL, broker, team_channel
+
+router = APIRouter(
+    prefix="/events",
+    tags=["events"],
+)
+
+# Interval of keep-alive messages so proxies do not close idle streams
+KEEPALIVE_SECONDS = 15
+
+
+def _resolve_channels(db: Session, token: str):
+    user = get_user_from_token(db, token)
+    if user is None:
+        return None
+
+    channels = []
+    if user.role == "admin":
+        channels.append(ADMIN_CHANNEL)
+    member = crud.get_team_member_by_user_id(db, user.id)
+    if member is not None:
+        channels.append(team_channel(member.id))
+    return channels
+
+
+async def _authenticate(db: AsyncSession, token: Optional[str]):
+    if not token:
+        return None
+    channels = await db.run_sync(_resolve_channels, token)
+    return channels or None
+
+
+def _bearer_token(request: Request, token: Optional[str]):
+    authorization = request.headers.get("Authorization", "")
+    if authorization.lower().startswith("bearer "):
+        return authorization[7:]
+    return token
+
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream change events as JSON messages.
+
+    Browsers cannot set headers on WebSockets, so the JWT is passed as the
+    `token` query parameter.
+    """
+    channels = await _authenticate(db, token)
+    await db.close()
+    if channels is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    async with broker.subscribe(channels) as queue:
+        receiver = asyncio.ensure_future(websocket.receive())
+        # Kept across iterations: cancelling a getter that already took an
+        # event off the queue would drop that event
+        getter = asyncio.ensure_future(queue.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {getter, receiver},
+                    timeout=KEEPALIVE_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if receiver in done:
+                    if receiver.result()["type"] == "websocket.disconnect":
+                        break
+                    receiver = asyncio.ensure_future(websocket.receive())
+                if getter in done:
+                    await websocket.send_text(json.dumps(getter.result(), default=str))
+                    getter = asyncio.ensure_future(queue.get())
+                if not done:
+                    await websocket.send_text(json.dumps({"type": "keepalive"}))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receiver.cancel()
+            getter.cancel()
+
+
+@router.get("/stream")
+async def events_stream(
+    request: Request,
+    token: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream change events as Server-Sent Events.
+
+    The JWT is read from the Authorization header, or from the `token`
+    query parameter for EventSource clients.
+    """
+    channels = await _authenticate(db, _bearer_token(request, token))
+    await db.close()
+    if channels is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    async def event_source():
+        async with broker.subscribe(channels) as queue:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
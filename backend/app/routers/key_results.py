@@ -0,0 +1,247 @@
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud, models, schemas
+from ..dependencies import (
+    get_db,
+    get_current_active_user,
+    check_team_member_access,
+    get_managed_member_ids,
+)
+from ..services.key_result_values import MEASUREMENT_TYPES
+
+router = APIRouter(
+    prefix="/key-results",
+    tags=["key-results"],
+    responses={404: {"description": "Not found"}}
+)
+
+
+def _get_objective_or_404(db: Session, objective_id: int):
+    objective = crud.get_objective(db, objective_id)
+    if objective is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Objective not found"
+        )
+    return objective
+
+
+def _get_key_result_or_404(db: Session, key_result_id: int):
+    key_result = crud.get_key_result(db, key_result_id)
+    if key_result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Key result not found"
+        )
+    return key_result
+
+
+def _validate_measurement_type(measurement_type: Optional[str]):
+    if measurement_type is not None and measurement_type not in MEASUREMENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"measurement_type must be one of: {', '.join(MEASUREMENT_TYPES)}"
+        )
+
+
+@router.post("/", response_model=schemas.KeyResult)
+async def create_key_result(
+    key_result: schemas.KeyResultCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Create a key result for an objective.
+
+    The raw target/current values are kept as entered and parsed into
+    numeric columns according to the measurement type.
+    """
+    _validate_measurement_type(key_result.measurement_type)
+
+    def create(db: Session):
+        objective = _get_objective_or_404(db, key_result.objective_id)
+        check_team_member_access(db, current_user, objective.team_member_id)
+        return crud.create_key_result(db, key_result)
+
+    return await db.run_sync(create)
+
+
+@router.get("/", response_model=List[schemas.KeyResult])
+async def read_key_results(
+    objective_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get the key results of an objective ordered by deadline.
+    """
+    def load(db: Session):
+        objective = _get_objective_or_404(db, objective_id)
+        check_team_member_access(db, current_user, objective.team_member_id)
+        return crud.get_key_results(db, objective_id)
+
+    return await db.run_sync(load)
+
+
+@router.get("/progress", response_model=List[schemas.KeyResultProgress])
+async def read_key_results_progress(
+    objective_id: Optional[int] = None,
+    at_risk_only: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get percent-complete and at-risk flags computed in the database.
+
+    Without objective_id, managers get the KRs of themselves and their
+    direct reports, admins get all KRs.
+    """
+    def load(db: Session):
+        team_member_ids = None
+        if objective_id is not None:
+            objective = _get_objective_or_404(db, objective_id)
+            check_team_member_access(db, current_user, objective.team_member_id)
+        else:
+            team_member_ids = get_managed_member_ids(db, current_user)
+
+        return crud.get_key_results_progress(
+            db,
+            objective_id=objective_id,
+            team_member_ids=team_member_ids,
+            at_risk_only=at_risk_only,
+        )
+
+    return await db.run_sync(load)
+
+
+@router.get("/rollup", response_model=List[schemas.KeyResultRollup])
+async def read_key_results_rollup(
+    group_by: str = Query("team_member", pattern="^(team_member|manager)$"),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get KR progress aggregated per team member or per manager.
+
+    Admins see the whole organization, managers only their own team.
+    """
+    def load(db: Session):
+        team_member_ids = get_managed_member_ids(db, current_user)
+        return crud.get_key_results_rollup(
+            db, group_by=group_by, team_member_ids=team_member_ids
+        )
+
+    return await db.run_sync(load)
+
+
+@router.get("/history", response_model=List[schemas.KeyResultHistorySeries])
+async def read_key_results_history(
+    key_result_ids: List[int] = Query(..., max_length=200),
+    bucket: str = Query("week", pattern="^(day|week|month)$"),
+    since: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get bucketed progress series for several key results in one request.
+
+    Each point aggregates the recorded values of one KR within a bucket.
+    """
+    def load(db: Session):
+        member_ids = crud.get_key_results_team_member_ids(db, key_result_ids)
+        missing = set(key_result_ids) - member_ids.keys()
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Key results not found: {sorted(missing)}"
+            )
+
+        allowed_ids = get_managed_member_ids(db, current_user)
+        if allowed_ids is not None and not set(member_ids.values()) <= set(allowed_ids):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+            )
+        return crud.get_key_results_history(
+            db, key_result_ids, bucket=bucket, since=since
+        )
+
+    series = {key_result_id: [] for key_result_id in key_result_ids}
+    for row in await db.run_sync(load):
+        series[row.key_result_id].append(row)
+
+    return [
+        {"key_result_id": key_result_id, "points": points}
+        for key_result_id, points in series.items()
+    ]
+
+
+@router.get("/search", response_model=List[schemas.KeyResult])
+async def search_key_results(
+    q: str = Query(..., min_length=2),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Search key results by their own or their objective's title and description.
+    """
+    def load(db: Session):
+        team_member_ids = get_managed_member_ids(db, current_user)
+        return crud.search_key_results(
+            db, q, team_member_ids=team_member_ids, limit=limit
+        )
+
+    return await db.run_sync(load)
+
+
+@router.get("/{key_result_id}", response_model=schemas.KeyResult)
+async def read_key_result(
+    key_result_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def load(db: Session):
+        key_result = _get_key_result_or_404(db, key_result_id)
+        check_team_member_access(db, current_user, key_result.objective.team_member_id)
+        return key_result
+
+    return await db.run_sync(load)
+
+
+@router.put("/{key_result_id}", response_model=schemas.KeyResult)
+async def update_key_result(
+    key_result_id: int,
+    key_result: schemas.KeyResultUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Update a key result, typically its current value and status.
+    """
+    _validate_measurement_type(key_result.measurement_type)
+
+    def update(db: Session):
+        db_key_result = _get_key_result_or_404(db, key_result_id)
+        team_member_id = db_key_result.objective.team_member_id
+        check_team_member_access(db, current_user, team_member_id)
+        return crud.update_key_result(db, key_result_id, key_result)
+
+    return await db.run_sync(update)
+
+
+@router.delete("/{key_result_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_key_result(
+    key_result_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def delete(db: Session):
+        db_key_result = _get_key_result_or_404(db, key_result_id)
+        team_member_id = db_key_result.objective.team_member_id
+        check_team_member_access(db, current_user, team_member_id)
+        crud.delete_key_result(db, key_result_id)
+
+    await db.run_sync(delete)
+    return
@@ -0,0 +1,44 @@
+import re
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import FileResponse
+
+from ..services import media
+
+router = APIRouter(
+    prefix="/media",
+    tags=["media"],
+    responses={404: {"description": "Not found"}}
+)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# Content-addressed files never change, so clients may cache them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.get("/profile-pictures/{digest}")
+def read_profile_picture(
+    digest: str,
+    size: int = Query(media.DEFAULT_THUMBNAIL_SIZE),
+):
+    """
+    Serve a profile picture thumbnail.
+
+    Not authenticated so that plain <img> tags work: the SHA-256 in the URL
+    is only known to clients that were allowed to read the team member.
+    """
+    if not _DIGEST_RE.match(digest) or size not in media.THUMBNAIL_SIZES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
+        )
+    path = media.thumbnail_path(digest, size)
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
+        )
+    # FileResponse streams the file with sendfile where the server supports it
+    return FileResponse(
+        path,
+        media_type="image/webp",
+        headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+    )
@@ -0,0 +1,162 @@
+import base64
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud, models, schemas
+from ..dependencies import get_db, get_current_active_user, check_team_member_access
+
+router = APIRouter(
+    prefix="/meeting-logs",
+    tags=["meeting-logs"],
+    responses={404: {"description": "Not found"}}
+)
+
+
+def _encode_cursor(meeting_log: models.MeetingLog) -> str:
+    raw = f"{meeting_log.meeting_date.isoformat()}|{meeting_log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode()).decode()
+        meeting_date, meeting_log_id = decoded.split("|")
+        return datetime.fromisoformat(meeting_date), int(meeting_log_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def _get_meeting_log_or_404(
+    db: Session, meeting_log_id: int, include_archived: bool = False
+):
+    meeting_log = crud.get_meeting_log(db, meeting_log_id)
+    if meeting_log is None and include_archived:
+        # Archived meetings are read-only, only reads fall back to the archive
+        meeting_log = crud.get_archived_meeting_log(db, meeting_log_id)
+    if meeting_log is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Meeting log not found"
+        )
+    return meeting_log
+
+
+@router.post("/", response_model=schemas.MeetingLog)
+async def create_meeting_log(
+    meeting_log: schemas.MeetingLogCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Log a 1-on-1 meeting with a team member.
+
+    The manager defaults to the current user's team member profile.
+    """
+    def create(db: Session):
+        check_team_member_access(db, current_user, meeting_log.team_member_id)
+
+        manager_id = meeting_log.manager_id
+        if manager_id is None or current_user.role != "admin":
+            current_member = crud.get_team_member_by_user_id(db, current_user.id)
+            if not current_member:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=(
+                        "manager_id is required for users without a team member "
+                        "profile"
+                    ),
+                )
+            manager_id = current_member.id
+
+        db_meeting_log = crud.create_meeting_log(db, meeting_log, manager_id=manager_id)
+        return schemas.MeetingLog.model_validate(db_meeting_log)
+
+    return await db.run_sync(create)
+
+
+@router.get("/", response_model=schemas.MeetingLogPage)
+async def read_meeting_logs(
+    team_member_id: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Get the meeting history of a team member, newest first.
+
+    Pass the returned next_cursor to fetch the following page.
+    """
+    before = _decode_cursor(cursor) if cursor else None
+
+    def load(db: Session):
+        check_team_member_access(db, current_user, team_member_id)
+        meeting_logs = crud.get_meeting_logs(
+            db,
+            team_member_id,
+            date_from=date_from,
+            date_to=date_to,
+            before=before,
+            limit=limit,
+        )
+        next_cursor = None
+        if len(meeting_logs) == limit:
+            next_cursor = _encode_cursor(meeting_logs[-1])
+        return schemas.MeetingLogPage(
+            items=[schemas.MeetingLog.model_validate(log) for log in meeting_logs],
+            next_cursor=next_cursor,
+        )
+
+    return await db.run_sync(load)
+
+
+@router.get("/{meeting_log_id}", response_model=schemas.MeetingLog)
+async def read_meeting_log(
+    meeting_log_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def load(db: Session):
+        meeting_log = _get_meeting_log_or_404(db, meeting_log_id, include_archived=True)
+        check_team_member_access(db, current_user, meeting_log.team_member_id)
+        return schemas.MeetingLog.model_validate(meeting_log)
+
+    return await db.run_sync(load)
+
+
+@router.put("/{meeting_log_id}", response_model=schemas.MeetingLog)
+async def update_meeting_log(
+    meeting_log_id: int,
+    meeting_log: schemas.MeetingLogUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def update(db: Session):
+        db_meeting_log = _get_meeting_log_or_404(db, meeting_log_id)
+        check_team_member_access(db, current_user, db_meeting_log.team_member_id)
+        return schemas.MeetingLog.model_validate(
+            crud.update_meeting_log(db, meeting_log_id, meeting_log)
+        )
+
+    return await db.run_sync(update)
+
+
+@router.delete("/{meeting_log_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_meeting_log(
+    meeting_log_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def delete(db: Session):
+        db_meeting_log = _get_meeting_log_or_404(db, meeting_log_id)
+        check_team_member_access(db, current_user, db_meeting_log.team_member_id)
+        crud.delete_meeting_log(db, meeting_log_id)
+
+    await db.run_sync(delete)
+    return
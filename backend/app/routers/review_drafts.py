@@ -0,0 +1,104 @@
+from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import crud, models, schemas
+from ..database import AsyncSessionLocal
+from ..dependencies import get_db, get_current_active_user, check_team_member_access
+from ..services import review_drafts
+
+router = APIRouter(
+    prefix="/review-drafts",
+    tags=["review-drafts"],
+    responses={404: {"description": "Not found"}}
+)
+
+MAX_PERIOD_DAYS = 2 * 366
+
+
+def _get_review_draft_or_404(
+    db: Session, review_draft_id: int, current_user: models.User
+):
+    review_draft = crud.get_review_draft(db, review_draft_id)
+    if review_draft is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Review draft not found"
+        )
+    check_team_member_access(db, current_user, review_draft.team_member_id)
+    return review_draft
+
+
+@router.post(
+    "/", response_model=schemas.ReviewDraft, status_code=status.HTTP_202_ACCEPTED
+)
+async def create_review_draft(
+    review_draft: schemas.ReviewDraftCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Start generating a performance review draft for a member and period.
+
+    Returns immediately with a queued draft; poll GET /review-drafts/{id} or
+    listen for review_draft.updated events until its status is done or failed.
+    """
+    if review_draft.period_end < review_draft.period_start:
+        raise HTTPException(
+            status_code=400, detail="period_end must not be before period_start"
+        )
+    if (review_draft.period_end - review_draft.period_start).days > MAX_PERIOD_DAYS:
+        raise HTTPException(
+            status_code=400, detail="Review period is limited to two years"
+        )
+
+    def create(db: Session):
+        check_team_member_access(db, current_user, review_draft.team_member_id)
+        return crud.create_review_draft(
+            db, review_draft, requested_by_user_id=current_user.id
+        )
+
+    db_review_draft = await db.run_sync(create)
+    background_tasks.add_task(
+        review_drafts.run_job, db_review_draft.id, AsyncSessionLocal
+    )
+    return db_review_draft
+
+
+@router.get("/", response_model=List[schemas.ReviewDraft])
+async def read_review_drafts(
+    team_member_id: int,
+    skip: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def load(db: Session):
+        check_team_member_access(db, current_user, team_member_id)
+        return crud.get_review_drafts(db, team_member_id, skip=skip, limit=limit)
+
+    return await db.run_sync(load)
+
+
+@router.get("/{review_draft_id}", response_model=schemas.ReviewDraft)
+async def read_review_draft(
+    review_draft_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    return await db.run_sync(_get_review_draft_or_404, review_draft_id, current_user)
+
+
+@router.delete("/{review_draft_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_review_draft(
+    review_draft_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    def delete(db: Session):
+        _get_review_draft_or_404(db, review_draft_id, current_user)
+        crud.delete_review_draft(db, review_draft_id)
+
+    await db.run_sync(delete)
+    return
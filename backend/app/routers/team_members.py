@@ -1,9 +1,16 @@
+from datetime import date
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .. import crud, models, schemas
-from ..dependencies import get_db, get_current_user, get_current_active_user
+from ..core.cache import CacheRegion
+from ..core.config import settings
+from ..core.singleflight import SingleFlight
+from ..dependencies import get_db, get_current_active_user
+from ..services import media, sentiment
+from ..sql_functions import months_back
 
 router = APIRouter(
     prefix="/team-members",
@@ -11,11 +18,84 @@ router = APIRouter(
     responses={404: {"description": "Not found"}}
 )
 
+# Serialized hierarchies keyed by (superior_id, include_inactive)
+hierarchy_cache = CacheRegion("team_hierarchy", tables={"team_members"})
+# Concurrent cache misses of the same hierarchy share one load
+hierarchy_flight = SingleFlight("team_hierarchy")
+
+TEAM_MEMBER_FIELDS = tuple(schemas.TeamMember.model_fields)
+# The hierarchy is cached, so it leaves out the decrypted manager notes
+HIERARCHY_FIELDS = tuple(
+    name for name in TEAM_MEMBER_FIELDS if name != "manager_notes"
+)
+
+FIELDS_DESCRIPTION = (
+    "Comma separated team member fields to return, all by default; "
+    "id is always included"
+)
+INCLUDE_DESCRIPTION = (
+    "Comma separated relations to embed: " + ", ".join(crud.TEAM_MEMBER_INCLUDES)
+)
+
+
+def _split(value: Optional[str], allowed, parameter: str):
+    names = [name.strip() for name in value.split(",") if name.strip()] if value else []
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown {parameter}: {', '.join(unknown)}"
+        )
+    return names
+
+
+def _parse_fieldset(fields: Optional[str], include: Optional[str]):
+    """Validated (fields, include) from the query; fields is None for all fields."""
+    field_names = None
+    if fields is not None:
+        field_names = _split(fields, TEAM_MEMBER_FIELDS, "fields")
+    return field_names, tuple(_split(include, crud.TEAM_MEMBER_INCLUDES, "include"))
+
+
+def _serialize(team_member: models.TeamMember, fields, include,
+               latest_meetings=None) -> schemas.TeamMemberSparse:
+    # Only reads attributes that were loaded, so no lazy loads per member
+    names = TEAM_MEMBER_FIELDS if fields is None else fields
+    data = {name: getattr(team_member, name) for name in names}
+    data["id"] = team_member.id
+    if "objectives" in include:
+        data["objectives"] = team_member.objectives
+    if "open_action_items" in include:
+        data["open_action_items"] = team_member.assigned_action_items
+    if "latest_meeting" in include:
+        data["latest_meeting"] = latest_meetings.get(team_member.id)
+    # Validated while the session is usable, unset fields stay out of the response
+    return schemas.TeamMemberSparse.model_validate(data)
+
+
+def _hierarchy_node(team_member: models.TeamMember) -> dict:
+    data = {name: getattr(team_member, name) for name in HIERARCHY_FIELDS}
+    data["direct_reports"] = [
+        _hierarchy_node(report) for report in team_member.direct_reports
+    ]
+    return data
+
+
+def _serialize_all(db: Session, team_members, fields, include):
+    latest_meetings = None
+    if "latest_meeting" in include:
+        latest_meetings = crud.get_latest_meeting_logs(
+            db, [member.id for member in team_members]
+        )
+    return [
+        _serialize(member, fields, include, latest_meetings) for member in team_members
+    ]
+
 
 @router.post("/", response_model=schemas.TeamMember)
-def create_team_member(
+async def create_team_member(
     team_member: schemas.TeamMemberCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -29,24 +109,33 @@ def create_team_member(
             detail="Not enough permissions"
         )
         
-    # Check if email already exists
-    existing_member = crud.get_team_member_by_email(db, team_member.email)
-    if existing_member:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered for a team member"
-        )
-    
-    return crud.create_team_member(db, team_member)
+    def create(db: Session):
+        # Check if email already exists
+        existing_member = crud.get_team_member_by_email(db, team_member.email)
+        if existing_member:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered for a team member"
+            )
+        db_team_member = crud.create_team_member(db, team_member)
+        return schemas.TeamMember.model_validate(db_team_member)
 
+    return await db.run_sync(create)
 
-@router.get("/", response_model=List[schemas.TeamMember])
-def read_team_members(
+
+@router.get(
+    "/",
+    response_model=List[schemas.TeamMemberSparse],
+    response_model_exclude_unset=True,
+)
+async def read_team_members(
     skip: int = 0,
     limit: int = 100,
     superior_id: Optional[int] = None,
     include_inactive: bool = False,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -55,28 +144,38 @@ def read_team_members(
     Admins can see all team members.
     Managers can see their direct reports.
     Filter by superior_id to get team members under a specific manager.
+    Use fields= to select the returned columns and include= to embed
+    objectives, open action items or the latest meeting.
     """
-    # If manager, only allow access to direct reports unless admin
-    current_member = crud.get_team_member_by_user_id(db, current_user.id)
-    
-    if current_user.role != "admin":
-        if not current_member:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions"
-            )
-        # Override superior_id to only show direct reports for managers
-        superior_id = current_member.id
-    
-    team_members = crud.get_team_members(db, skip=skip, limit=limit, superior_id=superior_id, include_inactive=include_inactive)
-    return team_members
+    field_names, include_names = _parse_fieldset(fields, include)
+
+    def load(db: Session, superior_id: Optional[int]):
+        # If manager, only allow access to direct reports unless admin
+        current_member = crud.get_team_member_by_user_id(db, current_user.id)
+
+        if current_user.role != "admin":
+            if not current_member:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not enough permissions"
+                )
+            # Override superior_id to only show direct reports for managers
+            superior_id = current_member.id
+
+        team_members = crud.get_team_members(
+            db, skip=skip, limit=limit, superior_id=superior_id,
+            include_inactive=include_inactive, fields=field_names, include=include_names
+        )
+        return _serialize_all(db, team_members, field_names, include_names)
+
+    return await db.run_sync(load, superior_id)
 
 
 @router.get("/hierarchy", response_model=List[schemas.TeamMemberWithReports])
-def read_team_members_hierarchy(
+async def read_team_members_hierarchy(
     superior_id: Optional[int] = None,
     include_inactive: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -84,9 +183,11 @@ def read_team_members_hierarchy(
     
     Admins can see all hierarchies.
     Managers can only see their own hierarchy.
+    manager_notes is always null here, the hierarchy is cached in memory
+    without them; read a member to get its notes.
     """
     # If manager, only allow access to their own hierarchy unless admin
-    current_member = crud.get_team_member_by_user_id(db, current_user.id)
+    current_member = await db.run_sync(crud.get_team_member_by_user_id, current_user.id)
     
     if current_user.role != "admin":
         if not current_member:
@@ -102,28 +203,55 @@ def read_team_members_hierarchy(
             )
         superior_id = current_member.id
     
-    team_members = crud.get_team_members_with_hierarchy(db, superior_id=superior_id, include_inactive=include_inactive)
-    return team_members
+    def load(db: Session):
+        team_members = crud.get_team_members_with_hierarchy(
+            db, superior_id=superior_id, include_inactive=include_inactive,
+            with_notes=False
+        )
+        return [
+            schemas.TeamMemberWithReports.model_validate(_hierarchy_node(member))
+            .model_dump()
+            for member in team_members
+        ]
+
+    # superior_id is already narrowed to what the user may see
+    key = (superior_id, include_inactive)
+    return await hierarchy_cache.get_or_set_async(
+        key, lambda: hierarchy_flight.do(key, lambda: db.run_sync(load))
+    )
 
 
 @router.get("/me", response_model=schemas.TeamMember)
-def read_team_member_me(
-    db: Session = Depends(get_db),
+async def read_team_member_me(
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
     Get the current user's team member profile if it exists.
     """
-    team_member = crud.get_team_member_by_user_id(db, current_user.id)
-    if team_member is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found for current user")
-    return team_member
+    def load(db: Session):
+        team_member = crud.get_team_member_by_user_id(db, current_user.id)
+        if team_member is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Team member not found for current user",
+            )
+        # Validated inside the session, manager_notes is loaded on access
+        return schemas.TeamMember.model_validate(team_member)
+
+    return await db.run_sync(load)
 
 
-@router.get("/{team_member_id}", response_model=schemas.TeamMember)
-def read_team_member(
+@router.get(
+    "/{team_member_id}",
+    response_model=schemas.TeamMemberSparse,
+    response_model_exclude_unset=True,
+)
+async def read_team_member(
     team_member_id: int,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -131,73 +259,196 @@ def read_team_member(
     
     Admins can see any team member.
     Managers can only see themselves and their direct reports.
+    Accepts the same fields= and include= parameters as the list.
     """
-    team_member = crud.get_team_member(db, team_member_id)
-    
-    if team_member is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found")
-    
-    # Check permissions
-    if current_user.role != "admin":
-        current_member = crud.get_team_member_by_user_id(db, current_user.id)
-        if not current_member:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-            
-        # Only allow access to self or direct reports
-        is_self = team_member.user_id == current_user.id
-        is_direct_report = team_member.superior_id == current_member.id
-        
-        if not (is_self or is_direct_report):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    
-    return team_member
+    field_names, include_names = _parse_fieldset(fields, include)
 
+    def load(db: Session):
+        team_member = crud.get_team_member(
+            db, team_member_id, fields=field_names, include=include_names
+        )
+        if team_member is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found"
+            )
 
-@router.put("/{team_member_id}", response_model=schemas.TeamMember)
-def update_team_member(
+        # Check permissions
+        if current_user.role != "admin":
+            current_member = crud.get_team_member_by_user_id(db, current_user.id)
+            if not current_member:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not enough permissions",
+                )
+
+            # Only allow access to self or direct reports
+            is_self = team_member.user_id == current_user.id
+            is_direct_report = team_member.superior_id == current_member.id
+
+            if not (is_self or is_direct_report):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not enough permissions",
+                )
+
+        return _serialize_all(db, [team_member], field_names, include_names)[0]
+
+    return await db.run_sync(load)
+
+
+@router.get("/{team_member_id}/sentiment-trend", response_model=schemas.SentimentTrend)
+async def read_sentiment_trend(
     team_member_id: int,
-    team_member: schemas.TeamMemberUpdate,
-    db: Session = Depends(get_db),
+    months: int = Query(12, ge=2, le=36),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
-    Update a team member.
-    
-    Admins can update any team member.
-    Managers can only update their direct reports.
+    Experimental trend of the language in a member's meeting notes (FR7.5).
+
+    Only available when the organisation opted in, and only to admins and
+    the member's manager, never to the member themself. Returns monthly
+    positive/neutral/negative indicators, not scores.
+    """
+    if not settings.SENTIMENT_ANALYSIS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sentiment analysis is not enabled",
+        )
+
+    def load(db: Session):
+        _get_editable_team_member_or_404(db, current_user, team_member_id)
+
+        return crud.get_sentiment_aggregates(
+            db, team_member_id, since=months_back(date.today(), months)
+        )
+
+    aggregates = await db.run_sync(load)
+    return {"team_member_id": team_member_id, **sentiment.trend(aggregates)}
+
+
+def _get_editable_team_member_or_404(
+    db: Session, current_user: models.User, team_member_id: int
+):
+    """
+    The team member, if the user manages it: admins any team member,
+    managers only their direct reports. Needed to edit a member or read
+    their sentiment trend.
     """
     db_team_member = crud.get_team_member(db, team_member_id)
-    
     if db_team_member is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found")
-    
-    # Check permissions
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found"
+        )
+
     if current_user.role != "admin":
         current_member = crud.get_team_member_by_user_id(db, current_user.id)
-        if not current_member:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-        
         # Only allow updating direct reports
-        if db_team_member.superior_id != current_member.id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    
-    # Check if email is being changed and already exists
-    if team_member.email and team_member.email != db_team_member.email:
-        existing = crud.get_team_member_by_email(db, team_member.email)
-        if existing and existing.id != team_member_id:
+        if not current_member or db_team_member.superior_id != current_member.id:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered for another team member"
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
             )
+    return db_team_member
+
+
+def _set_profile_picture(db: Session, team_member_id: int, url: Optional[str]):
+    team_member = crud.update_team_member(
+        db, team_member_id, schemas.TeamMemberUpdate(profile_picture_url=url)
+    )
+    if team_member is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found"
+        )
+    # Validated inside the session, manager_notes is loaded on access
+    return schemas.TeamMember.model_validate(team_member)
+
+
+@router.put("/{team_member_id}/profile-picture", response_model=schemas.TeamMember)
+async def upload_profile_picture(
+    team_member_id: int,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Upload a profile picture.
+
+    The image is stored once per distinct content with 64 and 256 px square
+    thumbnails; profile_picture_url points to the thumbnail endpoint, append
+    ?size=64 for the small one. Same permissions as updating the team member.
+    """
+    await db.run_sync(_get_editable_team_member_or_404, current_user, team_member_id)
+
+    data = await file.read(settings.PROFILE_PICTURE_MAX_BYTES + 1)
+    if len(data) > settings.PROFILE_PICTURE_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Image is too large",
+        )
+    try:
+        digest = await media.store_image(data)
+    except media.InvalidImageError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is not a supported image",
+        )
+
+    return await db.run_sync(
+        _set_profile_picture, team_member_id, f"/media/profile-pictures/{digest}"
+    )
+
+
+@router.delete("/{team_member_id}/profile-picture", response_model=schemas.TeamMember)
+async def delete_profile_picture(
+    team_member_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """Remove the profile picture; stored files stay, they may be shared."""
+    def delete(db: Session):
+        _get_editable_team_member_or_404(db, current_user, team_member_id)
+        return _set_profile_picture(db, team_member_id, None)
+
+    return await db.run_sync(delete)
+
+
+@router.put("/{team_member_id}", response_model=schemas.TeamMember)
+async def update_team_member(
+    team_member_id: int,
+    team_member: schemas.TeamMemberUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Update a team member.
     
-    updated_team_member = crud.update_team_member(db, team_member_id, team_member)
-    return updated_team_member
+    Admins can update any team member.
+    Managers can only update their direct reports.
+    """
+    def update(db: Session):
+        db_team_member = _get_editable_team_member_or_404(
+            db, current_user, team_member_id
+        )
+
+        # Check if email is being changed and already exists
+        if team_member.email and team_member.email != db_team_member.email:
+            existing = crud.get_team_member_by_email(db, team_member.email)
+            if existing and existing.id != team_member_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered for another team member"
+                )
+
+        updated_team_member = crud.update_team_member(db, team_member_id, team_member)
+        return schemas.TeamMember.model_validate(updated_team_member)
+
+    return await db.run_sync(update)
 
 
 @router.delete("/{team_member_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_team_member(
+async def delete_team_member(
     team_member_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -211,9 +462,6 @@ def delete_team_member(
             detail="Not enough permissions"
         )
     
-    team_member = crud.get_team_member(db, team_member_id)
-    if team_member is None:
+    if not await db.run_sync(crud.delete_team_member, team_member_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found")
-    
-    crud.delete_team_member(db, team_member_id)
     return
\ No newline at end of file
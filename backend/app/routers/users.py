@@ -1,4 +1,7 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .. import crud, models, schemas
@@ -12,36 +15,37 @@ router = APIRouter(
 
 
 @router.get("/me", response_model=schemas.UserOut)
-def read_current_user(
+async def read_current_user(
     current_user: models.User = Depends(get_current_active_user)
 ):
     return current_user
 
 
 @router.put("/me", response_model=schemas.UserOut)
-def update_current_user(
+async def update_current_user(
     user_update: schemas.UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    updated_user = crud.update_user(db, current_user.id, user_update)
+    _validate_role(user_update.role)
+    updated_user = await db.run_sync(crud.update_user, current_user.id, user_update)
     return updated_user
 
 
 @router.delete("/me")
-def delete_current_user(
-    db: Session = Depends(get_db),
+async def delete_current_user(
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    crud.delete_user(db, current_user.id)
+    await db.run_sync(crud.delete_user, current_user.id)
     return {"msg": "User deleted"}
 
 
 @router.get("/", response_model=list[schemas.UserOut])
-def read_users(
+async def read_users(
     skip: int = 0, 
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Only admins can list all users
@@ -51,14 +55,71 @@ def read_users(
             detail="Not enough permissions"
         )
     
-    users = crud.get_users(db, skip=skip, limit=limit)
+    users = await db.run_sync(crud.get_users, skip=skip, limit=limit)
     return users
 
 
+def _bulk_update(db: Session, current_user: models.User, requested_ids, patch: dict):
+    found_ids = {user.id for user in crud.get_users_by_ids(db, requested_ids)}
+    locks_out_self = (
+        patch.get("role", "admin") != "admin" or patch.get("is_active") is False
+    )
+
+    result = schemas.UserBulkUpdateResult()
+    eligible = []
+    for user_id in requested_ids:
+        if user_id not in found_ids:
+            result.not_found.append(user_id)
+        elif user_id == current_user.id and locks_out_self:
+            result.forbidden.append(user_id)
+        else:
+            eligible.append(user_id)
+
+    updated = set(crud.bulk_update_users(db, eligible, patch))
+    result.updated = [user_id for user_id in eligible if user_id in updated]
+    result.unchanged = [user_id for user_id in eligible if user_id not in updated]
+    return result
+
+
+def _validate_role(role: Optional[str]):
+    if role is not None and role not in crud.USER_ROLES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"role must be one of {', '.join(crud.USER_ROLES)}"
+        )
+
+
+@router.post("/bulk-update", response_model=schemas.UserBulkUpdateResult)
+async def bulk_update_users(
+    bulk: schemas.UserBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user)
+):
+    """
+    Activate, deactivate or change the role of many users in one transaction.
+
+    Unknown ids are reported as not found. Admins cannot deactivate or
+    demote themselves this way, their own id is reported as forbidden.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    patch = bulk.patch.dict(exclude_none=True)
+    if not patch:
+        raise HTTPException(status_code=400, detail="Patch must set role or is_active")
+    _validate_role(patch.get("role"))
+
+    requested_ids = list(dict.fromkeys(bulk.ids))
+    return await db.run_sync(_bulk_update, current_user, requested_ids, patch)
+
+
 @router.get("/{user_id}", response_model=schemas.UserOut)
-def read_user(
+async def read_user(
     user_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Only admins can get other users
@@ -68,16 +129,16 @@ def read_user(
             detail="Not enough permissions"
         )
     
-    user = crud.get_user(db, user_id)
+    user = await db.run_sync(crud.get_user, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
 @router.post("/", response_model=schemas.UserOut)
-def create_user(
+async def create_user(
     user_in: schemas.UserCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Only admins can create users
@@ -87,22 +148,24 @@ def create_user(
             detail="Not enough permissions"
         )
     
+    _validate_role(user_in.role)
+
     # Check if user with this email already exists
-    db_user = crud.get_user_by_email(db, email=user_in.email)
+    db_user = await db.run_sync(crud.get_user_by_email, user_in.email)
     if db_user:
         raise HTTPException(
             status_code=400, 
             detail="Email already registered"
         )
     
-    return crud.create_user(db=db, user=user_in)
+    return await db.run_sync(crud.create_user, user_in)
 
 
 @router.put("/{user_id}", response_model=schemas.UserOut)
-def update_user(
+async def update_user(
     user_id: int, 
     user_update: schemas.UserUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Only admins can update other users
@@ -111,17 +174,18 @@ def update_user(
             status_code=status.HTTP_403_FORBIDDEN, 
             detail="Not enough permissions"
         )
+    _validate_role(user_update.role)
     
-    user = crud.update_user(db, user_id, user_update)
+    user = await db.run_sync(crud.update_user, user_id, user_update)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
 @router.delete("/{user_id}")
-def delete_user(
+async def delete_user(
     user_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Only admins can delete other users
@@ -138,7 +202,7 @@ def delete_user(
             detail="Cannot delete yourself through this endpoint, use DELETE /users/me instead"
         )
     
-    success = crud.delete_user(db, user_id)
+    success = await db.run_sync(crud.delete_user, user_id)
     if not success:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -1,6 +1,6 @@
 from datetime import datetime, date
-from typing import List, Optional
-from pydantic import BaseModel, EmailStr
+from typing import Any, List, Optional
+from pydantic import BaseModel, EmailStr, Field, Json, create_model
 
 
 # User Schemas
@@ -30,6 +30,23 @@ class User(UserBase):
         from_attributes = True
 
 
+class UserBulkPatch(BaseModel):
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+class UserBulkUpdate(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=5000)
+    patch: UserBulkPatch
+
+
+class UserBulkUpdateResult(BaseModel):
+    updated: List[int] = []
+    unchanged: List[int] = []
+    not_found: List[int] = []
+    forbidden: List[int] = []
+
+
 # UserOut is a schema for responses that doesn't include sensitive information
 class UserOut(BaseModel):
     id: int
@@ -96,6 +113,327 @@ class TeamMemberWithReports(TeamMember):
 TeamMemberWithReports.update_forward_refs()
 
 
+# KeyResult Schemas
+class KeyResultBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    measurement_type: str
+    target_value: Optional[str] = None
+    current_value: Optional[str] = None
+    start_date: Optional[date] = None
+    deadline: date
+    complexity: Optional[str] = None
+    status: str = "Not Started"
+    result_evaluation: Optional[str] = None
+
+
+class KeyResultCreate(KeyResultBase):
+    objective_id: int
+
+
+class KeyResultUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    measurement_type: Optional[str] = None
+    target_value: Optional[str] = None
+    current_value: Optional[str] = None
+    start_date: Optional[date] = None
+    deadline: Optional[date] = None
+    complexity: Optional[str] = None
+    status: Optional[str] = None
+    result_evaluation: Optional[str] = None
+
+
+class KeyResult(KeyResultBase):
+    id: int
+    objective_id: int
+    target_numeric: Optional[float] = None
+    current_numeric: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class KeyResultProgress(BaseModel):
+    id: int
+    objective_id: int
+    title: str
+    status: Optional[str] = None
+    deadline: date
+    percent_complete: Optional[float] = None
+    at_risk: bool
+
+    class Config:
+        from_attributes = True
+
+
+class KeyResultRollup(BaseModel):
+    group_id: Optional[int] = None
+    key_results: int
+    avg_percent_complete: Optional[float] = None
+    at_risk: int
+
+    class Config:
+        from_attributes = True
+
+
+class KeyResultHistoryPoint(BaseModel):
+    bucket: str
+    avg_value: Optional[float] = None
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    samples: int
+    last_recorded_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class KeyResultHistorySeries(BaseModel):
+    key_result_id: int
+    points: List[KeyResultHistoryPoint] = []
+
+
+# ActionItem Schemas
+class ActionItemBase(BaseModel):
+    description: str
+    assigned_to_member_id: Optional[int] = None
+    meeting_log_id: Optional[int] = None
+    due_date: Optional[date] = None
+    status: str = "To Do"
+    priority: str = "Medium"
+
+
+class ActionItemCreate(ActionItemBase):
+    assigned_by_manager_id: Optional[int] = None
+
+
+class ActionItemUpdate(BaseModel):
+    description: Optional[str] = None
+    assigned_to_member_id: Optional[int] = None
+    meeting_log_id: Optional[int] = None
+    due_date: Optional[date] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+
+
+class ActionItem(ActionItemBase):
+    id: int
+    assigned_by_manager_id: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+    archived: bool = False
+
+    class Config:
+        from_attributes = True
+
+
+class ActionItemStatusBatch(BaseModel):
+    ids: List[int]
+    status: str
+
+
+class ActionItemStatusBatchResult(BaseModel):
+    updated: List[int] = []
+    not_found: List[int] = []
+    forbidden: List[int] = []
+
+
+# MeetingLog Schemas
+class MeetingLogBase(BaseModel):
+    team_member_id: int
+    meeting_date: datetime
+    notes: Optional[str] = None
+
+
+class MeetingLogCreate(MeetingLogBase):
+    manager_id: Optional[int] = None
+
+
+class MeetingLogUpdate(BaseModel):
+    meeting_date: Optional[datetime] = None
+    notes: Optional[str] = None
+    ai_summary: Optional[str] = None
+
+
+class MeetingLog(MeetingLogBase):
+    id: int
+    manager_id: int
+    notes_structured: Optional[Json[Any]] = None
+    ai_summary: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    action_items: List[ActionItem] = []
+    archived: bool = False
+
+    class Config:
+        from_attributes = True
+
+
+class MeetingLogPage(BaseModel):
+    items: List[MeetingLog] = []
+    next_cursor: Optional[str] = None
+
+
+# Objective Schemas
+class Objective(BaseModel):
+    id: int
+    team_member_id: int
+    title: str
+    description: Optional[str] = None
+    status: Optional[str] = None
+    start_period: Optional[str] = None
+    end_period: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    key_results: List[KeyResult] = []
+
+    class Config:
+        from_attributes = True
+
+
+# Team member responses narrowed with ?fields= and extended with ?include=:
+# the TeamMember fields, all optional but id, plus the embeddable relations.
+# Fields that were not requested are left out of the response
+TeamMemberSparse = create_model(
+    "TeamMemberSparse",
+    id=(int, ...),
+    **{
+        name: (Optional[field.annotation], None)
+        for name, field in TeamMember.model_fields.items()
+        if name != "id"
+    },
+    objectives=(Optional[List[Objective]], None),
+    open_action_items=(Optional[List[ActionItem]], None),
+    latest_meeting=(Optional[MeetingLog], None),
+)
+
+
+# Audit Schemas
+class AuditLog(BaseModel):
+    id: int
+    created_at: datetime
+    actor_user_id: Optional[int] = None
+    action: str
+    entity_type: str
+    entity_id: Optional[int] = None
+    changes: Optional[Json[Any]] = None
+
+    class Config:
+        from_attributes = True
+
+
+class AuditLogPage(BaseModel):
+    items: List[AuditLog] = []
+    next_cursor: Optional[int] = None
+
+
+# Sentiment Schemas
+class SentimentTrendPoint(BaseModel):
+    period_start: date
+    meeting_count: int
+    indicator: str
+
+
+class SentimentTrend(BaseModel):
+    team_member_id: int
+    experimental: bool = True
+    notice: str
+    direction: str
+    points: List[SentimentTrendPoint] = []
+
+
+# Org analytics Schemas
+class KeyResultDepthDistribution(BaseModel):
+    depth: int
+    key_results: int
+    with_progress: int
+    p25: Optional[float] = None
+    p50: Optional[float] = None
+    p75: Optional[float] = None
+    p90: Optional[float] = None
+    at_risk_share: float
+
+
+class ManagerOverdue(BaseModel):
+    manager_id: int
+    direct_reports: int
+    open_items_team: int
+    overdue_own: int
+    overdue_direct_reports: int
+    overdue_team: int
+
+
+class ObjectiveStatusMix(BaseModel):
+    months: List[str] = []
+    statuses: List[str] = []
+    # counts[i][j]: objectives created in months[i] now in statuses[j]
+    counts: List[List[int]] = []
+
+
+class OrgAnalytics(BaseModel):
+    root_id: Optional[int] = None
+    generated_at: datetime
+    members: int
+    key_results_by_depth: List[KeyResultDepthDistribution] = []
+    overdue_by_manager: List[ManagerOverdue] = []
+    objective_status_mix: ObjectiveStatusMix
+
+
+class SingleFlightStats(BaseModel):
+    name: str
+    executed: int
+    coalesced: int
+    in_flight: int
+
+
+# Batch Schemas
+class BatchOperation(BaseModel):
+    method: str = "GET"
+    # Path with an optional query string, e.g. "/team-members/?fields=id"
+    path: str
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(min_length=1)
+
+
+class BatchOperationResult(BaseModel):
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResult(BaseModel):
+    # False when a write failed and all writes of the batch were rolled back
+    committed: bool
+    responses: List[BatchOperationResult] = []
+
+
+# ReviewDraft Schemas
+class ReviewDraftCreate(BaseModel):
+    team_member_id: int
+    period_start: date
+    period_end: date
+
+
+class ReviewDraft(ReviewDraftCreate):
+    id: int
+    requested_by_user_id: Optional[int] = None
+    status: str
+    stage: Optional[str] = None
+    progress: float
+    content: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Token schemas
 class Token(BaseModel):
     access_token: str
@@ -0,0 +1,187 @@
+"""
+Org-wide OKR and action item analytics.
+
+The inputs are fetched as plain column tuples in four queries (reporting
+tree, key results, open action items, objectives), each limited to the
+subtree when a root is given, and every rollup is computed with NumPy array
+operations over them, so the cost grows with the number of rows but not
+with per-row Python or ORM work.
+
+Members are addressed by their position in the id-sorted tree arrays;
+rollups up the reporting hierarchy add each level into its parents, from
+the deepest level up.
+
+Results are cached per worker for ANALYTICS_CACHE_SECONDS only: the
+figures are org-wide trends and do not need to follow every single write.
+"""
+from datetime import date, datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.cache import CacheRegion
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.sql_functions import months_back
+
+PERCENTILES = (25, 50, 75, 90)
+
+# Keyed by (root_id, months); expires only, see the module docstring
+analytics_cache = CacheRegion(
+    "org_analytics", tables=(), ttl=settings.ANALYTICS_CACHE_SECONDS
+)
+analytics_flight = SingleFlight("org_analytics")
+
+
+class _Tree:
+    """Reporting tree as arrays sorted by member id."""
+
+    def __init__(self, rows):
+        rows = sorted(rows, key=lambda row: row.id)
+        self.ids = np.array([row.id for row in rows], dtype=np.int64)
+        self.depth = np.array([row.depth for row in rows], dtype=np.int64)
+        superiors = np.array(
+            [row.superior_id if row.superior_id is not None else -1 for row in rows],
+            dtype=np.int64,
+        )
+        self.parent = self.positions(superiors)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def positions(self, member_ids: np.ndarray) -> np.ndarray:
+        """Index of each member id in the tree, -1 for members outside it."""
+        if not len(self.ids):
+            return np.full(len(member_ids), -1, dtype=np.int64)
+        pos = np.searchsorted(self.ids, member_ids)
+        pos = np.minimum(pos, len(self.ids) - 1)
+        return np.where(self.ids[pos] == member_ids, pos, -1)
+
+    def subtree_totals(self, values: np.ndarray) -> np.ndarray:
+        """Per member: its own value plus the values of everyone below it."""
+        totals = values.astype(np.float64).copy()
+        for level in range(int(self.depth.max(initial=0)), 0, -1):
+            members = np.flatnonzero((self.depth == level) & (self.parent >= 0))
+            np.add.at(totals, self.parent[members], totals[members])
+        return totals
+
+
+def _key_results_by_depth(tree: _Tree, rows):
+    if not rows:
+        return []
+    owners = tree.positions(np.array([row[0] for row in rows], dtype=np.int64))
+    percent = np.array([row[1] for row in rows], dtype=np.float64)  # None -> nan
+    at_risk = np.array([bool(row[2]) for row in rows], dtype=bool)
+
+    inside = owners >= 0
+    owners, percent, at_risk = owners[inside], percent[inside], at_risk[inside]
+    depth = tree.depth[owners]
+
+    result = []
+    for level in np.unique(depth):
+        at_level = depth == level
+        measured = percent[at_level & ~np.isnan(percent)]
+        quantiles = (
+            np.percentile(measured, PERCENTILES)
+            if len(measured)
+            else [None] * len(PERCENTILES)
+        )
+        result.append({
+            "depth": int(level),
+            "key_results": int(at_level.sum()),
+            "with_progress": int(len(measured)),
+            **{
+                f"p{p}": (round(float(q), 1) if q is not None else None)
+                for p, q in zip(PERCENTILES, quantiles)
+            },
+            "at_risk_share": round(float(at_risk[at_level].mean()), 3),
+        })
+    return result
+
+
+def _action_items_by_manager(tree: _Tree, rows):
+    n = len(tree)
+    if not n:
+        return []
+    owners = tree.positions(np.array([row[0] for row in rows], dtype=np.int64))
+    overdue = np.array([row[1] for row in rows], dtype=np.float64)
+    inside = owners >= 0
+    owners, overdue = owners[inside], overdue[inside]
+
+    open_own = np.bincount(owners, minlength=n)
+    overdue_own = np.bincount(owners, weights=overdue, minlength=n)
+
+    has_parent = tree.parent >= 0
+    direct_reports = np.bincount(tree.parent[has_parent], minlength=n)
+    overdue_direct = np.bincount(
+        tree.parent[has_parent], weights=overdue_own[has_parent], minlength=n
+    )
+    open_team = tree.subtree_totals(open_own)
+    overdue_team = tree.subtree_totals(overdue_own)
+
+    managers = np.flatnonzero(direct_reports > 0)
+    managers = managers[np.argsort(-overdue_team[managers], kind="stable")]
+    return [
+        {
+            "manager_id": int(tree.ids[i]),
+            "direct_reports": int(direct_reports[i]),
+            "open_items_team": int(open_team[i]),
+            "overdue_own": int(overdue_own[i]),
+            "overdue_direct_reports": int(overdue_direct[i]),
+            "overdue_team": int(overdue_team[i]),
+        }
+        for i in managers
+    ]
+
+
+def _objective_status_mix(tree: _Tree, rows):
+    if rows:
+        owners = tree.positions(np.array([row[0] for row in rows], dtype=np.int64))
+        inside = owners >= 0
+        months = np.array([row[1] or "" for row in rows])[inside]
+        statuses = np.array([row[2] or "Unknown" for row in rows])[inside]
+    else:
+        months = statuses = np.array([], dtype=str)
+    month_keys, month_index = np.unique(months, return_inverse=True)
+    status_keys, status_index = np.unique(statuses, return_inverse=True)
+    counts = np.zeros((len(month_keys), len(status_keys)), dtype=np.int64)
+    np.add.at(counts, (month_index, status_index), 1)
+    return {
+        "months": [str(month) for month in month_keys],
+        "statuses": [str(status) for status in status_keys],
+        "counts": counts.tolist(),
+    }
+
+
+async def org_analytics(db: AsyncSession, root_id: Optional[int] = None,
+                        months: int = 12) -> dict:
+    """Cached rollups for the organization, or the subtree below `root_id`."""
+    key = (root_id, months)
+
+    def load():
+        return analytics_flight.do(key, lambda: db.run_sync(compute, root_id, months))
+
+    return await analytics_cache.get_or_set_async(key, load)
+
+
+def compute(db, root_id: Optional[int] = None, months: int = 12,
+            today: Optional[date] = None) -> dict:
+    today = today or date.today()
+    tree = _Tree(crud.get_team_subtree(db, root_id))
+    return {
+        "root_id": root_id,
+        "generated_at": datetime.utcnow(),
+        "members": len(tree),
+        "key_results_by_depth": _key_results_by_depth(
+            tree, crud.get_key_result_analytics_rows(db, root_id)
+        ),
+        "overdue_by_manager": _action_items_by_manager(
+            tree, crud.get_open_action_item_analytics_rows(db, today, root_id)
+        ),
+        "objective_status_mix": _objective_status_mix(
+            tree,
+            crud.get_objective_analytics_rows(db, months_back(today, months), root_id),
+        ),
+    }
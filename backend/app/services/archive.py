@@ -0,0 +1,61 @@
+"""
+Hot/cold archival of closed action items and old meeting logs.
+
+Rows are moved to the `*_archive` tables in batches of ARCHIVE_BATCH_SIZE,
+each batch in its own short transaction, so archiving a large backlog never
+blocks writers for long. Read paths consult the archive only when the
+requested range reaches archived data (see `crud.get_meeting_logs`).
+
+Action items are archived first: a meeting log is only moved once none of
+its action items are left in the live table.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app import crud
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def archive_batch(
+    db, batch_size: Optional[int] = None, now: Optional[datetime] = None
+) -> int:
+    """Archive one batch of each kind, return the number of rows moved."""
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    now = now or datetime.utcnow()
+    moved = crud.archive_action_items(
+        db, now - timedelta(days=settings.ARCHIVE_ACTION_ITEMS_AFTER_DAYS), batch_size
+    )
+    moved += crud.archive_meeting_logs(
+        db, now - timedelta(days=settings.ARCHIVE_MEETING_LOGS_AFTER_DAYS), batch_size
+    )
+    return moved
+
+
+async def archive_all(session_factory, batch_size: Optional[int] = None) -> int:
+    total = 0
+    while True:
+        async with session_factory() as session:
+            moved = await session.run_sync(archive_batch, batch_size)
+        total += moved
+        if not moved:
+            return total
+        # Let request handlers use the database between batches
+        await asyncio.sleep(0)
+
+
+async def run_archiver(session_factory):
+    """Background task archiving every ARCHIVE_INTERVAL_HOURS."""
+    while True:
+        try:
+            moved = await archive_all(session_factory)
+            if moved:
+                logger.info("Archived %d meeting logs and action items", moved)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Archiving failed, will retry")
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL_HOURS * 3600)
@@ -0,0 +1,208 @@
+"""
+Audit trail for sensitive changes.
+
+Changes to users and team members are captured from SQLAlchemy session
+events, so every code path that writes through the ORM is covered. Entries
+are kept per session until the transaction commits, then moved to an
+in-memory buffer which a background task writes to `audit_log` in batched
+inserts. Request latency therefore never includes the audit write; the
+buffer is flushed once more on shutdown.
+"""
+import asyncio
+import contextvars
+import json
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import event, inspect, insert
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+from app.database import JOINED_TRANSACTION_KEY
+
+logger = logging.getLogger(__name__)
+
+# Id of the authenticated user making the current request
+current_actor: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "audit_current_actor", default=None
+)
+
+AUDITED_MODELS = {
+    models.User: "user",
+    models.TeamMember: "team_member",
+}
+
+# Values never written to the trail, only the fact that they changed
+REDACTED_FIELDS = {"hashed_password", "manager_notes"}
+IGNORED_FIELDS = {"created_at", "updated_at"}
+
+_PENDING_KEY = "audit_pending"
+
+
+class AuditBuffer:
+    def __init__(self):
+        self._entries = deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def extend(self, entries: List[dict]):
+        with self._lock:
+            self._entries.extend(entries)
+            full = len(self._entries) >= settings.AUDIT_BATCH_SIZE
+        if full and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def drain(self, limit: int) -> List[dict]:
+        with self._lock:
+            count = min(limit, len(self._entries))
+            return [self._entries.popleft() for _ in range(count)]
+
+    def requeue(self, entries: List[dict]):
+        with self._lock:
+            self._entries.extendleft(reversed(entries))
+
+    async def wait(self, timeout: float):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+
+buffer = AuditBuffer()
+
+
+def _json_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _diff(obj) -> dict:
+    changes = {}
+    for attr in inspect(obj).attrs:
+        if attr.key in IGNORED_FIELDS:
+            continue
+        history = attr.history
+        if not history.has_changes():
+            continue
+        old = history.deleted[0] if history.deleted else None
+        new = history.added[0] if history.added else None
+        if old is None and new is None:
+            continue
+        if attr.key in REDACTED_FIELDS:
+            changes[attr.key] = "<redacted>"
+            continue
+        if hasattr(old, "__table__") or hasattr(new, "__table__"):
+            # Relationship attributes are covered by their foreign key columns
+            continue
+        changes[attr.key] = [_json_value(old), _json_value(new)]
+    return changes
+
+
+def _entry(
+    action: str, entity_type: str, entity_id: int, changes: Optional[dict] = None
+):
+    return {
+        "created_at": datetime.utcnow(),
+        "actor_user_id": current_actor.get(),
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "changes": json.dumps(changes, separators=(",", ":")) if changes else None,
+    }
+
+
+def record(
+    action: str,
+    entity_type: str,
+    entity_ids: List[int],
+    changes: Optional[dict] = None,
+):
+    """
+    Buffer entries for writes that bypass the ORM unit of work, such as bulk
+    UPDATE statements. Call after the transaction committed.
+    """
+    buffer.extend(
+        [_entry(action, entity_type, entity_id, changes) for entity_id in entity_ids]
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _capture(session, flush_context):
+    entries = []
+    for action, objects in (
+        ("create", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    ):
+        for obj in objects:
+            entity_type = AUDITED_MODELS.get(type(obj))
+            if entity_type is None:
+                continue
+            changes = _diff(obj) if action != "delete" else None
+            if action == "update" and not changes:
+                continue
+            entries.append(_entry(action, entity_type, obj.id, changes))
+    if entries:
+        session.info.setdefault(_PENDING_KEY, []).extend(entries)
+
+
+@event.listens_for(Session, "after_commit")
+def _commit(session):
+    if session.info.get(JOINED_TRANSACTION_KEY):
+        # Not final yet, the owner calls buffer_committed
+        return
+    buffer_committed(session)
+
+
+def buffer_committed(session: Session):
+    """Move the entries of the committed transaction to the buffer."""
+    entries = session.info.pop(_PENDING_KEY, None)
+    if entries:
+        buffer.extend(entries)
+
+
+@event.listens_for(Session, "after_rollback")
+def _rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def flush(session_factory, limit: Optional[int] = None) -> int:
+    """Write buffered entries to the database in batched inserts."""
+    written = 0
+    while len(buffer) and (limit is None or written < limit):
+        entries = buffer.drain(settings.AUDIT_BATCH_SIZE)
+        try:
+            async with session_factory() as session:
+                await session.execute(insert(models.AuditLog), entries)
+                await session.commit()
+        except Exception:
+            buffer.requeue(entries)
+            raise
+        written += len(entries)
+    return written
+
+
+async def run_flusher(session_factory):
+    """Background task flushing the buffer periodically or when it fills up."""
+    while True:
+        await buffer.wait(settings.AUDIT_FLUSH_INTERVAL_SECONDS)
+        try:
+            await flush(session_factory)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Failed to write audit entries, will retry")
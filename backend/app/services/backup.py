@@ -0,0 +1,218 @@
+"""
+Online backups of the SQLite database.
+
+Snapshots are taken with SQLite's backup API while the application keeps
+running. Pages are copied in steps of BACKUP_PAGES_PER_STEP with a short
+sleep in between, so the read lock on the live database is only held for
+one step at a time; if a writer changes the database mid-backup SQLite
+restarts the copy from a consistent point. Each snapshot is written to a
+temporary file, checked with `PRAGMA integrity_check` and only then renamed
+into place, so BACKUP_DIR never contains a torn or corrupt file.
+"""
+import asyncio
+import fcntl
+import logging
+import os
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKUP_PREFIX = "aiphb-"
+BACKUP_SUFFIX = ".db"
+LOCK_NAME = ".backup.lock"
+
+
+class BackupError(RuntimeError):
+    pass
+
+
+@dataclass
+class BackupResult:
+    path: Path
+    size_bytes: int
+    seconds: float
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.size_bytes / 1_048_576 / self.seconds if self.seconds else 0.0
+
+
+def database_path() -> Path:
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "sqlite" or not url.database:
+        raise BackupError("Online backups are only supported for SQLite file databases")
+    return Path(url.database)
+
+
+def _copy(source: Path, target: Path, pages_per_step: int, step_sleep: float):
+    started = time.perf_counter()
+    last_logged = started
+
+    def progress(status, remaining, total):
+        nonlocal last_logged
+        now = time.perf_counter()
+        if now - last_logged >= 5:
+            last_logged = now
+            logger.info(
+                "Backup of %s: %d of %d pages copied", source, total - remaining, total
+            )
+
+    src = sqlite3.connect(f"file:{source}?mode=ro", uri=True)
+    dst = sqlite3.connect(target)
+    try:
+        src.backup(dst, pages=pages_per_step, progress=progress, sleep=step_sleep)
+    finally:
+        dst.close()
+        src.close()
+    return time.perf_counter() - started
+
+
+def verify(path: Path) -> None:
+    """Raise BackupError unless `path` is an intact SQLite database."""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError as exc:
+        raise BackupError(f"{path} is not a readable SQLite database: {exc}") from exc
+    if rows != ["ok"]:
+        raise BackupError(f"Integrity check of {path} failed: {'; '.join(rows[:5])}")
+
+
+def list_backups(directory: Optional[Path] = None) -> List[Path]:
+    """Backups in `directory`, oldest first."""
+    directory = Path(directory or settings.BACKUP_DIR)
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"{BACKUP_PREFIX}*{BACKUP_SUFFIX}"))
+
+
+def prune(directory: Optional[Path] = None, keep: Optional[int] = None) -> List[Path]:
+    keep = settings.BACKUP_KEEP if keep is None else keep
+    backups = list_backups(directory)
+    removed = backups[:-keep] if keep > 0 else []
+    for path in removed:
+        path.unlink()
+    return removed
+
+
+def backup(
+    directory: Optional[Path] = None, keep: Optional[int] = None
+) -> BackupResult:
+    """Snapshot the live database into `directory` and prune old snapshots."""
+    source = database_path()
+    directory = Path(directory or settings.BACKUP_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    target = directory / f"{BACKUP_PREFIX}{stamp}{BACKUP_SUFFIX}"
+    partial = target.with_name(f"{target.name}.{os.getpid()}.partial")
+    partial.unlink(missing_ok=True)
+
+    try:
+        seconds = _copy(
+            source,
+            partial,
+            settings.BACKUP_PAGES_PER_STEP,
+            settings.BACKUP_STEP_SLEEP_SECONDS,
+        )
+        verify(partial)
+        os.replace(partial, target)
+    except Exception:
+        partial.unlink(missing_ok=True)
+        raise
+
+    result = BackupResult(target, target.stat().st_size, seconds)
+    logger.info(
+        "Backed up %s to %s: %.1f MB in %.1f s (%.1f MB/s)",
+        source, target, result.size_bytes / 1_048_576, result.seconds,
+        result.megabytes_per_second,
+    )
+    prune(directory, keep)
+    return result
+
+
+def restore(path: Path) -> BackupResult:
+    """
+    Replace the contents of the live database with a verified backup.
+
+    Runs through the backup API as well, so connections that are still open
+    see either the old or the restored database, never a partial copy.
+    Stop the API workers first unless losing their in-flight writes is fine.
+    """
+    path = Path(path)
+    verify(path)
+    target = database_path()
+    seconds = _copy(path, target, settings.BACKUP_PAGES_PER_STEP, 0)
+    result = BackupResult(path, path.stat().st_size, seconds)
+    logger.info(
+        "Restored %s from %s: %.1f MB in %.1f s (%.1f MB/s)",
+        target, path, result.size_bytes / 1_048_576, result.seconds,
+        result.megabytes_per_second,
+    )
+    return result
+
+
+def _seconds_until_due(interval: float) -> float:
+    backups = list_backups()
+    if not backups:
+        return 0.0
+    age = time.time() - backups[-1].stat().st_mtime
+    return max(0.0, interval - age)
+
+
+def _scheduled_backup(interval: float) -> Optional[BackupResult]:
+    """
+    Take a backup if one is due and no other worker is taking one.
+
+    The exclusive lock on LOCK_NAME in BACKUP_DIR is held for the whole
+    backup, and the due check is repeated under it, so a worker that wakes
+    up while another one is still copying skips its turn instead of starting
+    a second backup. The kernel drops the lock if the worker dies.
+    """
+    directory = Path(settings.BACKUP_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK_NAME, "a") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+        try:
+            if _seconds_until_due(interval) > 0:
+                return None
+            return backup()
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+async def run_scheduler():
+    """
+    Background task taking a backup every BACKUP_INTERVAL_HOURS.
+
+    Every worker runs the scheduler; a worker skips its turn when another
+    one is taking a backup or already wrote a recent enough one.
+    """
+    interval = settings.BACKUP_INTERVAL_HOURS * 3600
+    while True:
+        # Jitter keeps workers started together from waking up together
+        await asyncio.sleep(_seconds_until_due(interval) + random.uniform(0, 30))
+        if _seconds_until_due(interval) > 0:
+            continue
+        try:
+            await asyncio.to_thread(_scheduled_backup, interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Scheduled database backup failed")
@@ -0,0 +1,149 @@
+"""
+In-process publish/subscribe of data changes.
+
+CRUD writes publish small delta events to channels scoped to a manager's
+team; the events router streams them to connected clients over WebSocket
+or Server-Sent Events so the frontend does not have to poll.
+
+Channels:
+    team:<team_member_id>  events about the member and their direct reports
+    admin                  every event
+"""
+import asyncio
+import contextvars
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+ADMIN_CHANNEL = "admin"
+
+# Fields never sent over the event stream: a member is subscribed to events
+# about themself, and clients re-fetch notes through the access-checked API
+PRIVATE_FIELDS = {
+    "manager_notes", "notes", "notes_structured", "password", "hashed_password"
+}
+
+
+# Events held back while the writes they describe may still be rolled back
+_deferred: contextvars.ContextVar[Optional[List[tuple]]] = contextvars.ContextVar(
+    "events_deferred", default=None
+)
+
+
+def team_channel(team_member_id: int) -> str:
+    return f"team:{team_member_id}"
+
+
+class EventBroker:
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    @asynccontextmanager
+    async def subscribe(self, channels: Iterable[str]):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        channels = set(channels)
+        for channel in channels:
+            self._subscribers[channel].add(queue)
+        try:
+            yield queue
+        finally:
+            for channel in channels:
+                self._subscribers[channel].discard(queue)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+    def _deliver(self, channels: Set[str], event: dict):
+        # A subscriber on several channels gets the event only once
+        queues = set()
+        for channel in channels:
+            queues |= self._subscribers.get(channel, set())
+        for queue in queues:
+            if queue.full():
+                # Slow consumer: drop its oldest event rather than block writers
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def publish(self, channels: Iterable[str], event: dict):
+        """
+        Publish an event; safe to call from the event loop or a worker thread.
+        """
+        if self._loop is None or self._loop.is_closed():
+            return
+        channels = set(channels) | {ADMIN_CHANNEL}
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._deliver(channels, event)
+        else:
+            self._loop.call_soon_threadsafe(self._deliver, channels, event)
+
+
+broker = EventBroker()
+
+
+def publish_change(
+    entity: str,
+    action: str,
+    entity_id: int,
+    team_member_ids: Iterable[Optional[int]],
+    data: Optional[dict] = None,
+):
+    """
+    Publish a change of an entity to the teams of the given members.
+
+    `team_member_ids` are the member the change is about and its superior;
+    `data` holds the changed fields (a delta, not the full object).
+    """
+    event = {"type": f"{entity}.{action}", "id": entity_id}
+    if data:
+        event["data"] = {
+            key: value for key, value in data.items() if key not in PRIVATE_FIELDS
+        }
+    channels = [
+        team_channel(member_id)
+        for member_id in team_member_ids
+        if member_id is not None
+    ]
+    deferred = _deferred.get()
+    if deferred is not None:
+        deferred.append((channels, event))
+        return
+    try:
+        broker.publish(channels, event)
+    except Exception:
+        # Notifications are best effort and must never fail a write
+        logger.exception("Failed to publish %s event", event["type"])
+
+
+@contextmanager
+def deferred_publishing():
+    """
+    Collect the events published inside the block instead of sending them.
+
+    Yields the list of collected events; pass it to `publish_deferred` once
+    the writes are committed, or drop it when they are rolled back.
+    """
+    events = []
+    token = _deferred.set(events)
+    try:
+        yield events
+    finally:
+        _deferred.reset(token)
+
+
+def publish_deferred(events: List[tuple]):
+    for channels, event in events:
+        try:
+            broker.publish(channels, event)
+        except Exception:
+            logger.exception("Failed to publish %s event", event["type"])
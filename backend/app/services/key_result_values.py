@@ -0,0 +1,144 @@
+"""
+Parsing of Key Result values.
+
+Key Results store `target_value` and `current_value` as free text so that
+managers can enter values like "45%", "$12,500" or "done". The parsers in
+this module turn that text into a float which is stored alongside the raw
+value, so progress can be computed in SQL instead of in Python.
+"""
+import re
+from typing import Callable, Dict, Optional
+
+PERCENTAGE = "Percentage"
+NUMERIC = "Numeric"
+CURRENCY = "Currency"
+BOOLEAN = "Boolean"
+COMPLETION = "Completion"
+
+MEASUREMENT_TYPES = (PERCENTAGE, NUMERIC, CURRENCY, BOOLEAN, COMPLETION)
+
+# A k/m/b suffix only counts on its own, "5k" or "2 m", not as the first
+# letter of a unit as in "5 meetings" or "10 km"
+_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?(?:\s*(?P<suffix>[kmb])(?![a-z]))?")
+_SUFFIX_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+_TRUE_WORDS = {"true", "yes", "y", "1", "done", "complete", "completed", "achieved"}
+_FALSE_WORDS = {"false", "no", "n", "0", "not done", "incomplete", "not started"}
+_COMPLETION_WORDS = {
+    "not started": 0.0,
+    "todo": 0.0,
+    "to do": 0.0,
+    "started": 0.25,
+    "in progress": 0.5,
+    "almost done": 0.9,
+    "done": 1.0,
+    "complete": 1.0,
+    "completed": 1.0,
+    "achieved": 1.0,
+}
+
+
+def _clean(raw: Optional[str]) -> Optional[str]:
+    if raw is None:
+        return None
+    text = str(raw).strip().lower()
+    return text or None
+
+
+def _parse_number(text: str) -> Optional[float]:
+    # Drop thousands separators between digits, e.g. "1,200 000" -> "1200000"
+    compact = re.sub(r"(?<=\d)[,\s_](?=\d)", "", text)
+    match = _NUMBER_RE.search(compact)
+    if not match:
+        return None
+    number = match.group()
+    suffix = match.group("suffix")
+    if suffix:
+        number = number[:number.rindex(suffix)].strip()
+    return float(number) * _SUFFIX_MULTIPLIERS.get(suffix, 1)
+
+
+def parse_percentage(raw: Optional[str]) -> Optional[float]:
+    text = _clean(raw)
+    if text is None:
+        return None
+    value = _parse_number(text)
+    if value is None:
+        return None
+    # Fractions like "0.45" are accepted only when no percent sign is given
+    if "%" not in text and 0 < value < 1 and "." in text:
+        value *= 100
+    return value
+
+
+def parse_numeric(raw: Optional[str]) -> Optional[float]:
+    text = _clean(raw)
+    if text is None:
+        return None
+    return _parse_number(text)
+
+
+def parse_currency(raw: Optional[str]) -> Optional[float]:
+    text = _clean(raw)
+    if text is None:
+        return None
+    # Currency symbols and codes are not stored, only the amount
+    text = re.sub(r"[a-z]{3}\b|[$€£¥]", "", text).strip()
+    return _parse_number(text) if text else None
+
+
+def parse_boolean(raw: Optional[str]) -> Optional[float]:
+    text = _clean(raw)
+    if text is None:
+        return None
+    if text in _TRUE_WORDS:
+        return 1.0
+    if text in _FALSE_WORDS:
+        return 0.0
+    return None
+
+
+def parse_completion(raw: Optional[str]) -> Optional[float]:
+    text = _clean(raw)
+    if text is None:
+        return None
+    if text in _COMPLETION_WORDS:
+        return _COMPLETION_WORDS[text]
+    value = _parse_number(text)
+    if value is None:
+        return None
+    # Completion may be given as a percentage ("80%") or a fraction ("0.8")
+    return value / 100 if value > 1 or "%" in text else value
+
+
+PARSERS: Dict[str, Callable[[Optional[str]], Optional[float]]] = {
+    PERCENTAGE: parse_percentage,
+    NUMERIC: parse_numeric,
+    CURRENCY: parse_currency,
+    BOOLEAN: parse_boolean,
+    COMPLETION: parse_completion,
+}
+
+# Target used when none is given for types with an implicit goal
+DEFAULT_TARGETS = {
+    PERCENTAGE: 100.0,
+    BOOLEAN: 1.0,
+    COMPLETION: 1.0,
+}
+
+
+def parse_value(measurement_type: str, raw: Optional[str]) -> Optional[float]:
+    """Parse a raw KR value for the given measurement type, None if not parseable."""
+    parser = PARSERS.get(measurement_type, parse_numeric)
+    try:
+        return parser(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_target(measurement_type: str, raw: Optional[str]) -> Optional[float]:
+    """Parse a raw KR target, falling back to the implicit target of the type."""
+    value = parse_value(measurement_type, raw)
+    if value is None:
+        return DEFAULT_TARGETS.get(measurement_type)
+    return value
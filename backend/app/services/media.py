@@ -0,0 +1,126 @@
+"""
+Content-addressed storage of uploaded profile pictures.
+
+An upload is identified by the SHA-256 of its bytes. The original and its
+square WebP thumbnails are stored under that digest:
+
+    MEDIA_DIR/originals/<d[:2]>/<digest>
+    MEDIA_DIR/thumbnails/<size>/<d[:2]>/<digest>.webp
+
+Identical uploads therefore map to the same files and are only processed
+once. Decoding and resizing are CPU bound, so they run in a process pool
+instead of the event loop or the thread pool serving requests. Files never
+change once written, which lets them be served with immutable caching.
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+THUMBNAIL_SIZES = (64, 256)
+DEFAULT_THUMBNAIL_SIZE = 256
+# Refuse decompression bombs before Pillow allocates them
+MAX_PIXELS = 40_000_000
+
+
+class InvalidImageError(ValueError):
+    pass
+
+
+def _shard(digest: str) -> str:
+    return digest[:2]
+
+
+def original_path(digest: str, media_dir: Optional[str] = None) -> Path:
+    return Path(media_dir or settings.MEDIA_DIR) / "originals" / _shard(digest) / digest
+
+
+def thumbnail_path(digest: str, size: int, media_dir: Optional[str] = None) -> Path:
+    return (
+        Path(media_dir or settings.MEDIA_DIR)
+        / "thumbnails" / str(size) / _shard(digest) / f"{digest}.webp"
+    )
+
+
+def _write_atomic(path: Path, write):
+    # Readers never see a partially written file; concurrent writers of the
+    # same digest produce identical content, so the last rename wins safely
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _process(data: bytes, digest: str, media_dir: str):
+    """Validate the image and write the original and its thumbnails (in the pool)."""
+    from io import BytesIO
+
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = MAX_PIXELS
+    try:
+        with Image.open(BytesIO(data)) as probe:
+            probe.verify()
+        image = Image.open(BytesIO(data))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    except (Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        raise InvalidImageError(f"Not a supported image: {exc}") from exc
+
+    image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    side = min(image.size)
+    left = (image.width - side) // 2
+    top = (image.height - side) // 2
+    square = image.crop((left, top, left + side, top + side))
+
+    _write_atomic(original_path(digest, media_dir), lambda file: file.write(data))
+    for size in THUMBNAIL_SIZES:
+        thumbnail = square
+        if side > size:
+            thumbnail = square.resize((size, size), Image.LANCZOS)
+        _write_atomic(
+            thumbnail_path(digest, size, media_dir),
+            lambda file: thumbnail.save(file, "WEBP", quality=82, method=4),
+        )
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.MEDIA_WORKERS)
+    return _pool
+
+
+def shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def is_stored(digest: str) -> bool:
+    return all(thumbnail_path(digest, size).exists() for size in THUMBNAIL_SIZES)
+
+
+async def store_image(data: bytes) -> str:
+    """Store an uploaded image and its thumbnails, return its digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    if not is_stored(digest):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            _get_pool(), _process, data, digest, settings.MEDIA_DIR
+        )
+    return digest
@@ -0,0 +1,150 @@
+"""
+Structured parsing of meeting notes.
+
+Meeting notes are written in Markdown. On every write the notes are split
+into sections (at headings) and each section is parsed into bullets with
+follow-up flags, checkboxes, @mentions and dates. The result is stored in
+`MeetingLog.notes_structured` so dashboards and the AI pipeline read the
+pre-parsed structure instead of re-parsing the notes.
+
+Sections are keyed by a hash of their text: when notes are edited only the
+sections whose text changed are parsed again.
+"""
+import hashlib
+import json
+import re
+from datetime import date
+from typing import List, Optional
+
+STRUCTURE_VERSION = 1
+
+_HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET_RE = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+(.*)$")
+_CHECKBOX_RE = re.compile(r"^\[([ xX])\]\s*")
+_FLAG_RE = re.compile(r"\[!\]|\(!\)|#(?:flag|follow-?up)\b", re.IGNORECASE)
+_MENTION_RE = re.compile(r"(?<![\w.])@([A-Za-z][\w.-]*[A-Za-z0-9_])")
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_DOTTED_DATE_RE = re.compile(r"\b(\d{1,2})\.(\d{1,2})\.(\d{4})\b")
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _find_dates(text: str) -> List[str]:
+    found = []
+    candidates = [m.group(1, 2, 3) for m in _ISO_DATE_RE.finditer(text)]
+    candidates += [m.group(3, 2, 1) for m in _DOTTED_DATE_RE.finditer(text)]
+    for year, month, day in candidates:
+        try:
+            found.append(date(int(year), int(month), int(day)).isoformat())
+        except ValueError:
+            continue
+    return found
+
+
+def split_sections(notes: str) -> List[dict]:
+    """Split notes into sections, each starting at a Markdown heading."""
+    sections = []
+    heading = None
+    lines: List[str] = []
+
+    def close():
+        if heading is not None or any(line.strip() for line in lines):
+            sections.append({"heading": heading, "text": "\n".join(lines)})
+
+    for line in notes.splitlines():
+        match = _HEADING_RE.match(line)
+        if match:
+            close()
+            heading = match.group(2)
+            lines = []
+        else:
+            lines.append(line)
+    close()
+    return sections
+
+
+def parse_section(heading: Optional[str], text: str) -> dict:
+    """Parse the body of one section into bullets, flags, mentions and dates."""
+    bullets = []
+    for line in text.splitlines():
+        match = _BULLET_RE.match(line)
+        if match:
+            indent, content = match.groups()
+            bullet = {"text": content, "level": len(indent.expandtabs(4)) // 2}
+            checkbox = _CHECKBOX_RE.match(content)
+            if checkbox:
+                bullet["checked"] = checkbox.group(1).lower() == "x"
+                bullet["text"] = content[checkbox.end():]
+            bullets.append(bullet)
+        elif line.strip() and bullets and line.startswith((" ", "\t")):
+            # Continuation line of the previous bullet
+            bullets[-1]["text"] += " " + line.strip()
+
+    for bullet in bullets:
+        bullet["flagged"] = bool(_FLAG_RE.search(bullet["text"]))
+        bullet["mentions"] = _MENTION_RE.findall(bullet["text"])
+        bullet["dates"] = _find_dates(bullet["text"])
+
+    full_text = f"{heading or ''}\n{text}"
+    return {
+        "heading": heading,
+        "hash": _hash(full_text),
+        "bullets": bullets,
+        "flagged": sum(1 for bullet in bullets if bullet["flagged"]),
+        "mentions": sorted(set(_MENTION_RE.findall(full_text))),
+        "dates": sorted(set(_find_dates(full_text))),
+    }
+
+
+def _load(structured: Optional[str]) -> Optional[dict]:
+    if not structured:
+        return None
+    try:
+        data = json.loads(structured)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.get("version") != STRUCTURE_VERSION:
+        return None
+    return data
+
+
+def parse_notes(notes: Optional[str], previous: Optional[str] = None) -> Optional[str]:
+    """
+    Parse notes into the JSON stored in `notes_structured`.
+
+    `previous` is the currently stored structure; sections whose text is
+    unchanged are reused from it instead of being parsed again.
+    """
+    if not notes:
+        return None
+
+    previous_sections = {}
+    previous_data = _load(previous)
+    if previous_data:
+        previous_sections = {
+            section["hash"]: section for section in previous_data["sections"]
+        }
+
+    sections = []
+    for raw in split_sections(notes):
+        section_hash = _hash(f"{raw['heading'] or ''}\n{raw['text']}")
+        section = previous_sections.get(section_hash)
+        if section is None:
+            section = parse_section(raw["heading"], raw["text"])
+        sections.append(section)
+
+    flagged = [
+        {"section": section_index, "bullet": bullet_index, "text": bullet["text"]}
+        for section_index, section in enumerate(sections)
+        for bullet_index, bullet in enumerate(section["bullets"])
+        if bullet["flagged"]
+    ]
+    return json.dumps({
+        "version": STRUCTURE_VERSION,
+        "sections": sections,
+        "flagged": flagged,
+        "mentions": sorted({m for section in sections for m in section["mentions"]}),
+        "dates": sorted({d for section in sections for d in section["dates"]}),
+    }, separators=(",", ":"))
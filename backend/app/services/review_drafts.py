@@ -0,0 +1,272 @@
+"""
+Performance review drafts (FR7.4).
+
+A draft is produced by a background job in three stages:
+
+1. assemble - load the member's objectives, key results, parsed meeting
+   notes and completed action items of the period in a fixed number of
+   queries (see `crud.get_review_material`).
+2. digest - condense the material month by month. Each digest is stored
+   with a hash of the material it was built from and reused by later drafts
+   while that material is unchanged, so re-drafting only processes months
+   that changed. A month with more material than REVIEW_DIGEST_MAX_TOKENS
+   is summarized by the model from the most important items that fit into
+   REVIEW_DIGEST_INPUT_TOKENS.
+3. draft - fit the objectives and the digests into
+   REVIEW_DRAFT_CONTEXT_TOKENS and ask the model for the draft.
+
+Stage and progress are stored on the ReviewDraft row after every step, so
+any worker can answer status requests while the job runs. Jobs run as
+request background tasks and die with their worker; `resume_stale_jobs`
+starts drafts again that made no progress for REVIEW_DRAFT_STALE_SECONDS.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from app import crud
+from app.core.config import settings
+from app.services import ai_service
+from app.services.ai_service import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Lower sorts first when material has to be cut to fit a budget
+PRIORITY_FLAGGED = 0
+PRIORITY_COMPLETED = 1
+PRIORITY_NOTE = 2
+
+DRAFT_SYSTEM_PROMPT = (
+    "You help a manager write the first draft of a performance review. "
+    "Use only the material provided. Write in a factual, neutral tone and "
+    "give concrete examples. Structure the draft as: Key Achievements, "
+    "Progress on Objectives, Areas for Development. The manager will review "
+    "and edit the draft before it is shared."
+)
+DIGEST_SYSTEM_PROMPT = (
+    "Condense the following notes about one team member's month into short "
+    "bullet points. Keep achievements, follow-ups and recurring blockers, "
+    "drop small talk and duplicates."
+)
+
+
+@dataclass
+class Item:
+    priority: int
+    text: str
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def fit(items: List[Item], budget: int) -> List[Item]:
+    """The most important items that fit into `budget` tokens, in original order."""
+    ranked = sorted(range(len(items)), key=lambda index: items[index].priority)
+    kept, used = set(), 0
+    for index in ranked:
+        tokens = estimate_tokens(items[index].text) + 1
+        if used + tokens > budget:
+            continue
+        kept.add(index)
+        used += tokens
+    return [item for index, item in enumerate(items) if index in kept]
+
+
+def source_hash(items: List[Item]) -> str:
+    digest = hashlib.sha256()
+    for item in items:
+        digest.update(f"{item.priority}:{item.text}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _key_result_line(key_result) -> str:
+    line = (
+        f"  - {key_result.title}: {key_result.current_value or 'n/a'} of "
+        f"{key_result.target_value or 'n/a'} ({key_result.status})"
+    )
+    if key_result.result_evaluation:
+        line += f" - {key_result.result_evaluation}"
+    return line
+
+
+def objectives_text(objectives, date_from: date, date_to: date) -> str:
+    """Objectives with the key results running during the period."""
+    lines = []
+    for objective in objectives:
+        key_results = [
+            key_result for key_result in objective.key_results
+            if key_result.deadline >= date_from
+            and (key_result.start_date is None or key_result.start_date <= date_to)
+        ]
+        if not key_results:
+            continue
+        lines.append(f"- {objective.title} ({objective.status})")
+        lines.extend(_key_result_line(key_result) for key_result in key_results)
+    return "\n".join(lines)
+
+
+def month_items(meeting_logs, completed_action_items) -> Dict[date, List[Item]]:
+    """Meeting note bullets and completed action items grouped by month."""
+    months: Dict[date, List[Item]] = {}
+    for meeting_log in meeting_logs:
+        if not meeting_log.notes_structured:
+            continue
+        day = meeting_log.meeting_date.date()
+        items = months.setdefault(month_start(day), [])
+        for section in json.loads(meeting_log.notes_structured)["sections"]:
+            heading = section["heading"]
+            prefix = f"{day} {heading}: " if heading else f"{day}: "
+            for bullet in section["bullets"]:
+                if bullet["flagged"]:
+                    priority = PRIORITY_FLAGGED
+                elif bullet.get("checked"):
+                    priority = PRIORITY_COMPLETED
+                else:
+                    priority = PRIORITY_NOTE
+                items.append(Item(priority, prefix + bullet["text"]))
+
+    for action_item in completed_action_items:
+        day = action_item.updated_at.date()
+        months.setdefault(month_start(day), []).append(
+            Item(
+                PRIORITY_COMPLETED,
+                f"{day} completed action item: {action_item.description}",
+            )
+        )
+    return dict(sorted(months.items()))
+
+
+def _assemble(db, review_draft_id: int) -> dict:
+    # Runs inside the session's sync context: everything the later stages
+    # need is turned into plain values here
+    review_draft = crud.get_review_draft(db, review_draft_id)
+    material = crud.get_review_material(
+        db,
+        review_draft.team_member_id,
+        review_draft.period_start,
+        review_draft.period_end,
+    )
+    months = month_items(material["meeting_logs"], material["completed_action_items"])
+    cached = crud.get_review_digests(db, review_draft.team_member_id, list(months))
+    return {
+        "team_member_id": review_draft.team_member_id,
+        "objectives": objectives_text(
+            material["objectives"], review_draft.period_start, review_draft.period_end
+        ),
+        "months": [
+            {
+                "month": month,
+                "items": items,
+                "hash": source_hash(items),
+                "cached": cached[month].content
+                if month in cached and cached[month].source_hash == source_hash(items)
+                else None,
+            }
+            for month, items in months.items()
+        ],
+    }
+
+
+async def _digest(month: date, items: List[Item]):
+    """Return (content, summarized) for one month of material."""
+    full_text = "\n".join(item.text for item in items)
+    if estimate_tokens(full_text) <= settings.REVIEW_DIGEST_MAX_TOKENS:
+        return full_text, False
+    selected = fit(items, settings.REVIEW_DIGEST_INPUT_TOKENS)
+    summary = await ai_service.generate(
+        f"Notes from {month:%B %Y}:\n" + "\n".join(item.text for item in selected),
+        system=DIGEST_SYSTEM_PROMPT,
+        max_tokens=settings.REVIEW_DIGEST_MAX_TOKENS,
+    )
+    return summary, True
+
+
+def build_prompt(objectives: str, digests: List[tuple], budget: int) -> str:
+    """
+    Objectives first, then as many monthly digests as fit, preferring the
+    most recent months, listed chronologically.
+    """
+    objectives = objectives or "No objectives with key results in this period."
+    remaining = budget - estimate_tokens(objectives)
+    included = []
+    for month, content in reversed(digests):
+        tokens = estimate_tokens(content) + 5
+        if tokens > remaining:
+            break
+        included.append((month, content))
+        remaining -= tokens
+    months_text = "\n\n".join(
+        f"{month:%B %Y}:\n{content}" for month, content in reversed(included)
+    )
+    return (
+        f"Objectives and key results:\n{objectives}\n\n"
+        f"Meeting notes and completed work by month:\n{months_text or 'None recorded.'}"
+    )
+
+
+async def run_job(review_draft_id: int, session_factory):
+    """Background task generating one review draft."""
+    async with session_factory() as session:
+        async def report(**fields):
+            await session.run_sync(crud.update_review_draft, review_draft_id, **fields)
+
+        try:
+            await report(status="running", stage="assemble", progress=0.05)
+            context = await session.run_sync(_assemble, review_draft_id)
+
+            digests = []
+            months = context["months"]
+            for index, month in enumerate(months):
+                content = month["cached"]
+                if content is None:
+                    content, summarized = await _digest(month["month"], month["items"])
+                    await session.run_sync(
+                        crud.save_review_digest,
+                        context["team_member_id"],
+                        month["month"],
+                        source_hash=month["hash"],
+                        content=content,
+                        token_count=estimate_tokens(content),
+                        summarized=summarized,
+                    )
+                digests.append((month["month"], content))
+                await report(
+                    stage="digest", progress=0.1 + 0.7 * (index + 1) / len(months)
+                )
+
+            await report(stage="draft", progress=0.8)
+            prompt = build_prompt(
+                context["objectives"], digests, settings.REVIEW_DRAFT_CONTEXT_TOKENS
+            )
+            content = await ai_service.generate(prompt, system=DRAFT_SYSTEM_PROMPT)
+            await report(
+                status="done", stage=None, progress=1.0, content=content, error=None
+            )
+        except ai_service.AIServiceError as exc:
+            await session.rollback()
+            await report(status="failed", error=str(exc))
+        except Exception:
+            logger.exception("Review draft %s failed", review_draft_id)
+            await session.rollback()
+            await report(
+                status="failed", error="Unexpected error while generating the draft"
+            )
+
+
+async def resume_stale_jobs(session_factory):
+    """Startup task running the drafts whose job was lost with a worker."""
+    stale_before = datetime.utcnow() - timedelta(
+        seconds=settings.REVIEW_DRAFT_STALE_SECONDS
+    )
+    async with session_factory() as session:
+        review_draft_ids = await session.run_sync(
+            crud.claim_stale_review_drafts, stale_before
+        )
+    if review_draft_ids:
+        logger.info("Restarting %d stale review drafts", len(review_draft_ids))
+    for review_draft_id in review_draft_ids:
+        await run_job(review_draft_id, session_factory)
@@ -0,0 +1,182 @@
+"""
+Experimental sentiment trend of meeting notes (FR7.5).
+
+Only enabled when SENTIMENT_ANALYSIS_ENABLED is set. The scores describe
+the language the manager used in their notes, not how the team member
+actually feels, and are only exposed as coarse monthly indicators.
+
+Each meeting is scored once by a background task working in batches;
+editing or deleting notes removes the score so the meeting is picked up
+again. Scores are summed into monthly aggregates per member, and the trend
+endpoint reads only those aggregates.
+
+The default provider is a small lexicon scorer without dependencies;
+further providers can be registered in PROVIDERS.
+"""
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app import crud
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTICE = (
+    "Experimental. Reflects the language used in the manager's meeting notes, "
+    "not the team member's actual sentiment or performance."
+)
+
+# Average monthly score beyond which a month is labelled positive/negative
+INDICATOR_THRESHOLD = 0.15
+# Change between the recent and the earlier months that counts as a trend
+TREND_THRESHOLD = 0.1
+TREND_WINDOW_MONTHS = 3
+
+
+@dataclass
+class SentimentScore:
+    score: Optional[float]
+    positive: int
+    negative: int
+
+
+_WORD_RE = re.compile(r"[a-z']+")
+
+POSITIVE_WORDS = frozenset("""
+    accomplished achieved appreciated appreciate awesome best better brilliant
+    celebrated clear collaborative confident constructive creative delighted
+    delivered effective efficient engaged enjoyed enjoys excellent excited
+    exceeded exceeds fantastic glad good great happy helpful impressive
+    improved improving initiative insightful motivated nice outstanding
+    positive praised proactive productive progress proud reliable resolved
+    solid strong succeeded success successful supportive thanks thorough
+    thrilled well win wins
+""".split())
+
+NEGATIVE_WORDS = frozenset("""
+    angry annoyed anxious bad behind blocked blocker blockers broken burnout
+    concern concerned concerns confused conflict delay delayed difficult
+    disappointed disappointing escalated escalation exhausted fail failed
+    failing failure frustrated frustrating frustration issue issues late
+    missed missing negative overloaded overwhelmed poor problem problems
+    risk risky sad slipped stressed stressful struggle struggled struggling
+    stuck tension tired unclear unhappy upset worried worse worst
+""".split())
+
+NEGATIONS = frozenset(
+    "not no never without isn't wasn't aren't don't doesn't didn't can't cannot".split()
+)
+
+
+class LexiconScorer:
+    """Counts positive and negative words, flipping those right after a negation."""
+    name = "lexicon"
+
+    def score(self, text: Optional[str]) -> SentimentScore:
+        if not text or not text.strip():
+            return SentimentScore(None, 0, 0)
+        positive = negative = 0
+        negated_until = -1
+        for index, word in enumerate(_WORD_RE.findall(text.lower())):
+            if word in NEGATIONS:
+                negated_until = index + 2
+                continue
+            polarity = (word in POSITIVE_WORDS) - (word in NEGATIVE_WORDS)
+            if index <= negated_until:
+                polarity = -polarity
+            if polarity > 0:
+                positive += 1
+            elif polarity < 0:
+                negative += 1
+        total = positive + negative
+        score = (positive - negative) / total if total else 0.0
+        return SentimentScore(score, positive, negative)
+
+
+PROVIDERS = {
+    LexiconScorer.name: LexiconScorer,
+}
+
+
+def get_scorer():
+    return PROVIDERS[settings.SENTIMENT_PROVIDER]()
+
+
+def score_pending(db, batch_size: Optional[int] = None) -> int:
+    """Score one batch of unscored meetings, return how many were scored."""
+    scorer = get_scorer()
+    meeting_logs = crud.get_unscored_meeting_logs(
+        db, limit=batch_size or settings.SENTIMENT_BATCH_SIZE
+    )
+    sentiments = []
+    for meeting_log in meeting_logs:
+        result = scorer.score(meeting_log.notes)
+        sentiments.append({
+            "meeting_log_id": meeting_log.id,
+            "team_member_id": meeting_log.team_member_id,
+            "period_start": meeting_log.meeting_date.date().replace(day=1),
+            "score": result.score,
+            "positive": result.positive,
+            "negative": result.negative,
+            "provider": scorer.name,
+        })
+    crud.save_meeting_sentiments(db, sentiments)
+    return len(sentiments)
+
+
+async def run_scorer(session_factory):
+    """Background task scoring new and edited meeting notes in batches."""
+    while True:
+        try:
+            while True:
+                async with session_factory() as session:
+                    scored = await session.run_sync(score_pending)
+                if scored < settings.SENTIMENT_BATCH_SIZE:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Sentiment scoring failed, will retry")
+        await asyncio.sleep(settings.SENTIMENT_INTERVAL_SECONDS)
+
+
+def indicator(average: float) -> str:
+    if average > INDICATOR_THRESHOLD:
+        return "positive"
+    if average < -INDICATOR_THRESHOLD:
+        return "negative"
+    return "neutral"
+
+
+def _average(aggregates) -> float:
+    meetings = sum(aggregate.meeting_count for aggregate in aggregates)
+    return sum(aggregate.score_sum for aggregate in aggregates) / meetings
+
+
+def trend(aggregates: List) -> dict:
+    """Monthly indicators and the overall direction from monthly aggregates."""
+    points = [
+        {
+            "period_start": aggregate.period_start,
+            "meeting_count": aggregate.meeting_count,
+            "indicator": indicator(aggregate.score_sum / aggregate.meeting_count),
+        }
+        for aggregate in aggregates
+        if aggregate.meeting_count
+    ]
+    scored = [aggregate for aggregate in aggregates if aggregate.meeting_count]
+    if len(scored) < 2:
+        direction = "insufficient data"
+    else:
+        window = min(TREND_WINDOW_MONTHS, len(scored) // 2)
+        change = _average(scored[-window:]) - _average(scored[:-window][-window:])
+        if change > TREND_THRESHOLD:
+            direction = "more positive"
+        elif change < -TREND_THRESHOLD:
+            direction = "more negative"
+        else:
+            direction = "stable"
+    return {"points": points, "direction": direction, "notice": NOTICE}
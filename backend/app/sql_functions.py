@@ -0,0 +1,116 @@
+"""
+SQL functions that differ between SQLite and PostgreSQL.
+
+Each construct is compiled per dialect when the statement is executed, so
+queries in `crud` are written once and run on both backends.
+"""
+from datetime import date
+
+from sqlalchemy import Boolean, Float, String, func, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+BUCKETS = ("day", "week", "month")
+
+
+class julian_day(FunctionElement):
+    """Fractional days since the Julian epoch, for date arithmetic."""
+    type = Float()
+    name = "julian_day"
+    inherit_cache = True
+
+
+@compiles(julian_day)
+def _julian_day_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(julian_day, "postgresql")
+def _julian_day_postgresql(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"(EXTRACT(EPOCH FROM CAST({value} AS TIMESTAMP)) / 86400.0 + 2440587.5)"
+
+
+class date_bucket(FunctionElement):
+    """Start date ('YYYY-MM-DD') of the day, ISO week or month of a timestamp."""
+    type = String()
+    name = "date_bucket"
+    inherit_cache = True
+    # The bucket changes the rendered SQL, so it is part of the cache key
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("bucket", InternalTraversal.dp_string),
+    ]
+
+    def __init__(self, bucket: str, expr):
+        if bucket not in BUCKETS:
+            raise ValueError(f"bucket must be one of {BUCKETS}")
+        self.bucket = bucket
+        super().__init__(expr)
+
+
+@compiles(date_bucket)
+def _date_bucket_sqlite(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    if element.bucket == "day":
+        return f"date({value})"
+    if element.bucket == "week":
+        return f"date({value}, 'weekday 0', '-6 days')"
+    return f"strftime('%Y-%m-01', {value})"
+
+
+@compiles(date_bucket, "postgresql")
+def _date_bucket_postgresql(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"to_char(date_trunc('{element.bucket}', {value}), 'YYYY-MM-DD')"
+
+
+def months_back(today: date, months: int) -> date:
+    """
+    First day of the month `months - 1` months before `today`'s month, the
+    oldest month bucket of a window of `months` monthly buckets.
+    """
+    index = today.year * 12 + today.month - 1 - (months - 1)
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class text_search(FunctionElement):
+    """
+    Match a free text query against text columns.
+
+    PostgreSQL uses full-text search; SQLite falls back to a case-insensitive
+    substring match on each column, with `%` and `_` in the query matched
+    literally.
+    """
+    type = Boolean()
+    name = "text_search"
+    inherit_cache = True
+
+    def __init__(self, query: str, *columns):
+        # The query is the first argument so it is bound like any parameter
+        super().__init__(literal(query), *columns)
+
+
+@compiles(text_search)
+def _text_search_sqlite(element, compiler, **kw):
+    query, *columns = element.clauses.clauses
+    escaped = f"lower({compiler.process(query, **kw)})"
+    for char in ("\\", "%", "_"):
+        escaped = f"replace({escaped}, '{char}', '\\{char}')"
+    pattern = f"'%' || {escaped} || '%'"
+    matches = [
+        f"lower(coalesce({compiler.process(column, **kw)}, '')) "
+        f"LIKE {pattern} ESCAPE '\\'"
+        for column in columns
+    ]
+    return "(" + " OR ".join(matches) + ")"
+
+
+@compiles(text_search, "postgresql")
+def _text_search_postgresql(element, compiler, **kw):
+    query, *columns = element.clauses.clauses
+    document = func.concat_ws(" ", *columns)
+    clause = func.to_tsvector("simple", document).op("@@")(
+        func.plainto_tsquery("simple", query)
+    )
+    return compiler.process(clause, **kw)
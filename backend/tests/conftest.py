@@ -0,0 +1,105 @@
+"""
+Shared fixtures of the API tests.
+
+The application is configured through the environment before it is imported:
+every test session gets its own SQLite database and media/backup directories,
+created from the models like `python -m app.cli init-db` does.
+"""
+
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="aiphb-tests-")
+os.environ.update(
+    {
+        "SQLITE_DB_PATH": os.path.join(_tmp, "test.db"),
+        "MEDIA_DIR": os.path.join(_tmp, "media"),
+        "BACKUP_DIR": os.path.join(_tmp, "backups"),
+        "RATE_LIMIT_SQLITE_PATH": os.path.join(_tmp, "rate_limits.db"),
+        "DB_CHECK_MIGRATIONS": "false",
+        "DB_ECHO": "false",
+        "RATE_LIMIT_ENABLED": "false",
+        "AI_API_KEY": "",
+    }
+)
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app import crud, models, schemas  # noqa: E402
+from app.core import cache  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+
+sync_engine = create_engine(f"sqlite:///{settings.SQLITE_DB_PATH}")
+models.Base.metadata.create_all(sync_engine)
+SessionLocal = sessionmaker(sync_engine, expire_on_commit=False)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def clean_database():
+    yield
+    with sync_engine.begin() as conn:
+        for table in reversed(models.Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    for region in cache._regions.values():
+        region.clear()
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+def auth_headers(user: models.User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': user.email})}"}
+
+
+def make_user(db, email: str, role: str = "manager", password: str = "secret-password"):
+    return crud.create_user(
+        db, schemas.UserCreate(email=email, password=password, role=role)
+    )
+
+
+def make_member(
+    db,
+    email: str,
+    user: models.User = None,
+    superior: models.TeamMember = None,
+    **fields,
+):
+    return crud.create_team_member(
+        db,
+        schemas.TeamMemberCreate(
+            first_name=fields.pop("first_name", email.split("@")[0].title()),
+            last_name=fields.pop("last_name", "Tester"),
+            email=email,
+            user_id=user.id if user else None,
+            superior_id=superior.id if superior else None,
+            **fields,
+        ),
+    )
+
+
+@pytest.fixture
+def admin(db):
+    return make_user(db, "admin@example.com", role="admin")
+
+
+@pytest.fixture
+def manager(db):
+    """A manager with a team member profile and one direct report."""
+    user = make_user(db, "manager@example.com")
+    member = make_member(db, "manager@example.com", user=user)
+    report = make_member(db, "report@example.com", superior=member)
+    return user, member, report
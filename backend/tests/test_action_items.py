@@ -0,0 +1,93 @@
+from datetime import date, timedelta
+
+from app import models
+from conftest import auth_headers, make_member
+
+
+def test_action_item_lifecycle(client, db, manager):
+    user, member, report = manager
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    response = client.post(
+        "/action-items/",
+        json={
+            "description": "Write the plan",
+            "assigned_to_member_id": report.id,
+            "due_date": yesterday,
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    item = response.json()
+    assert item["assigned_by_manager_id"] == member.id
+
+    overdue = client.get("/action-items/overdue", headers=auth_headers(user)).json()
+    assert [entry["id"] for entry in overdue] == [item["id"]]
+
+    response = client.put(
+        f"/action-items/{item['id']}",
+        json={"status": "In Progress"},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "In Progress"
+
+    outsider_item = client.post(
+        "/action-items/",
+        json={
+            "description": "Not ours",
+            "assigned_to_member_id": make_member(db, "x@example.com").id,
+        },
+        headers=auth_headers(user),
+    )
+    assert outsider_item.status_code == 403
+
+    response = client.post(
+        "/action-items/batch-status",
+        json={
+            "ids": [item["id"], 9999],
+            "status": "Done",
+        },
+        headers=auth_headers(user),
+    )
+    assert response.json() == {
+        "updated": [item["id"]],
+        "not_found": [9999],
+        "forbidden": [],
+    }
+
+    assert (
+        client.delete(
+            f"/action-items/{item['id']}", headers=auth_headers(user)
+        ).status_code
+        == 204
+    )
+
+
+def test_action_item_cannot_move_to_an_inaccessible_meeting(client, db, manager):
+    user, member, report = manager
+    outsider = make_member(db, "x@example.com")
+    meeting_log = models.MeetingLog(
+        team_member_id=outsider.id, manager_id=outsider.id, meeting_date=date.today()
+    )
+    db.add(meeting_log)
+    db.commit()
+    item = client.post(
+        "/action-items/",
+        json={"description": "Write the plan", "assigned_to_member_id": report.id},
+        headers=auth_headers(user),
+    ).json()
+
+    response = client.put(
+        f"/action-items/{item['id']}",
+        json={"meeting_log_id": meeting_log.id},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 403
+
+    response = client.put(
+        f"/action-items/{item['id']}",
+        json={"meeting_log_id": 9999},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 404
@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+
+from app import crud, models
+from conftest import auth_headers, make_member
+
+
+def test_org_analytics_rolls_up_the_managers_team(client, db, admin, manager):
+    user, member, report = manager
+    db.add(
+        models.ActionItem(
+            description="Late",
+            assigned_to_member_id=report.id,
+            status="To Do",
+            due_date=date.today() - timedelta(days=3),
+        )
+    )
+    db.commit()
+
+    response = client.get("/analytics/org", headers=auth_headers(user))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["root_id"] == member.id
+    assert body["members"] == 2
+    (row,) = body["overdue_by_manager"]
+    assert row["manager_id"] == member.id
+    assert row["overdue_team"] == 1
+
+    assert (
+        client.get(
+            f"/analytics/org?root_id={report.id}", headers=auth_headers(user)
+        ).status_code
+        == 403
+    )
+    assert (
+        client.get(
+            f"/analytics/org?root_id={report.id}", headers=auth_headers(admin)
+        ).status_code
+        == 200
+    )
+
+    stats = client.get(
+        "/analytics/request-coalescing", headers=auth_headers(admin)
+    ).json()
+    assert {"team_hierarchy", "org_analytics"} <= {group["name"] for group in stats}
+
+
+def test_analytics_rows_are_limited_to_the_subtree(db, manager):
+    _, member, report = manager
+    outsider = make_member(db, "outsider@example.com")
+    db.add_all([
+        models.ActionItem(description="Ours", assigned_to_member_id=report.id),
+        models.ActionItem(description="Theirs", assigned_to_member_id=outsider.id),
+        models.Objective(team_member_id=report.id, title="Ours"),
+        models.Objective(team_member_id=outsider.id, title="Theirs"),
+    ])
+    db.commit()
+    today = date.today()
+    since = today - timedelta(days=30)
+
+    rows = crud.get_open_action_item_analytics_rows(db, today, root_id=member.id)
+    assert [row[0] for row in rows] == [report.id]
+    rows = crud.get_objective_analytics_rows(db, since, root_id=member.id)
+    assert [row[0] for row in rows] == [report.id]
+
+    rows = crud.get_open_action_item_analytics_rows(db, today)
+    assert sorted(row[0] for row in rows) == sorted([report.id, outsider.id])
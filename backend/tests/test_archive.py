@@ -0,0 +1,120 @@
+from datetime import date, datetime
+
+from app import crud, models
+
+
+def _meeting(db, report, manager_member, day):
+    meeting_log = models.MeetingLog(
+        team_member_id=report.id, manager_id=manager_member.id, meeting_date=day
+    )
+    db.add(meeting_log)
+    db.commit()
+    return meeting_log
+
+
+def _score(meeting_log):
+    return {
+        "meeting_log_id": meeting_log.id,
+        "team_member_id": meeting_log.team_member_id,
+        "period_start": date(2020, 1, 1),
+        "score": 0.5,
+        "positive": 1,
+        "negative": 0,
+        "provider": "lexicon",
+    }
+
+
+def _meeting_count(db, team_member_id):
+    return [
+        aggregate.meeting_count
+        for aggregate in crud.get_sentiment_aggregates(
+            db, team_member_id, date(2020, 1, 1)
+        )
+    ]
+
+
+def test_archived_meetings_keep_counting_in_sentiment(client, db, manager):
+    _, member, report = manager
+    archived = _meeting(db, report, member, datetime(2020, 1, 5))
+    live = _meeting(db, report, member, datetime(2020, 1, 20))
+    # An open action item keeps the second meeting in the live table
+    db.add(models.ActionItem(description="Follow up", meeting_log_id=live.id))
+    db.commit()
+    crud.save_meeting_sentiments(db, [_score(archived), _score(live)])
+    assert _meeting_count(db, report.id) == [2]
+
+    assert crud.archive_meeting_logs(db, held_before=datetime(2021, 1, 1)) == 1
+
+    # Changing the live meeting's notes recomputes the month
+    crud._drop_meeting_sentiment(db, live.id)
+    db.commit()
+    assert _meeting_count(db, report.id) == [1]
+
+
+def test_saving_an_already_scored_meeting_is_skipped(client, db, manager):
+    _, member, report = manager
+    meeting_log = _meeting(db, report, member, datetime(2020, 1, 5))
+    crud.save_meeting_sentiments(db, [_score(meeting_log)])
+    # A second worker that picked the same unscored batch
+    crud.save_meeting_sentiments(db, [{**_score(meeting_log), "score": -1.0}])
+    assert _meeting_count(db, report.id) == [1]
+    assert db.get(models.MeetingSentiment, meeting_log.id).score == 0.5
+
+
+def test_deleting_a_member_removes_their_archived_rows(client, db, manager):
+    _, member, report = manager
+    meeting_log = _meeting(db, report, member, datetime(2020, 1, 5))
+    crud.save_meeting_sentiments(db, [_score(meeting_log)])
+    assert crud.archive_meeting_logs(db, held_before=datetime(2021, 1, 1)) == 1
+    db.add_all(
+        [
+            models.ActionItemArchive(description="Done", meeting_log_id=meeting_log.id),
+            models.ActionItemArchive(
+                description="Assigned", assigned_to_member_id=report.id
+            ),
+        ]
+    )
+    db.commit()
+
+    assert crud.delete_team_member(db, report.id)
+
+    assert db.query(models.MeetingLogArchive).count() == 0
+    assert [
+        (item.description, item.assigned_to_member_id)
+        for item in db.query(models.ActionItemArchive)
+    ] == [("Assigned", None)]
+    assert db.query(models.MeetingSentiment).count() == 0
+    assert db.query(models.SentimentAggregate).count() == 0
+
+
+def test_done_items_merge_live_and_archive_by_due_date(client, db, manager):
+    _, _, report = manager
+    db.add_all(
+        [
+            models.ActionItem(
+                id=1,
+                description="Live",
+                assigned_to_member_id=report.id,
+                status="Done",
+                due_date=date(2020, 1, 2),
+            ),
+            models.ActionItem(
+                id=2,
+                description="Live, no due date",
+                assigned_to_member_id=report.id,
+                status="Done",
+            ),
+            models.ActionItemArchive(
+                id=3,
+                description="Archived",
+                assigned_to_member_id=report.id,
+                status="Done",
+                due_date=date(2020, 1, 1),
+            ),
+        ]
+    )
+    db.commit()
+    items = crud.get_action_items(db, [report.id], status="Done")
+    assert [item.id for item in items] == [2, 3, 1]
+    items = crud.get_action_items(db, [report.id], status="Done", skip=1, limit=1)
+    assert [item.id for item in items] == [3]
@@ -0,0 +1,29 @@
+from app.database import AsyncSessionLocal
+from app.services import audit
+from conftest import auth_headers
+
+
+def test_admin_reads_buffered_audit_entries(client, admin, manager):
+    user, _, report = manager
+    response = client.put(
+        f"/team-members/{report.id}",
+        json={"position": "Lead"},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    # Entries are written in batches, flush the buffer instead of waiting
+    client.portal.call(audit.flush, AsyncSessionLocal)
+
+    response = client.get(
+        f"/audit/?entity_type=team_member&entity_id={report.id}",
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 200
+    (entry,) = [item for item in response.json()["items"] if item["action"] == "update"]
+    assert entry["actor_user_id"] == user.id
+    assert "position" in entry["changes"]
+
+
+def test_managers_cannot_read_the_audit_trail(client, manager):
+    user, _, _ = manager
+    assert client.get("/audit/", headers=auth_headers(user)).status_code == 403
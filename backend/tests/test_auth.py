@@ -0,0 +1,56 @@
+from conftest import make_user
+
+
+def test_register_login_and_reset_password(client):
+    response = client.post(
+        "/auth/register",
+        json={
+            "email": "new@example.com",
+            "password": "first-password",
+            "role": "admin",
+        },
+    )
+    assert response.status_code == 200
+
+    duplicate = client.post(
+        "/auth/register", json={"email": "new@example.com", "password": "other"}
+    )
+    assert duplicate.status_code == 400
+
+    login = client.post(
+        "/auth/login",
+        data={"username": "new@example.com", "password": "first-password"},
+    )
+    assert login.status_code == 200
+    token = login.json()["access_token"]
+
+    me = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert me.status_code == 200
+    # Self-registration never grants the requested role
+    assert me.json()["role"] == "manager"
+
+    reset = client.post(
+        "/auth/reset-password",
+        json={"email": "new@example.com", "password": "second-password"},
+    )
+    assert reset.status_code == 200
+    assert (
+        client.post(
+            "/auth/login",
+            data={"username": "new@example.com", "password": "first-password"},
+        ).status_code
+        == 401
+    )
+    assert (
+        client.post(
+            "/auth/login",
+            data={"username": "new@example.com", "password": "second-password"},
+        ).status_code
+        == 200
+    )
+
+
+def test_invalid_token_is_rejected(client, db):
+    make_user(db, "someone@example.com")
+    response = client.get("/users/me", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
@@ -0,0 +1,28 @@
+import fcntl
+from pathlib import Path
+
+from app.core.config import settings
+from app.services import backup as backup_service
+
+
+def test_scheduled_backup_skips_while_another_worker_holds_the_lock():
+    directory = Path(settings.BACKUP_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    for path in backup_service.list_backups():
+        path.unlink()
+
+    # flock locks belong to the open file, so a second open behaves like
+    # another worker
+    with open(directory / backup_service.LOCK_NAME, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        assert backup_service._scheduled_backup(interval=3600) is None
+        fcntl.flock(lock, fcntl.LOCK_UN)
+    assert backup_service.list_backups() == []
+
+    result = backup_service._scheduled_backup(interval=3600)
+    assert result is not None
+    assert backup_service.list_backups() == [result.path]
+
+    # A recent backup exists, so the next turn is skipped
+    assert backup_service._scheduled_backup(interval=3600) is None
+    assert backup_service.list_backups() == [result.path]
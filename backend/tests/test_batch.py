@@ -0,0 +1,98 @@
+from app import models
+from app.database import AsyncSessionLocal
+from app.routers.team_members import hierarchy_cache
+from app.services import audit, events
+from conftest import auth_headers
+
+
+def _put_position(team_member_id, position):
+    return {
+        "method": "PUT",
+        "path": f"/team-members/{team_member_id}",
+        "body": {"position": position},
+    }
+
+
+def _position(db, team_member_id):
+    db.expire_all()
+    return db.get(models.TeamMember, team_member_id).position
+
+
+def _audited_positions(client, admin, team_member_id):
+    client.portal.call(audit.flush, AsyncSessionLocal)
+    items = client.get(
+        f"/audit/?entity_type=team_member&entity_id={team_member_id}",
+        headers=auth_headers(admin),
+    ).json()["items"]
+    return [item for item in items if item["action"] == "update"]
+
+
+def test_writes_commit_and_reads_see_them(client, db, admin, manager, monkeypatch):
+    user, member, report = manager
+    published = []
+    monkeypatch.setattr(
+        events.broker, "publish", lambda channels, event: published.append(event)
+    )
+    client.get("/team-members/hierarchy", headers=auth_headers(admin))
+    generation = hierarchy_cache.generation
+    audited = len(_audited_positions(client, admin, report.id))
+
+    response = client.post(
+        "/batch",
+        json={
+            "operations": [
+                {"method": "GET", "path": f"/team-members/{report.id}?fields=position"},
+                _put_position(report.id, "Lead"),
+                _put_position(report.id, "Senior Lead"),
+            ]
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is True
+    assert [result["status"] for result in body["responses"]] == [200, 200, 200]
+    # Reads run after the writes and see them
+    assert body["responses"][0]["body"]["position"] == "Senior Lead"
+    assert _position(db, report.id) == "Senior Lead"
+
+    # Deferred until the outer commit, then applied
+    assert hierarchy_cache.generation > generation
+    assert [(event["type"], event["id"]) for event in published] == [
+        ("team_member.updated", report.id)
+    ] * 2
+    assert len(_audited_positions(client, admin, report.id)) == audited + 2
+
+
+def test_failed_write_rolls_back_the_batch(client, db, admin, manager, monkeypatch):
+    user, member, report = manager
+    published = []
+    monkeypatch.setattr(
+        events.broker, "publish", lambda channels, event: published.append(event)
+    )
+    client.get("/team-members/hierarchy", headers=auth_headers(admin))
+    generation = hierarchy_cache.generation
+    audited = _audited_positions(client, admin, report.id)
+
+    response = client.post(
+        "/batch",
+        json={
+            "operations": [
+                _put_position(report.id, "Lead"),
+                _put_position(9999, "Ghost"),
+                _put_position(member.id, "Director"),
+            ]
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is False
+    # The write after the failure is not executed
+    assert [result["status"] for result in body["responses"]] == [200, 404, 424]
+    assert _position(db, report.id) is None
+
+    # Nothing of the rolled back writes leaks out
+    assert hierarchy_cache.generation == generation
+    assert published == []
+    assert _audited_positions(client, admin, report.id) == audited
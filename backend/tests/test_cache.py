@@ -0,0 +1,34 @@
+import asyncio
+
+from app.core.cache import CacheRegion
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    region = CacheRegion("test_generation", tables={"team_members"})
+
+    def stale_loader():
+        # The region is invalidated while the loader still holds old data
+        region.clear()
+        return "stale"
+
+    assert region.get_or_set("key", stale_loader) == "stale"
+    assert region.get("key") is None
+    assert region.get_or_set("key", lambda: "fresh") == "fresh"
+    assert region.get("key") == "fresh"
+
+
+def test_async_load_racing_an_invalidation_is_not_stored():
+    region = CacheRegion("test_generation_async", tables={"team_members"})
+
+    async def stale_loader():
+        await asyncio.sleep(0)
+        region.clear()
+        return "stale"
+
+    async def fresh_loader():
+        return "fresh"
+
+    assert asyncio.run(region.get_or_set_async("key", stale_loader)) == "stale"
+    assert region.get("key") is None
+    assert asyncio.run(region.get_or_set_async("key", fresh_loader)) == "fresh"
+    assert region.get("key") == "fresh"
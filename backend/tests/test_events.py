@@ -0,0 +1,31 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.security import create_access_token
+from conftest import auth_headers
+
+
+def test_websocket_streams_changes_of_the_team(client, manager):
+    user, _, report = manager
+    token = create_access_token(data={"sub": user.email})
+
+    with client.websocket_connect(f"/events/ws?token={token}") as websocket:
+        for position in ("Engineer", "Lead"):
+            response = client.put(
+                f"/team-members/{report.id}",
+                json={"position": position},
+                headers=auth_headers(user),
+            )
+            assert response.status_code == 200
+        # A message from the client in between must not cost an event
+        websocket.send_text("ping")
+
+        events = [websocket.receive_json(), websocket.receive_json()]
+        assert [event["type"] for event in events] == ["team_member.updated"] * 2
+        assert [event["data"]["position"] for event in events] == ["Engineer", "Lead"]
+
+
+def test_websocket_requires_a_valid_token(client):
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/events/ws?token=invalid") as websocket:
+            websocket.receive_json()
@@ -0,0 +1,35 @@
+import pytest
+
+from app.services.key_result_values import (
+    parse_currency,
+    parse_numeric,
+    parse_percentage,
+)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("42", 42.0),
+        ("1,200 000", 1_200_000.0),
+        ("5k", 5_000.0),
+        ("5k users", 5_000.0),
+        ("2.5 m", 2_500_000.0),
+        ("1b", 1e9),
+        # Units starting with k, m or b are not multipliers
+        ("5 meetings", 5.0),
+        ("20 blog posts", 20.0),
+        ("10 km", 10.0),
+        ("3 mentees", 3.0),
+        ("none", None),
+    ],
+)
+def test_parse_numeric(raw, expected):
+    assert parse_numeric(raw) == expected
+
+
+def test_parse_currency_and_percentage():
+    assert parse_currency("$12,500") == 12_500.0
+    assert parse_currency("EUR 1.5m") == 1_500_000.0
+    assert parse_percentage("45%") == 45.0
+    assert parse_percentage("0.45") == 45.0
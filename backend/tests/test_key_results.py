@@ -0,0 +1,58 @@
+from datetime import date
+
+from app import models
+from conftest import auth_headers, make_member
+
+
+def make_objective(db, member, title="Grow revenue"):
+    objective = models.Objective(team_member_id=member.id, title=title)
+    db.add(objective)
+    db.commit()
+    return objective
+
+
+def test_create_update_and_search_key_results(client, db, manager):
+    user, _, report = manager
+    objective = make_objective(db, report)
+
+    response = client.post(
+        "/key-results/",
+        json={
+            "objective_id": objective.id,
+            "title": "Close deals",
+            "measurement_type": "Numeric",
+            "target_value": "10",
+            "current_value": "2",
+            "deadline": date.today().replace(year=date.today().year + 1).isoformat(),
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    key_result = response.json()
+    assert key_result["target_numeric"] == 10
+
+    response = client.put(
+        f"/key-results/{key_result['id']}",
+        json={"current_value": "5"},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    assert response.json()["current_numeric"] == 5
+
+    response = client.get("/key-results/search?q=deals", headers=auth_headers(user))
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [key_result["id"]]
+
+    response = client.get(
+        f"/key-results/?objective_id={objective.id}", headers=auth_headers(user)
+    )
+    assert [item["id"] for item in response.json()] == [key_result["id"]]
+
+
+def test_key_results_of_other_teams_are_forbidden(client, db, manager):
+    user, _, _ = manager
+    objective = make_objective(db, make_member(db, "outsider@example.com"))
+    response = client.get(
+        f"/key-results/?objective_id={objective.id}", headers=auth_headers(user)
+    )
+    assert response.status_code == 403
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from conftest import auth_headers
+
+
+def test_meeting_logs_are_paged_with_their_action_items(client, manager):
+    user, member, report = manager
+    started = datetime(2026, 1, 5, 10, 0)
+    ids = []
+    for week in range(3):
+        response = client.post(
+            "/meeting-logs/",
+            json={
+                "team_member_id": report.id,
+                "meeting_date": (started + timedelta(weeks=week)).isoformat(),
+                "notes": f"Week {week}",
+            },
+            headers=auth_headers(user),
+        )
+        assert response.status_code == 200
+        assert response.json()["manager_id"] == member.id
+        ids.append(response.json()["id"])
+
+    response = client.post(
+        "/action-items/",
+        json={
+            "description": "Prepare the demo",
+            "meeting_log_id": ids[-1],
+            "assigned_to_member_id": report.id,
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+
+    page = client.get(
+        f"/meeting-logs/?team_member_id={report.id}&limit=2", headers=auth_headers(user)
+    ).json()
+    assert [item["id"] for item in page["items"]] == [ids[2], ids[1]]
+    assert [item["description"] for item in page["items"][0]["action_items"]] == [
+        "Prepare the demo"
+    ]
+    rest = client.get(
+        "/meeting-logs/",
+        params={"team_member_id": report.id, "limit": 2, "cursor": page["next_cursor"]},
+        headers=auth_headers(user),
+    ).json()
+    assert [item["id"] for item in rest["items"]] == [ids[0]]
+    assert rest["next_cursor"] is None
+
+    response = client.put(
+        f"/meeting-logs/{ids[0]}",
+        json={"notes": "Rewritten"},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    assert response.json()["notes"] == "Rewritten"
+
+    assert (
+        client.delete(f"/meeting-logs/{ids[0]}", headers=auth_headers(user)).status_code
+        == 204
+    )
+    assert (
+        client.get(f"/meeting-logs/{ids[0]}", headers=auth_headers(user)).status_code
+        == 404
+    )
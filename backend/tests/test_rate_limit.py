@@ -0,0 +1,61 @@
+import pytest
+
+from app.core import rate_limit
+from app.core.config import settings
+from conftest import make_user
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(rate_limit, "_store", rate_limit.MemoryStore(100))
+    return monkeypatch
+
+
+def test_write_limit_responses_carry_cors_headers(client, limits):
+    limits.setattr(settings, "RATE_LIMIT_WRITES", "1/minute")
+    origin = {"Origin": "http://localhost:3000"}
+
+    client.post("/auth/logout", headers=origin)
+    response = client.post("/auth/logout", headers=origin)
+    assert response.status_code == 429
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+def test_register_and_password_reset_use_separate_buckets(client, db, limits):
+    make_user(db, "taken@example.com")
+    for _ in range(5):
+        client.post(
+            "/auth/register", json={"email": "taken@example.com", "password": "x"}
+        )
+    assert (
+        client.post(
+            "/auth/register", json={"email": "taken@example.com", "password": "x"}
+        ).status_code
+        == 429
+    )
+
+    response = client.post(
+        "/auth/reset-password", json={"email": "taken@example.com", "password": "new"}
+    )
+    assert response.status_code == 200
+
+
+def test_memory_store_drops_refilled_buckets(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    store = rate_limit.MemoryStore(max_keys=100)
+
+    store.hit("a", capacity=2, period=60)
+    store.hit("b", capacity=2, period=60)
+    assert list(store._buckets) == ["a", "b"]
+
+    # "a" and "b" used one of two tokens and are full again after 30 seconds
+    now[0] += 31
+    store.hit("c", capacity=2, period=60)
+    assert list(store._buckets) == ["c"]
+
+    allowed, _ = store.hit("c", capacity=2, period=60)
+    assert allowed
+    allowed, retry_after = store.hit("c", capacity=2, period=60)
+    assert not allowed and retry_after == pytest.approx(30)
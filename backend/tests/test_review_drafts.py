@@ -0,0 +1,83 @@
+from datetime import date, datetime, timedelta
+
+from app import crud, models
+from conftest import auth_headers
+
+
+def test_review_draft_is_queued_and_readable(client, manager):
+    user, _, report = manager
+    response = client.post(
+        "/review-drafts/",
+        json={
+            "team_member_id": report.id,
+            "period_start": "2026-01-01",
+            "period_end": "2026-06-30",
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 202
+    draft = response.json()
+    assert draft["requested_by_user_id"] == user.id
+
+    # The job has run in the background by now; without an AI API it fails
+    response = client.get(f"/review-drafts/{draft['id']}", headers=auth_headers(user))
+    assert response.status_code == 200
+    assert response.json()["status"] in {"queued", "running", "done", "failed"}
+
+    listed = client.get(
+        f"/review-drafts/?team_member_id={report.id}", headers=auth_headers(user)
+    ).json()
+    assert [item["id"] for item in listed] == [draft["id"]]
+
+    response = client.delete(
+        f"/review-drafts/{draft['id']}", headers=auth_headers(user)
+    )
+    assert response.status_code == 204
+    response = client.get(f"/review-drafts/{draft['id']}", headers=auth_headers(user))
+    assert response.status_code == 404
+
+
+def test_review_period_is_validated(client, manager):
+    user, _, report = manager
+    response = client.post(
+        "/review-drafts/",
+        json={
+            "team_member_id": report.id,
+            "period_start": "2026-06-30",
+            "period_end": "2026-01-01",
+        },
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 400
+
+
+def test_stale_drafts_are_claimed_once(db, manager):
+    _, _, report = manager
+    now = datetime.utcnow()
+
+    def draft(status, updated_at):
+        review_draft = models.ReviewDraft(
+            team_member_id=report.id,
+            period_start=date(2026, 1, 1),
+            period_end=date(2026, 6, 30),
+            status=status,
+            stage="digest",
+            progress=0.5,
+            updated_at=updated_at,
+        )
+        db.add(review_draft)
+        db.commit()
+        return review_draft.id
+
+    lost = draft("running", now - timedelta(hours=1))
+    draft("running", now)
+    draft("done", now - timedelta(hours=1))
+
+    stale_before = now - timedelta(minutes=10)
+    assert crud.claim_stale_review_drafts(db, stale_before) == [lost]
+    # Another worker starting at the same time finds nothing left to claim
+    assert crud.claim_stale_review_drafts(db, stale_before) == []
+
+    claimed = crud.get_review_draft(db, lost)
+    db.refresh(claimed)
+    assert (claimed.status, claimed.stage, claimed.progress) == ("queued", None, 0.0)
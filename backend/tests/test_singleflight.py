@@ -0,0 +1,48 @@
+import asyncio
+
+from app.core.singleflight import SingleFlight
+
+
+def test_waiter_takes_over_when_the_leader_is_cancelled():
+    flight = SingleFlight("test_leader_cancelled")
+    runs = []
+
+    async def compute():
+        runs.append(len(runs))
+        await asyncio.sleep(0.05)
+        return f"run {len(runs)}"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do("key", compute)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        results = await asyncio.gather(leader, *waiters, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+        # One waiter ran the computation again, the other shared its result
+        assert results[1:] == ["run 2", "run 2"]
+        assert len(runs) == 2
+        assert flight.stats()["in_flight"] == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_cancel_the_leader():
+    flight = SingleFlight("test_waiter_cancelled")
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await leader == "value"
+        assert waiter.cancelled()
+
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+"""
+The dialect specific constructs of app.sql_functions and the recursive
+team subtree query, run against SQLite and, when TEST_POSTGRES_URL points
+to a scratch PostgreSQL database (postgresql+asyncpg://...), PostgreSQL.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import DateTime, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import crud, models
+from app.sql_functions import date_bucket, julian_day, text_search
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+async def _run_on_postgres(fn):
+    engine = create_async_engine(POSTGRES_URL)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.drop_all)
+            await conn.run_sync(models.Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            return await session.run_sync(fn)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.drop_all)
+        await engine.dispose()
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def run(request):
+    """Call fn(session) with a synchronous session on the backend."""
+    if request.param == "sqlite":
+        db = request.getfixturevalue("db")
+        return lambda fn: fn(db)
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    return lambda fn: asyncio.run(_run_on_postgres(fn))
+
+
+def _timestamp(value: datetime):
+    return literal(value, DateTime())
+
+
+def test_julian_day(run):
+    def check(db):
+        return db.execute(
+            select(
+                julian_day(_timestamp(datetime(2000, 1, 1, 12))),
+                julian_day(_timestamp(datetime(2024, 3, 2, 6)))
+                - julian_day(_timestamp(datetime(2024, 2, 28, 18))),
+            )
+        ).one()
+
+    epoch, days = run(check)
+    assert epoch == pytest.approx(2451545.0)
+    # Across a leap day
+    assert days == pytest.approx(2.5)
+
+
+@pytest.mark.parametrize(
+    "bucket,expected",
+    [
+        ("day", "2024-01-10"),
+        ("week", "2024-01-08"),
+        ("month", "2024-01-01"),
+    ],
+)
+def test_date_bucket(run, bucket, expected):
+    def check(db):
+        # A Wednesday afternoon; weeks start on Monday
+        return db.execute(
+            select(date_bucket(bucket, _timestamp(datetime(2024, 1, 10, 15, 30))))
+        ).scalar_one()
+
+    assert run(check) == expected
+
+
+def test_date_bucket_rejects_unknown_buckets():
+    with pytest.raises(ValueError):
+        date_bucket("year", _timestamp(datetime(2024, 1, 1)))
+
+
+def test_text_search(run):
+    def check(db):
+        member = models.TeamMember(
+            first_name="Ada", last_name="L", email="ada@example.com"
+        )
+        db.add(member)
+        db.flush()
+        db.add_all(
+            [
+                models.Objective(team_member_id=member.id, title="Grow Revenue"),
+                models.Objective(
+                    team_member_id=member.id,
+                    title="Hiring",
+                    description="Grow the team",
+                ),
+                models.Objective(team_member_id=member.id, title="Reduce churn"),
+                models.Objective(team_member_id=member.id, title="Cut costs by 50%"),
+            ]
+        )
+        db.flush()
+
+        def titles(query):
+            return sorted(
+                db.scalars(
+                    select(models.Objective.title).where(
+                        text_search(
+                            query, models.Objective.title, models.Objective.description
+                        )
+                    )
+                )
+            )
+
+        return (
+            titles("revenue"),
+            titles("GROW"),
+            titles("pricing"),
+            titles("50%"),
+            [titles(query) for query in ("_", "re_enue", "gr%th")],
+        )
+
+    revenue, grow, pricing, percent, wildcards = run(check)
+    assert revenue == ["Grow Revenue"]
+    # Matches the title of one and the description of the other
+    assert grow == ["Grow Revenue", "Hiring"]
+    assert pricing == []
+    # LIKE wildcards in the query are matched literally
+    assert percent == ["Cut costs by 50%"]
+    assert wildcards == [[], [], []]
+
+
+def test_get_team_subtree(run):
+    def check(db):
+        def add(name, superior=None, is_active=True):
+            member = models.TeamMember(
+                first_name=name,
+                last_name="T",
+                email=f"{name}@example.com",
+                superior_id=superior.id if superior else None,
+                is_active=is_active,
+            )
+            db.add(member)
+            db.flush()
+            return member
+
+        ceo = add("ceo")
+        cto = add("cto", ceo)
+        engineer = add("engineer", cto)
+        former = add("former", ceo, is_active=False)
+        other = add("other")
+        ids = {
+            member.id: member.first_name
+            for member in (ceo, cto, engineer, former, other)
+        }
+
+        def tree(**kwargs):
+            return [
+                (ids[row.id], ids.get(row.superior_id), row.depth)
+                for row in crud.get_team_subtree(db, **kwargs)
+            ]
+
+        return tree(), tree(root_id=cto.id), tree(include_inactive=True)
+
+    organization, below_cto, with_inactive = run(check)
+    assert organization == [
+        ("ceo", None, 0),
+        ("other", None, 0),
+        ("cto", "ceo", 1),
+        ("engineer", "cto", 2),
+    ]
+    assert below_cto == [("cto", "ceo", 0), ("engineer", "cto", 1)]
+    assert ("former", "ceo", 1) in with_inactive
+    assert len(with_inactive) == 5
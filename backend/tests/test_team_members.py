@@ -0,0 +1,131 @@
+from conftest import auth_headers, make_member, make_user
+
+
+def test_manager_reads_and_updates_direct_report(client, manager):
+    user, member, report = manager
+
+    response = client.get("/team-members/", headers=auth_headers(user))
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [report.id]
+
+    response = client.get(
+        f"/team-members/{report.id}?fields=first_name&include=objectives",
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": report.id,
+        "first_name": "Report",
+        "objectives": [],
+    }
+
+    response = client.put(
+        f"/team-members/{report.id}",
+        json={"position": "Engineer"},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 200
+    assert response.json()["position"] == "Engineer"
+
+
+def test_hierarchy_is_nested_and_refreshed_after_writes(client, db, admin, manager):
+    _, member, report = manager
+
+    response = client.get("/team-members/hierarchy", headers=auth_headers(admin))
+    assert response.status_code == 200
+    (top,) = response.json()
+    assert top["id"] == member.id
+    assert [child["id"] for child in top["direct_reports"]] == [report.id]
+
+    response = client.post(
+        "/team-members/",
+        json={
+            "first_name": "New",
+            "last_name": "Hire",
+            "email": "new@example.com",
+            "superior_id": report.id,
+        },
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 200
+
+    (top,) = client.get("/team-members/hierarchy", headers=auth_headers(admin)).json()
+    (child,) = top["direct_reports"]
+    assert [grandchild["email"] for grandchild in child["direct_reports"]] == [
+        "new@example.com"
+    ]
+
+
+def test_only_admins_delete_team_members(client, db, admin, manager):
+    user, _, report = manager
+    assert (
+        client.delete(
+            f"/team-members/{report.id}", headers=auth_headers(user)
+        ).status_code
+        == 403
+    )
+    assert (
+        client.delete(
+            f"/team-members/{report.id}", headers=auth_headers(admin)
+        ).status_code
+        == 204
+    )
+    assert (
+        client.delete(
+            f"/team-members/{report.id}", headers=auth_headers(admin)
+        ).status_code
+        == 404
+    )
+
+
+def test_managers_cannot_read_other_teams(client, db, manager):
+    user, _, _ = manager
+    outsider = make_member(db, "outsider@example.com")
+    assert (
+        client.get(
+            f"/team-members/{outsider.id}", headers=auth_headers(user)
+        ).status_code
+        == 403
+    )
+
+
+def test_hierarchy_leaves_out_manager_notes(client, db, admin, manager):
+    _, member, report = manager
+    response = client.put(
+        f"/team-members/{report.id}",
+        json={"manager_notes": "Private"},
+        headers=auth_headers(admin),
+    )
+    assert response.json()["manager_notes"] == "Private"
+
+    (top,) = client.get("/team-members/hierarchy", headers=auth_headers(admin)).json()
+    assert top["direct_reports"][0]["manager_notes"] is None
+
+
+def test_profile_picture_follows_the_team_member_update_rule(client, manager):
+    user, member, report = manager
+
+    # Like PUT /team-members/{id}: the direct superior, not the member
+    response = client.delete(
+        f"/team-members/{member.id}/profile-picture", headers=auth_headers(user)
+    )
+    assert response.status_code == 403
+
+    response = client.delete(
+        f"/team-members/{report.id}/profile-picture", headers=auth_headers(user)
+    )
+    assert response.status_code == 200
+    assert response.json()["profile_picture_url"] is None
+
+
+def test_read_own_team_member_profile(client, db, manager):
+    user, member, _ = manager
+
+    response = client.get("/team-members/me", headers=auth_headers(user))
+    assert response.status_code == 200
+    assert response.json()["id"] == member.id
+    assert "manager_notes" in response.json()
+
+    other = make_user(db, "nobody@example.com")
+    response = client.get("/team-members/me", headers=auth_headers(other))
+    assert response.status_code == 404
@@ -0,0 +1,68 @@
+from conftest import auth_headers, make_user
+
+
+def test_admin_lists_and_bulk_updates_users(client, db, admin):
+    other = make_user(db, "other@example.com")
+
+    response = client.get("/users/", headers=auth_headers(admin))
+    assert response.status_code == 200
+    assert {user["email"] for user in response.json()} == {admin.email, other.email}
+
+    response = client.post(
+        "/users/bulk-update",
+        json={"ids": [other.id, admin.id, 9999], "patch": {"is_active": False}},
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "updated": [other.id],
+        "unchanged": [],
+        "not_found": [9999],
+        "forbidden": [admin.id],
+    }
+    assert (
+        client.get(f"/users/{other.id}", headers=auth_headers(admin)).json()[
+            "is_active"
+        ]
+        is False
+    )
+
+
+def test_managers_cannot_list_users(client, db):
+    user = make_user(db, "manager@example.com")
+    assert client.get("/users/", headers=auth_headers(user)).status_code == 403
+
+
+def test_update_current_user(client, db):
+    user = make_user(db, "me@example.com")
+    response = client.put(
+        "/users/me", json={"email": "renamed@example.com"}, headers=auth_headers(user)
+    )
+    assert response.status_code == 200
+    assert response.json()["email"] == "renamed@example.com"
+
+
+def test_roles_are_validated_against_one_list(client, db, admin):
+    other = make_user(db, "other@example.com")
+
+    response = client.post(
+        "/users/bulk-update",
+        json={"ids": [other.id], "patch": {"role": "member"}},
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == [other.id]
+
+    response = client.put(
+        f"/users/{other.id}", json={"role": "manager"}, headers=auth_headers(admin)
+    )
+    assert response.status_code == 200
+    assert response.json()["role"] == "manager"
+
+    for method, url, body in [
+        ("put", f"/users/{other.id}", {"role": "owner"}),
+        ("post", "/users/bulk-update", {"ids": [other.id], "patch": {"role": "owner"}}),
+    ]:
+        response = client.request(method, url, json=body, headers=auth_headers(admin))
+        assert response.status_code == 400
+        assert "member" in response.json()["detail"]
@@ -0,0 +1,61 @@
+import { ref } from 'vue'
+import { useAuth } from './useAuth'
+
+interface ChangeEvent {
+  type: string
+  id: number
+  data?: Record<string, unknown>
+}
+
+type Handler = (event: ChangeEvent) => void
+
+const API_URL = 'http://localhost:8000/events'
+
+const connected = ref(false)
+const handlers = new Map<string, Set<Handler>>()
+let source: EventSource | null = null
+
+function dispatch(event: ChangeEvent) {
+  for (const key of [event.type, '*']) {
+    handlers.get(key)?.forEach((handler) => handler(event))
+  }
+}
+
+function connect() {
+  const { token } = useAuth()
+  if (source || !token.value || typeof window === 'undefined') return
+
+  // EventSource cannot send headers, so the token goes in the query string
+  source = new EventSource(`${API_URL}/stream?token=${encodeURIComponent(token.value)}`)
+  source.onopen = () => {
+    connected.value = true
+  }
+  source.onerror = () => {
+    connected.value = false
+  }
+  source.onmessage = (message) => dispatch(JSON.parse(message.data))
+}
+
+function disconnect() {
+  source?.close()
+  source = null
+  connected.value = false
+}
+
+// Subscribe to an event type such as 'action_item.created', or '*' for all
+function on(type: string, handler: Handler) {
+  if (!handlers.has(type)) {
+    handlers.set(type, new Set())
+  }
+  handlers.get(type)!.add(handler)
+  return () => handlers.get(type)?.delete(handler)
+}
+
+export function useEvents() {
+  return {
+    connected,
+    connect,
+    disconnect,
+    on
+  }
+}